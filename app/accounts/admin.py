@@ -1,5 +1,7 @@
 from django.contrib import admin
-from .models import Account, TransactionHistory
+from .models import (
+    Account, Budget, BudgetUsage, CategoryRule, DailyAccountSummary, TransactionCategory, TransactionHistory
+)
 
 
 @admin.register(Account)
@@ -12,8 +14,55 @@ class AccountAdmin(admin.ModelAdmin):
 
 @admin.register(TransactionHistory)
 class TransactionHistoryAdmin(admin.ModelAdmin):
-    list_display = ['account', 'transaction_type', 'amount', 'balance_after', 'transaction_date']
-    list_filter = ['transaction_type', 'detail_type', 'transaction_date']
+    list_display = ['account', 'transaction_type', 'amount', 'balance_after', 'category', 'transaction_date']
+    list_filter = ['transaction_type', 'detail_type', 'category', 'transaction_date']
     search_fields = ['account__user__nickname', 'transaction_detail']
     readonly_fields = ['created_at', 'updated_at']
-    date_hierarchy = 'transaction_date'
\ No newline at end of file
+    date_hierarchy = 'transaction_date'
+
+    def get_readonly_fields(self, request, obj=None):
+        # 기록된 거래는 잔액·집계에 반영되어 있으므로 원장 필드를 고치지 못하게 한다 (정정은 반대 거래로)
+        if obj is not None:
+            return [*self.readonly_fields, 'account', 'amount', 'transaction_type', 'transaction_date', 'balance_after']
+        return self.readonly_fields
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(DailyAccountSummary)
+class DailyAccountSummaryAdmin(admin.ModelAdmin):
+    list_display = ['account', 'date', 'deposit_total', 'withdrawal_total', 'transaction_count', 'closing_balance']
+    list_filter = ['date']
+    search_fields = ['account__account_number', 'account__user__nickname']
+    readonly_fields = ['updated_at']
+    date_hierarchy = 'date'
+
+
+class CategoryRuleInline(admin.TabularInline):
+    model = CategoryRule
+    extra = 1
+
+
+@admin.register(TransactionCategory)
+class TransactionCategoryAdmin(admin.ModelAdmin):
+    list_display = ['name', 'transaction_type', 'created_at']
+    list_filter = ['transaction_type']
+    search_fields = ['name', 'rules__keyword']
+    readonly_fields = ['created_at', 'updated_at']
+    inlines = [CategoryRuleInline]
+
+
+@admin.register(Budget)
+class BudgetAdmin(admin.ModelAdmin):
+    list_display = ['user', 'period', 'category', 'amount', 'is_active', 'created_at']
+    list_filter = ['period', 'is_active', 'category']
+    search_fields = ['user__nickname', 'user__email']
+    readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(BudgetUsage)
+class BudgetUsageAdmin(admin.ModelAdmin):
+    list_display = ['budget', 'period_start', 'spent', 'notified_percent', 'updated_at']
+    list_filter = ['period_start']
+    readonly_fields = ['updated_at']
@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
-    verbose_name = '계좌 관리'
\ No newline at end of file
+    verbose_name = '계좌 관리'
+
+    def ready(self):
+        # 분류 규칙이 바뀌면 분류기를 다시 만드는 시그널 수신기 등록
+        import accounts.categorization
@@ -0,0 +1,138 @@
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from .models import Budget, BudgetUsage, TransactionHistory
+from .rollups import local_day
+from .signals import budget_thresholds_crossed
+
+# 알림을 보낼 예산 사용률(%) - 낮은 것부터
+BUDGET_THRESHOLDS = [80, 100]
+
+
+def period_start(day, period):
+    """일자가 속한 예산 기간의 시작일 (주는 월요일 시작)"""
+    if period == 'weekly':
+        return day - timedelta(days=day.weekday())
+    if period == 'monthly':
+        return day.replace(day=1)
+    return day
+
+
+def period_end(start, period):
+    """예산 기간의 다음 기간 시작일"""
+    if period == 'weekly':
+        return start + timedelta(days=7)
+    if period == 'monthly':
+        return (start + timedelta(days=32)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def reached_threshold(spent, amount):
+    """사용률이 넘어선 가장 높은 임계치(%) - 없으면 0"""
+    if amount <= 0:
+        return BUDGET_THRESHOLDS[-1]
+    percent = spent * 100 / amount
+    return max((threshold for threshold in BUDGET_THRESHOLDS if percent >= threshold), default=0)
+
+
+def first_period(budget):
+    """예산이 집계하는 첫 기간 (생성일이 속한 기간) - 그 이전 날짜의 거래는 반영하지 않는다"""
+    return period_start(local_day(budget.created_at), budget.period)
+
+
+def budget_spent(budget, start):
+    """기간 내 예산 대상 지출을 원본 거래내역에서 다시 합산 (예산 생성 시·검증용)"""
+    tz = timezone.get_current_timezone()
+    queryset = TransactionHistory.objects.filter(
+        account__user_id=budget.user_id,
+        transaction_type='withdrawal',
+        transaction_date__gte=datetime.combine(start, time.min, tzinfo=tz),
+        transaction_date__lt=datetime.combine(period_end(start, budget.period), time.min, tzinfo=tz),
+    )
+    if budget.category_id is not None:
+        queryset = queryset.filter(category_id=budget.category_id)
+    return queryset.aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
+
+
+def start_budget(budget):
+    """예산의 현재 기간 사용량을 원본 거래내역에서 한 번 합산해 카운터를 만든다 (생성, 대상 변경·재활성화 시)
+
+    이미 넘은 임계치는 알림 없이 기록만 해 두고, 이후 출금부터 증분으로 평가한다.
+    """
+    start = max(first_period(budget), period_start(timezone.localdate(), budget.period))
+    spent = budget_spent(budget, start)
+    usage, _ = BudgetUsage.objects.update_or_create(
+        budget=budget, period_start=start,
+        defaults={'spent': spent, 'notified_percent': reached_threshold(spent, budget.amount)},
+    )
+    return usage
+
+
+def evaluate_budgets(transactions):
+    """새 출금을 예산 사용량 카운터에 증분 반영하고 새로 넘은 임계치를 알린다
+
+    기간 전체를 다시 합산하지 않는다. 건수와 관계없이 (예산 조회, 빈 카운터 INSERT,
+    카운터 잠금 조회, 일괄 UPDATE) 네 번의 쿼리로 처리하며, 카운터 행을 잠근 뒤 더하므로
+    동시에 기록되어도 누락이나 중복 알림이 없다.
+    반환값: [(BudgetUsage, 임계치)]
+    """
+    withdrawals = [item for item in transactions if item.transaction_type == 'withdrawal']
+    if not withdrawals:
+        return []
+
+    budgets_by_user = defaultdict(list)
+    budgets = Budget.objects.filter(
+        user_id__in={item.account.user_id for item in withdrawals}, is_active=True
+    ).select_related('category')
+    for budget in budgets:
+        budgets_by_user[budget.user_id].append(budget)
+    if not budgets_by_user:
+        return []
+
+    budgets = {}
+    deltas = defaultdict(Decimal)
+    for item in withdrawals:
+        day = local_day(item.transaction_date)
+        for budget in budgets_by_user.get(item.account.user_id, ()):
+            if budget.category_id is not None and budget.category_id != item.category_id:
+                continue
+            start = period_start(day, budget.period)
+            if start < first_period(budget):
+                continue
+            budgets[budget.pk] = budget
+            deltas[(budget.pk, start)] += item.amount
+    if not deltas:
+        return []
+
+    crossings = []
+    starts = [start for _, start in deltas]
+    with transaction.atomic():
+        BudgetUsage.objects.bulk_create(
+            [BudgetUsage(budget_id=budget_id, period_start=start) for budget_id, start in deltas],
+            ignore_conflicts=True,
+        )
+        usages = [
+            usage for usage in BudgetUsage.objects.select_for_update().filter(
+                budget_id__in=budgets, period_start__range=(min(starts), max(starts))
+            ).order_by('pk')
+            if (usage.budget_id, usage.period_start) in deltas
+        ]
+        now = timezone.now()
+        for usage in usages:
+            usage.budget = budgets[usage.budget_id]
+            usage.spent += deltas[(usage.budget_id, usage.period_start)]
+            usage.updated_at = now
+            reached = reached_threshold(usage.spent, usage.budget.amount)
+            if reached > usage.notified_percent:
+                usage.notified_percent = reached
+                crossings.append((usage, reached))
+        BudgetUsage.objects.bulk_update(usages, ['spent', 'notified_percent', 'updated_at'])
+
+        if crossings:
+            budget_thresholds_crossed.send(sender=Budget, crossings=crossings)
+    return crossings
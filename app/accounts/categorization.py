@@ -0,0 +1,221 @@
+import threading
+import time
+from collections import defaultdict, deque
+
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .budgets import start_budget
+from .models import Account, Budget, CategoryRule, DailyAccountSummary, TransactionCategory, TransactionHistory
+from .rollups import local_day
+
+# 규칙이 다른 프로세스에서 바뀐 경우를 반영하기 위한 분류기 재적재 주기(초)
+RULES_TTL = 60
+# 같은 거래내역상세는 반복해서 나오므로(가맹점명 등) 결과를 기억해 둘 최대 문자열 수
+RESULT_CACHE_SIZE = 100_000
+BACKFILL_BATCH_SIZE = 5000
+
+
+def normalize(text):
+    """비교용 문자열 - 대소문자와 공백 차이를 무시"""
+    return ''.join(text.casefold().split())
+
+
+class KeywordMatcher:
+    """Aho-Corasick 다중 패턴 매처
+
+    모든 키워드를 하나의 트라이+실패 링크 오토마톤으로 컴파일해 두고, 문자열을 한 번만 훑어
+    포함된 키워드 중 순위(rank)가 가장 앞선 키워드의 값을 찾는다. 키워드 수와 무관하게
+    문자열 길이에 비례하는 시간이 든다.
+    """
+
+    def __init__(self, keywords):
+        """keywords: (키워드, 순위, 값) - 순위가 작을수록 우선"""
+        self._goto = [{}]
+        self._best = [None]  # 상태별 (순위, 값) - 실패 링크를 따라 도달하는 키워드까지 포함
+        for keyword, rank, value in keywords:
+            keyword = normalize(keyword)
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._best.append(None)
+                state = next_state
+            if self._best[state] is None or rank < self._best[state][0]:
+                self._best[state] = (rank, value)
+
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                if state:
+                    fallback = self._fail[state]
+                    while fallback and char not in self._goto[fallback]:
+                        fallback = self._fail[fallback]
+                    self._fail[child] = self._goto[fallback].get(char, 0)
+                inherited = self._best[self._fail[child]]
+                if inherited is not None and (self._best[child] is None or inherited[0] < self._best[child][0]):
+                    self._best[child] = inherited
+                queue.append(child)
+
+    def match(self, text):
+        """text 에 포함된 키워드 중 가장 우선하는 키워드의 값 (없으면 None)"""
+        goto, fail, best = self._goto, self._fail, self._best
+        state = 0
+        found = None
+        for char in normalize(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            candidate = best[state]
+            if candidate is not None and (found is None or candidate[0] < found[0]):
+                found = candidate
+        return found[1] if found is not None else None
+
+
+class Categorizer:
+    """거래유형별 키워드 매처와 결과 캐시를 묶은 분류기"""
+
+    def __init__(self, rules):
+        """rules: (키워드, 우선순위, 카테고리 ID, 카테고리 적용 거래유형 또는 None)"""
+        self._matchers = {}
+        for transaction_type, _ in TransactionHistory.TRANSACTION_TYPES:
+            self._matchers[transaction_type] = KeywordMatcher(
+                # 우선순위가 같으면 긴 키워드가 앞선다
+                (keyword, (priority, -len(normalize(keyword))), category_id)
+                for keyword, priority, category_id, category_type in rules
+                if category_type in (None, transaction_type)
+            )
+        self._cache = {}
+
+    def categorize(self, text, transaction_type):
+        """거래내역상세 → 카테고리 ID (없으면 None)"""
+        if not text:
+            return None
+        key = (text, transaction_type)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        matcher = self._matchers.get(transaction_type)
+        category_id = matcher.match(text) if matcher is not None else None
+        if len(self._cache) >= RESULT_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[key] = category_id
+        return category_id
+
+
+_lock = threading.Lock()
+_state = {'categorizer': None, 'loaded_at': 0.0}
+
+
+def load_rules():
+    """DB 의 분류 규칙 (키워드, 우선순위, 카테고리 ID, 적용 거래유형) 목록 (쿼리 1회)"""
+    return list(
+        CategoryRule.objects.values_list('keyword', 'priority', 'category_id', 'category__transaction_type')
+    )
+
+
+def load_categorizer():
+    """DB 의 규칙으로 분류기 생성"""
+    return Categorizer(load_rules())
+
+
+def get_categorizer():
+    """프로세스 공용 분류기 - 규칙이 바뀌거나 RULES_TTL 이 지나면 다시 컴파일"""
+    with _lock:
+        if _state['categorizer'] is None or time.monotonic() - _state['loaded_at'] > RULES_TTL:
+            _state['categorizer'] = load_categorizer()
+            _state['loaded_at'] = time.monotonic()
+        return _state['categorizer']
+
+
+def reset_categorizer():
+    with _lock:
+        _state['categorizer'] = None
+
+
+@receiver([post_save, post_delete], sender=CategoryRule)
+@receiver([post_save, post_delete], sender=TransactionCategory)
+@receiver(post_migrate)  # migrate/flush 로 규칙 테이블이 바뀐 경우
+def _rules_changed(sender, **kwargs):
+    reset_categorizer()
+
+
+def categorize_transaction(text, transaction_type):
+    """거래 한 건의 카테고리 ID"""
+    return get_categorizer().categorize(text, transaction_type)
+
+
+def refresh_category_dependents(touched):
+    """카테고리가 바뀐 거래의 (계좌 ID, 일자) 들에 맞춰 카테고리에 기대는 값을 갱신
+
+    금액·건수는 그대로라 일별 집계 값은 바뀌지 않지만, 수정일시를 올려 분석 캐시의 데이터 버전
+    (analysis.cache.get_data_version) 을 바꾸고, 해당 사용자의 카테고리 예산 현재 기간을 다시 합산한다.
+    """
+    days = defaultdict(set)
+    for account_id, day in touched:
+        days[account_id].add(day)
+    if not days:
+        return
+    now = timezone.now()
+    for account_id, account_days in days.items():
+        DailyAccountSummary.objects.filter(account_id=account_id, date__in=account_days).update(updated_at=now)
+    user_ids = Account.objects.filter(pk__in=days).values_list('user_id', flat=True)
+    for budget in Budget.objects.filter(user_id__in=user_ids, is_active=True, category__isnull=False):
+        start_budget(budget)
+
+
+def categorize_transactions(queryset=None, only_missing=True, batch_size=BACKFILL_BATCH_SIZE):
+    """기존 거래내역 일괄 분류
+
+    id 순으로 batch_size 행씩 (id, 상세, 유형) 만 읽어 메모리에서 분류하고,
+    배치마다 카테고리별로 UPDATE ... WHERE id IN (...) 한 번씩만 보낸 뒤 바뀐 거래의
+    분석 캐시 버전과 카테고리 예산을 갱신한다 (refresh_category_dependents).
+    반환값: {'scanned', 'updated', 'elapsed', 'rows_per_second'}
+    """
+    if queryset is None:
+        queryset = TransactionHistory.objects.all()
+    if only_missing:
+        queryset = queryset.filter(category__isnull=True)
+    categorizer = load_categorizer()
+
+    started = time.perf_counter()
+    scanned = updated = 0
+    last_id = 0
+    while True:
+        rows = list(
+            queryset.filter(pk__gt=last_id).order_by('pk')
+            .values_list('pk', 'transaction_detail', 'transaction_type', 'category_id',
+                         'account_id', 'transaction_date')[:batch_size]
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        scanned += len(rows)
+
+        changes = {}
+        touched = set()
+        for pk, text, transaction_type, current, account_id, transaction_date in rows:
+            category_id = categorizer.categorize(text, transaction_type)
+            if category_id != current:
+                changes.setdefault(category_id, []).append(pk)
+                touched.add((account_id, local_day(transaction_date)))
+        for category_id, pks in changes.items():
+            updated += TransactionHistory.objects.filter(pk__in=pks).update(category_id=category_id)
+        refresh_category_dependents(touched)
+
+    elapsed = time.perf_counter() - started
+    return {
+        'scanned': scanned,
+        'updated': updated,
+        'elapsed': round(elapsed, 4),
+        'rows_per_second': round(scanned / elapsed, 1) if elapsed else 0.0,
+    }
@@ -0,0 +1,68 @@
+import csv
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_COLUMNS = [
+    ('id', 'id'),
+    ('account_number', 'account__account_number'),
+    ('transaction_date', 'transaction_date'),
+    ('transaction_type', 'transaction_type'),
+    ('detail_type', 'detail_type'),
+    ('amount', 'amount'),
+    ('balance_after', 'balance_after'),
+    ('transaction_detail', 'transaction_detail'),
+    ('category', 'category__name'),
+]
+
+
+class _Echo:
+    """csv.writer 가 쓴 한 줄을 그대로 돌려주는 버퍼"""
+
+    def write(self, value):
+        return value
+
+
+def _rows(queryset, chunk_size):
+    # 모델 인스턴스 대신 튜플만 서버 사이드 커서로 chunk_size 씩 가져온다
+    return queryset.order_by('transaction_date', 'id').values_list(
+        *[lookup for _, lookup in EXPORT_COLUMNS]
+    ).iterator(chunk_size=chunk_size)
+
+
+def stream_csv(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """거래내역을 CSV 한 줄씩 생성"""
+    writer = csv.writer(_Echo())
+    yield '\ufeff' + writer.writerow([name for name, _ in EXPORT_COLUMNS])  # 엑셀 한글 깨짐 방지 BOM
+    for row in _rows(queryset, chunk_size):
+        yield writer.writerow(row)
+
+
+def stream_ndjson(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """거래내역을 NDJSON 한 줄씩 생성"""
+    names = [name for name, _ in EXPORT_COLUMNS]
+    for row in _rows(queryset, chunk_size):
+        yield json.dumps(dict(zip(names, row)), cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+
+async def aiterate(lines, batch_size=EXPORT_CHUNK_SIZE):
+    """동기 생성기를 ASGI 용 비동기 반복자로 감싼다
+
+    ASGI 에서 동기 반복자를 StreamingHttpResponse 에 넘기면 Django 가 전부 읽어 메모리에 모은 뒤 보내므로,
+    batch_size 줄씩 DB 스레드에서 만들어 바로 내보낸다. 중간에 연결이 끊기면 서버 사이드 커서도 닫는다.
+    """
+    next_batch = sync_to_async(lambda: ''.join(islice(lines, batch_size)))
+    try:
+        while chunk := await next_batch():
+            yield chunk
+    finally:
+        await sync_to_async(lines.close)()
+
+
+EXPORT_FORMATS = {
+    'csv': (stream_csv, 'text/csv; charset=utf-8'),
+    'ndjson': (stream_ndjson, 'application/x-ndjson; charset=utf-8'),
+}
@@ -0,0 +1,26 @@
+from .serializers import TransactionFilterSerializer
+
+
+def filter_transactions(queryset, params):
+    """쿼리 파라미터로 거래내역 필터링 (잘못된 값은 ValidationError)"""
+    serializer = TransactionFilterSerializer(data=params)
+    serializer.is_valid(raise_exception=True)
+    data = serializer.validated_data
+
+    if 'date_from' in data:
+        queryset = queryset.filter(transaction_date__gte=data['date_from'])
+    if 'date_to' in data:
+        queryset = queryset.filter(transaction_date__lt=data['date_to'])
+    if 'transaction_type' in data:
+        queryset = queryset.filter(transaction_type=data['transaction_type'])
+    if 'detail_type' in data:
+        queryset = queryset.filter(detail_type=data['detail_type'])
+    if 'amount_min' in data:
+        queryset = queryset.filter(amount__gte=data['amount_min'])
+    if 'amount_max' in data:
+        queryset = queryset.filter(amount__lte=data['amount_max'])
+    if 'account' in data:
+        queryset = queryset.filter(account_id=data['account'])
+    if 'category' in data:
+        queryset = queryset.filter(category_id=data['category'])
+    return queryset
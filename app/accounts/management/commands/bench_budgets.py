@@ -0,0 +1,63 @@
+import time
+import uuid
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from accounts.budgets import budget_spent, first_period
+from accounts.models import Account, Budget, BudgetUsage, TransactionCategory
+from accounts.services import post_transactions
+
+
+class Command(BaseCommand):
+    help = '출금마다 예산을 증분 평가할 때의 처리량(거래/초)을 측정하고 사용량을 검증합니다. (임시 사용자 생성 후 삭제)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--transactions', type=int, default=5000)
+        parser.add_argument('--batch', type=int, default=1, help='한 번에 전기할 거래 수')
+        parser.add_argument('--budgets', type=int, default=3, help='사용자당 예산 수 (전체/카테고리별)')
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.create_user(
+            username=f'bench-{uuid.uuid4().hex[:8]}', email=f'{uuid.uuid4().hex}@bench.local',
+            nickname=f'bench-{uuid.uuid4().hex[:8]}', name='벤치마크'
+        )
+        try:
+            account = Account.objects.create(
+                user=user, account_number='BENCH-BUDGET', bank_code='000', account_type='checking'
+            )
+            categories = list(TransactionCategory.objects.filter(transaction_type='withdrawal')[:options['budgets']])
+            budgets = [Budget.objects.create(user=user, period='monthly', amount=Decimal('1000000.00'))]
+            budgets += [
+                Budget.objects.create(user=user, category=category, period='weekly', amount=Decimal('100000.00'))
+                for category in categories[:options['budgets'] - 1]
+            ]
+            keywords = [category.rules.values_list('keyword', flat=True).first() for category in categories] or ['기타']
+            self._measure(account, keywords, options['transactions'], options['batch'])
+            self._verify(budgets)
+        finally:
+            user.delete()
+
+    def _measure(self, account, keywords, count, batch):
+        postings = [
+            {'account': account, 'amount': Decimal(1000 + i % 500), 'transaction_type': 'withdrawal',
+             'transaction_detail': f'{keywords[i % len(keywords)]} 결제'}
+            for i in range(count)
+        ]
+        started = time.perf_counter()
+        for start in range(0, count, batch):
+            post_transactions(postings[start:start + batch])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f'출금 {count:,}건 (배치 {batch}): {elapsed:.2f}초, {count / elapsed:,.1f}건/초 (전기 + 예산 평가)'
+        )
+
+    def _verify(self, budgets):
+        for budget in budgets:
+            start = first_period(budget)
+            spent = BudgetUsage.objects.filter(budget=budget, period_start=start).values_list('spent', flat=True).first()
+            spent = spent or Decimal('0.00')
+            expected = budget_spent(budget, start)
+            status = self.style.SUCCESS('일치') if spent == expected else self.style.ERROR('불일치')
+            self.stdout.write(f'  {budget}: 카운터 {spent:,} / 재합산 {expected:,} {status}')
@@ -0,0 +1,48 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.categorization import Categorizer, KeywordMatcher, load_rules
+
+SUFFIXES = ['', ' 강남점', ' 역삼점', ' 온라인', '(주)', ' 결제', ' 정기결제']
+
+
+class Command(BaseCommand):
+    help = '거래내역상세 분류기의 처리량(문자열/초)을 측정합니다. (DB 쓰기 없음)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--strings', type=int, default=1_000_000)
+        parser.add_argument('--distinct', type=int, default=50_000, help='서로 다른 거래내역상세 수')
+        parser.add_argument('--extra-rules', type=int, default=1000, help='DB 규칙에 더할 합성 규칙 수')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        rules = load_rules()
+        rules += [(f'가맹점{i:05d}', 100, -1, None) for i in range(options['extra_rules'])]
+        keywords = [keyword for keyword, *_ in rules]
+        distinct = [
+            f'{rng.choice(keywords)}{rng.choice(SUFFIXES)}' if rng.random() < 0.8 else f'기타거래 {i}'
+            for i in range(options['distinct'])
+        ]
+        texts = [rng.choice(distinct) for _ in range(options['strings'])]
+        types = [rng.choice(['deposit', 'withdrawal']) for _ in range(options['strings'])]
+        self.stdout.write(f"규칙 {len(rules):,}개, 문자열 {len(texts):,}개 (서로 다른 값 {len(distinct):,}개)")
+
+        started = time.perf_counter()
+        matcher = KeywordMatcher((keyword, priority, category) for keyword, priority, category, _ in rules)
+        self.stdout.write(f'  오토마톤 컴파일 {(time.perf_counter() - started) * 1000:.1f}ms')
+
+        self._measure('매처 (캐시 없음)', lambda: [matcher.match(text) for text in texts], len(texts))
+        categorizer = Categorizer(rules)
+        self._measure('분류기 (결과 캐시)', lambda: [
+            categorizer.categorize(text, type_) for text, type_ in zip(texts, types)
+        ], len(texts))
+
+    def _measure(self, name, run, count):
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f'  {name:<18} {elapsed:>7.2f}초  {count / elapsed:>12,.0f}건/초')
+
@@ -0,0 +1,71 @@
+import resource
+import time
+import tracemalloc
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import Account
+from accounts.services import bulk_ingest_transactions
+from accounts.views import TransactionHistoryViewSet
+
+
+class Command(BaseCommand):
+    help = '거래내역 스트리밍 내보내기의 첫 바이트 시간과 최대 메모리를 측정합니다. (임시 데이터 생성 후 삭제)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100000)
+        parser.add_argument('--output', choices=['csv', 'ndjson'], default='csv')
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.create_user(
+            username=f'bench-{uuid.uuid4().hex[:8]}', email=f'{uuid.uuid4().hex}@bench.local',
+            nickname=f'bench-{uuid.uuid4().hex[:8]}', name='벤치마크'
+        )
+        try:
+            account = Account.objects.create(
+                user=user, account_number='BENCH-EXPORT', bank_code='000', account_type='checking'
+            )
+            self._seed(account, options['rows'])
+            self._measure(user, options['output'], options['rows'])
+        finally:
+            user.delete()
+
+    def _seed(self, account, rows):
+        base = timezone.now() - timedelta(minutes=rows)
+        for start in range(0, rows, 10000):
+            bulk_ingest_transactions([
+                {'account': account, 'amount': Decimal('1.00'), 'transaction_type': 'deposit',
+                 'transaction_date': base + timedelta(minutes=i), 'transaction_detail': '벤치마크 거래'}
+                for i in range(start, min(start + 10000, rows))
+            ])
+
+    def _measure(self, user, output, rows):
+        request = APIRequestFactory().get('/api/transactions/export/', {'output': output})
+        force_authenticate(request, user=user)
+        view = TransactionHistoryViewSet.as_view({'get': 'export'})
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        response = view(request)
+        chunks = iter(response.streaming_content)
+        size = len(next(chunks))
+        first_byte = time.perf_counter() - started
+        for chunk in chunks:
+            size += len(chunk)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        response.close()
+
+        max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        self.stdout.write(
+            f'{rows:,}행 {output}: 첫 바이트 {first_byte * 1000:.1f}ms, 전체 {elapsed:.2f}초 '
+            f'({rows / elapsed:,.0f}행/초, {size / 1024 / 1024:.1f}MB), '
+            f'스트리밍 중 Python 최대 할당 {peak / 1024 / 1024:.1f}MB, 프로세스 최대 RSS {max_rss_mb:.0f}MB'
+        )
@@ -0,0 +1,78 @@
+import threading
+import time
+import uuid
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from accounts.models import Account, TransactionHistory
+from accounts.services import post_transactions
+
+
+class Command(BaseCommand):
+    help = '핫 계좌에 대한 동시 전기 처리량을 측정하고 최종 잔액을 검증합니다. (임시 사용자 생성 후 삭제)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--postings', type=int, default=500, help='스레드당 전기 건수')
+        parser.add_argument('--accounts', type=int, default=1, help='핫 계좌 수')
+        parser.add_argument('--batch', type=int, default=1, help='한 번의 잠금 구간에서 처리할 전기 건수')
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.create_user(
+            username=f'bench-{uuid.uuid4().hex[:8]}', email=f'{uuid.uuid4().hex}@bench.local',
+            nickname=f'bench-{uuid.uuid4().hex[:8]}', name='벤치마크'
+        )
+        try:
+            accounts = [
+                Account.objects.create(user=user, account_number=f'BENCH-{i}', bank_code='000', account_type='checking')
+                for i in range(options['accounts'])
+            ]
+            self._run(accounts, options)
+        finally:
+            user.delete()
+
+    def _run(self, accounts, options):
+        errors = []
+        batch = options['batch']
+
+        def worker(index):
+            try:
+                for start in range(0, options['postings'], batch):
+                    size = min(batch, options['postings'] - start)
+                    post_transactions([
+                        {'account': accounts[(index + start + i) % len(accounts)].pk,
+                         'amount': Decimal('1.00'), 'transaction_type': 'deposit'}
+                        for i in range(size)
+                    ])
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=worker, args=(i,)) for i in range(options['threads'])]
+        started = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        if errors:
+            raise CommandError(f'전기 중 오류 {len(errors)}건: {errors[0]!r}')
+
+        total = options['threads'] * options['postings']
+        self.stdout.write(
+            f"스레드 {options['threads']} · 계좌 {len(accounts)} · 배치 {batch}: "
+            f"{total}건 {elapsed:.2f}초, {total / elapsed:,.0f}건/초, "
+            f"계좌당 {total / len(accounts) / elapsed:,.0f}건/초"
+        )
+
+        for account in accounts:
+            account.refresh_from_db()
+            expected = Decimal(TransactionHistory.objects.filter(account=account).count())
+            if account.balance != expected:
+                raise CommandError(f'{account.account_number} 잔액 불일치: {account.balance} != {expected}')
+        self.stdout.write(self.style.SUCCESS('모든 계좌의 최종 잔액이 일치합니다.'))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from accounts.categorization import categorize_transactions
+from accounts.models import TransactionHistory
+
+
+class Command(BaseCommand):
+    help = '거래내역상세로 기존 거래내역의 카테고리를 일괄 분류합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='이미 분류된 거래내역도 현재 규칙으로 다시 분류')
+        parser.add_argument('--account', type=int, action='append', dest='accounts',
+                            help='대상 계좌 ID (여러 번 지정 가능, 생략 시 전체)')
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        queryset = TransactionHistory.objects.all()
+        if options['accounts']:
+            queryset = queryset.filter(account_id__in=options['accounts'])
+        result = categorize_transactions(queryset, only_missing=not options['all'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"거래내역 {result['scanned']:,}건 확인, {result['updated']:,}건 분류 "
+            f"({result['elapsed']:.2f}초, {result['rows_per_second']:,.0f}건/초)"
+        ))
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.rollups import rebuild_summaries, verify_summaries
+
+
+class Command(BaseCommand):
+    help = '원본 거래내역으로 일별 계좌 집계를 재생성하거나 검증합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--account', type=int, action='append', dest='accounts',
+                            help='대상 계좌 ID (여러 번 지정 가능, 생략 시 전체)')
+        parser.add_argument('--verify', action='store_true',
+                            help='재생성하지 않고 저장된 집계와 원본을 비교만 합니다.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        if options['verify']:
+            mismatches = verify_summaries(options['accounts'])
+            for account_id, day, field in mismatches[:50]:
+                self.stderr.write(f'불일치: 계좌 {account_id} {day} {field}')
+            if mismatches:
+                raise CommandError(f'일별 집계 불일치 {len(mismatches)}건')
+            self.stdout.write(self.style.SUCCESS('일별 집계가 원본 거래내역과 일치합니다.'))
+            return
+
+        created = rebuild_summaries(options['accounts'], batch_size=options['batch_size'])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f'일별 집계 {created}건을 재생성했습니다. ({elapsed:.2f}초)'))
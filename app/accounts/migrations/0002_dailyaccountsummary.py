@@ -0,0 +1,87 @@
+# Generated by Django 5.2.5 on 2026-10-18 20:32
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyAccountSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="집계일")),
+                (
+                    "deposit_total",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0.00"),
+                        max_digits=14,
+                        verbose_name="입금합계",
+                    ),
+                ),
+                (
+                    "withdrawal_total",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0.00"),
+                        max_digits=14,
+                        verbose_name="출금합계",
+                    ),
+                ),
+                (
+                    "transaction_count",
+                    models.PositiveIntegerField(default=0, verbose_name="거래건수"),
+                ),
+                (
+                    "closing_balance",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0.00"),
+                        max_digits=12,
+                        verbose_name="마감잔액",
+                    ),
+                ),
+                (
+                    "last_transaction_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="마지막거래일시"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_summaries",
+                        to="accounts.account",
+                        verbose_name="계좌",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "일별 계좌 집계",
+                "verbose_name_plural": "일별 계좌 집계들",
+                "db_table": "daily_account_summary",
+                "ordering": ["-date"],
+                "unique_together": {("account", "date")},
+            },
+        ),
+    ]
@@ -0,0 +1,111 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_dailyaccountsummary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TransactionCategory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(max_length=50, unique=True, verbose_name="카테고리명"),
+                ),
+                (
+                    "transaction_type",
+                    models.CharField(
+                        blank=True,
+                        choices=[("deposit", "입금"), ("withdrawal", "출금")],
+                        max_length=20,
+                        null=True,
+                        verbose_name="적용거래유형",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "거래 카테고리",
+                "verbose_name_plural": "거래 카테고리들",
+                "db_table": "transaction_categories",
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="CategoryRule",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("keyword", models.CharField(max_length=100, verbose_name="키워드")),
+                (
+                    "priority",
+                    models.PositiveSmallIntegerField(default=100, verbose_name="우선순위"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rules",
+                        to="accounts.transactioncategory",
+                        verbose_name="카테고리",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "카테고리 규칙",
+                "verbose_name_plural": "카테고리 규칙들",
+                "db_table": "category_rules",
+                "ordering": ["priority", "keyword"],
+                "unique_together": {("category", "keyword")},
+            },
+        ),
+        migrations.AddField(
+            model_name="transactionhistory",
+            name="category",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="transactions",
+                to="accounts.transactioncategory",
+                verbose_name="카테고리",
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+from django.db import migrations
+
+# (카테고리, 적용 거래유형, 키워드)
+DEFAULT_CATEGORIES = [
+    ('급여', 'deposit', ['급여', '월급', '상여', '성과급']),
+    ('이자', 'deposit', ['이자', '결산']),
+    ('식비', 'withdrawal', ['식비', '배달의민족', '배민', '요기요', '쿠팡이츠', '맥도날드', '버거킹', '김밥', '식당']),
+    ('카페', 'withdrawal', ['스타벅스', '투썸', '이디야', '메가커피', '빽다방', '카페']),
+    ('편의점', 'withdrawal', ['GS25', 'CU', '세븐일레븐', '이마트24']),
+    ('쇼핑', 'withdrawal', ['쿠팡', '11번가', 'G마켓', '옥션', '무신사', '이마트', '홈플러스', '롯데마트']),
+    ('교통', 'withdrawal', ['택시', '카카오T', '지하철', '버스', '코레일', 'KTX', 'SRT', '주유', '티머니']),
+    ('통신', 'withdrawal', ['SKT', 'KT', 'LGU+', '통신요금']),
+    ('주거', 'withdrawal', ['관리비', '월세', '전기요금', '가스요금', '수도요금']),
+    ('의료', 'withdrawal', ['병원', '약국', '의원', '치과']),
+    ('문화', 'withdrawal', ['넷플릭스', '유튜브', '멜론', 'CGV', '메가박스', '롯데시네마']),
+    ('이체', None, ['이체', '송금', '토스']),
+]
+
+
+def create_default_categories(apps, schema_editor):
+    TransactionCategory = apps.get_model('accounts', 'TransactionCategory')
+    CategoryRule = apps.get_model('accounts', 'CategoryRule')
+    for name, transaction_type, keywords in DEFAULT_CATEGORIES:
+        category, _ = TransactionCategory.objects.get_or_create(
+            name=name, defaults={'transaction_type': transaction_type}
+        )
+        # 이체는 가맹점 키워드보다 뒤로 (예: '쿠팡 송금' 보다 '쿠팡' 우선)
+        priority = 200 if name == '이체' else 100
+        CategoryRule.objects.bulk_create(
+            [CategoryRule(category=category, keyword=keyword, priority=priority) for keyword in keywords],
+            ignore_conflicts=True,
+        )
+
+
+def delete_default_categories(apps, schema_editor):
+    TransactionCategory = apps.get_model('accounts', 'TransactionCategory')
+    TransactionCategory.objects.filter(name__in=[name for name, _, _ in DEFAULT_CATEGORIES]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_transactioncategory_categoryrule_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_default_categories, delete_default_categories),
+    ]
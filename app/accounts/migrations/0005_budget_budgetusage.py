@@ -0,0 +1,132 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:40
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_default_categories"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Budget",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "period",
+                    models.CharField(
+                        choices=[("daily", "일"), ("weekly", "주"), ("monthly", "월")],
+                        default="monthly",
+                        max_length=20,
+                        verbose_name="예산기간",
+                    ),
+                ),
+                (
+                    "amount",
+                    models.DecimalField(decimal_places=2, max_digits=12, verbose_name="예산금액"),
+                ),
+                ("is_active", models.BooleanField(default=True, verbose_name="사용여부")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="budgets",
+                        to="accounts.transactioncategory",
+                        verbose_name="카테고리",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="budgets",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "예산",
+                "verbose_name_plural": "예산들",
+                "db_table": "budgets",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["user", "is_active"], name="budgets_user_id_ce81fb_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="BudgetUsage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("period_start", models.DateField(verbose_name="기간시작일")),
+                (
+                    "spent",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0.00"),
+                        max_digits=14,
+                        verbose_name="누적지출",
+                    ),
+                ),
+                (
+                    "notified_percent",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="알림보낸사용률"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "budget",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="usages",
+                        to="accounts.budget",
+                        verbose_name="예산",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "예산 사용량",
+                "verbose_name_plural": "예산 사용량들",
+                "db_table": "budget_usages",
+                "ordering": ["-period_start"],
+                "unique_together": {("budget", "period_start")},
+            },
+        ),
+    ]
@@ -1,5 +1,9 @@
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.base import DEFERRED
 from django.conf import settings
+from django.utils import timezone
 from decimal import Decimal
 
 
@@ -63,6 +67,81 @@ class Account(models.Model):
         return f"{self.user.nickname}의 {self.get_account_type_display()} ({self.account_number})"
 
 
+class TransactionCategory(models.Model):
+    """거래 카테고리 모델 (식비, 교통, 급여 ...)"""
+    name = models.CharField(
+        max_length=50,
+        unique=True,
+        verbose_name='카테고리명'
+    )
+    transaction_type = models.CharField(
+        max_length=20,
+        choices=[('deposit', '입금'), ('withdrawal', '출금')],
+        null=True, blank=True,
+        verbose_name='적용거래유형'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='생성일시'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일시'
+    )
+
+    class Meta:
+        db_table = 'transaction_categories'
+        verbose_name = '거래 카테고리'
+        verbose_name_plural = '거래 카테고리들'
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class CategoryRule(models.Model):
+    """카테고리 분류 규칙 - 거래내역상세에 keyword 가 포함되면 해당 카테고리
+
+    여러 규칙이 맞으면 priority 가 작은 규칙, 같으면 더 긴 keyword 가 우선한다.
+    """
+    category = models.ForeignKey(
+        TransactionCategory,
+        on_delete=models.CASCADE,
+        related_name='rules',
+        verbose_name='카테고리'
+    )
+    keyword = models.CharField(
+        max_length=100,
+        verbose_name='키워드'
+    )
+    priority = models.PositiveSmallIntegerField(
+        default=100,
+        verbose_name='우선순위'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='생성일시'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일시'
+    )
+
+    class Meta:
+        db_table = 'category_rules'
+        verbose_name = '카테고리 규칙'
+        verbose_name_plural = '카테고리 규칙들'
+        ordering = ['priority', 'keyword']
+        unique_together = ['category', 'keyword']
+
+    def __str__(self):
+        return f"{self.keyword} → {self.category.name}"
+
+
+# 잔액·일별 집계·예산 사용량에 반영된 거래내역 필드 - 기록 뒤에는 바꿀 수 없다
+LEDGER_FIELDS = ('account_id', 'amount', 'transaction_type', 'transaction_date', 'balance_after')
+
+
 class TransactionHistory(models.Model):
     """거래내역 모델"""
     TRANSACTION_TYPES = [
@@ -111,6 +190,13 @@ class TransactionHistory(models.Model):
         null=True, blank=True,
         verbose_name='상세유형'
     )
+    category = models.ForeignKey(
+        TransactionCategory,
+        on_delete=models.SET_NULL,
+        null=True, blank=True,
+        related_name='transactions',
+        verbose_name='카테고리'
+    )
     transaction_date = models.DateTimeField(
         db_index=True,
         verbose_name='거래일시'
@@ -139,9 +225,210 @@ class TransactionHistory(models.Model):
     def __str__(self):
         return f"{self.account.user.nickname} - {self.get_transaction_type_display()} {self.amount}원"
 
+    @property
+    def balance_delta(self):
+        """거래로 인한 계좌 잔액 증감분"""
+        return self.amount if self.transaction_type == 'deposit' else -self.amount
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 원장 필드 변경 확인용 - DB 에 저장된 값 (지연 로딩이면 DEFERRED)
+        instance._stored_ledger = tuple(instance.__dict__.get(field, DEFERRED) for field in LEDGER_FIELDS)
+        instance._stored_category_id = instance.__dict__.get('category_id', DEFERRED)
+        return instance
+
     def save(self, *args, **kwargs):
-        """거래내역 저장시 계좌 잔액 업데이트"""
-        if not self.pk:  # 새로운 거래내역인 경우
+        """거래내역 저장시 계좌 잔액, 일별 집계 및 예산 사용량 업데이트
+
+        새 거래는 잔액을 F() 로 DB 에서 증감한 뒤 그 결과를 balance_after 로 사용한다.
+        UPDATE 가 잡은 행 잠금은 트랜잭션 종료까지 유지되므로 동시 입금에도 유실이 없다.
+        이미 기록된 거래는 잔액·집계·예산이 이 값에 기대고 있으므로 원장 필드(LEDGER_FIELDS)를
+        바꿀 수 없다 - 정정은 반대 거래를 새로 기록한다.
+        """
+        from .budgets import evaluate_budgets
+        from .categorization import categorize_transaction, refresh_category_dependents
+        from .rollups import local_day, record_transactions
+
+        if self.pk:
+            stored = getattr(self, '_stored_ledger', None)
+            current = tuple(self.__dict__.get(field, DEFERRED) for field in LEDGER_FIELDS)
+            if stored is None or any(
+                old is not DEFERRED and new is not DEFERRED and old != new for old, new in zip(stored, current)
+            ):
+                raise ValidationError('기록된 거래의 계좌·금액·유형·일시·거래후잔액은 바꿀 수 없습니다.')
+            stored_category = getattr(self, '_stored_category_id', DEFERRED)
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+                if stored_category is not DEFERRED and stored_category != self.category_id:
+                    refresh_category_dependents({(self.account_id, local_day(self.transaction_date))})
+            self._stored_category_id = self.category_id
+            return
+
+        if self.category_id is None:
+            self.category_id = categorize_transaction(self.transaction_detail, self.transaction_type)
+
+        with transaction.atomic():
+            Account.objects.filter(pk=self.account_id).update(
+                balance=F('balance') + self.balance_delta,
+                updated_at=timezone.now()
+            )
+            self.balance_after = Account.objects.values_list('balance', flat=True).get(pk=self.account_id)
             self.account.balance = self.balance_after
-            self.account.save(update_fields=['balance', 'updated_at'])
-        super().save(*args, **kwargs)
\ No newline at end of file
+            super().save(*args, **kwargs)
+            record_transactions([self])
+            evaluate_budgets([self])
+        self._stored_ledger = tuple(self.__dict__.get(field, DEFERRED) for field in LEDGER_FIELDS)
+        self._stored_category_id = self.category_id
+
+    def delete(self, *args, **kwargs):
+        raise ValidationError('거래내역은 삭제할 수 없습니다. 반대 거래로 정정하세요.')
+
+
+class DailyAccountSummary(models.Model):
+    """계좌별 일별 입출금 집계 모델 (Asia/Seoul 기준 일자)"""
+    account = models.ForeignKey(
+        Account,
+        on_delete=models.CASCADE,
+        related_name='daily_summaries',
+        verbose_name='계좌'
+    )
+    date = models.DateField(
+        verbose_name='집계일'
+    )
+    deposit_total = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        verbose_name='입금합계'
+    )
+    withdrawal_total = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        verbose_name='출금합계'
+    )
+    transaction_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='거래건수'
+    )
+    closing_balance = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        verbose_name='마감잔액'
+    )
+    last_transaction_at = models.DateTimeField(
+        null=True, blank=True,
+        verbose_name='마지막거래일시'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일시'
+    )
+
+    class Meta:
+        db_table = 'daily_account_summary'
+        verbose_name = '일별 계좌 집계'
+        verbose_name_plural = '일별 계좌 집계들'
+        ordering = ['-date']
+        unique_together = ['account', 'date']
+
+    def __str__(self):
+        return f"{self.account.account_number} {self.date} (입금 {self.deposit_total}, 출금 {self.withdrawal_total})"
+
+
+class Budget(models.Model):
+    """예산 모델 - 기간(일/주/월)별 지출 한도, 카테고리를 지정하면 해당 카테고리 지출만 집계"""
+    PERIOD_CHOICES = [
+        ('daily', '일'),
+        ('weekly', '주'),
+        ('monthly', '월'),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='budgets',
+        verbose_name='사용자'
+    )
+    category = models.ForeignKey(
+        TransactionCategory,
+        on_delete=models.CASCADE,
+        null=True, blank=True,
+        related_name='budgets',
+        verbose_name='카테고리'
+    )
+    period = models.CharField(
+        max_length=20,
+        choices=PERIOD_CHOICES,
+        default='monthly',
+        verbose_name='예산기간'
+    )
+    amount = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        verbose_name='예산금액'
+    )
+    is_active = models.BooleanField(
+        default=True,
+        verbose_name='사용여부'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='생성일시'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일시'
+    )
+
+    class Meta:
+        db_table = 'budgets'
+        verbose_name = '예산'
+        verbose_name_plural = '예산들'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'is_active']),
+        ]
+
+    def __str__(self):
+        target = self.category.name if self.category_id else '전체'
+        return f"{self.user.nickname}의 {self.get_period_display()} {target} 예산 {self.amount}원"
+
+
+class BudgetUsage(models.Model):
+    """예산 기간별 누적 지출 - 출금이 기록될 때마다 증분으로 갱신되는 카운터"""
+    budget = models.ForeignKey(
+        Budget,
+        on_delete=models.CASCADE,
+        related_name='usages',
+        verbose_name='예산'
+    )
+    period_start = models.DateField(
+        verbose_name='기간시작일'
+    )
+    spent = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        verbose_name='누적지출'
+    )
+    notified_percent = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='알림보낸사용률'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일시'
+    )
+
+    class Meta:
+        db_table = 'budget_usages'
+        verbose_name = '예산 사용량'
+        verbose_name_plural = '예산 사용량들'
+        ordering = ['-period_start']
+        unique_together = ['budget', 'period_start']
+
+    def __str__(self):
+        return f"{self.budget} - {self.period_start} 사용 {self.spent}원"
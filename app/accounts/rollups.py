@@ -0,0 +1,159 @@
+from datetime import datetime, time
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
+
+from .models import DailyAccountSummary, TransactionHistory
+
+ZERO = Decimal('0.00')
+SUMMARY_FIELDS = ['deposit_total', 'withdrawal_total', 'transaction_count', 'closing_balance', 'last_transaction_at']
+
+
+def as_aware_datetime(value):
+    """date 또는 naive datetime 을 현재 시간대(Asia/Seoul) 기준 aware datetime 으로 변환"""
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def local_day(value):
+    """거래일시의 Asia/Seoul 기준 일자"""
+    return timezone.localtime(as_aware_datetime(value)).date()
+
+
+def _fold(transactions):
+    """거래내역을 (계좌, 일자)별 증분으로 합산"""
+    deltas = {}
+    for item in transactions:
+        occurred_at = as_aware_datetime(item.transaction_date)
+        key = (item.account_id, timezone.localtime(occurred_at).date())
+        delta = deltas.get(key)
+        if delta is None:
+            delta = deltas[key] = {
+                'deposit': ZERO, 'withdrawal': ZERO, 'count': 0, 'last_at': None, 'closing': ZERO,
+            }
+        delta[item.transaction_type] += item.amount
+        delta['count'] += 1
+        if delta['last_at'] is None or occurred_at >= delta['last_at']:
+            delta['last_at'] = occurred_at
+            delta['closing'] = item.balance_after
+    return deltas
+
+
+def record_transactions(transactions):
+    """새 거래내역을 일별 집계에 증분 반영
+
+    건수와 관계없이 (빈 행 INSERT, 대상 행 조회, 일괄 UPDATE) 세 번의 쿼리로 처리하며,
+    합계는 F() 로 더하므로 동시에 기록되어도 유실되지 않는다.
+    마감잔액은 기존 마지막 거래보다 늦은 거래일 때만 갱신한다.
+    """
+    deltas = _fold(transactions)
+    if not deltas:
+        return
+
+    account_ids = {account_id for account_id, _ in deltas}
+    days = [day for _, day in deltas]
+    now = timezone.now()
+
+    with transaction.atomic():
+        DailyAccountSummary.objects.bulk_create(
+            [DailyAccountSummary(account_id=account_id, date=day) for account_id, day in deltas],
+            ignore_conflicts=True,
+        )
+        summaries = [
+            summary for summary in DailyAccountSummary.objects.filter(
+                account_id__in=account_ids, date__range=(min(days), max(days))
+            ).only('id', 'account_id', 'date')
+            if (summary.account_id, summary.date) in deltas
+        ]
+        for summary in summaries:
+            delta = deltas[(summary.account_id, summary.date)]
+            is_latest = Q(last_transaction_at__isnull=True) | Q(last_transaction_at__lte=delta['last_at'])
+            summary.deposit_total = F('deposit_total') + delta['deposit']
+            summary.withdrawal_total = F('withdrawal_total') + delta['withdrawal']
+            summary.transaction_count = F('transaction_count') + delta['count']
+            summary.closing_balance = Case(
+                When(is_latest, then=Value(delta['closing'])), default=F('closing_balance')
+            )
+            summary.last_transaction_at = Case(
+                When(is_latest, then=Value(delta['last_at'])), default=F('last_transaction_at')
+            )
+            summary.updated_at = now
+        DailyAccountSummary.objects.bulk_update(summaries, SUMMARY_FIELDS + ['updated_at'])
+
+
+def compute_summaries(queryset=None):
+    """원본 거래내역으로부터 일별 집계를 다시 계산 (계좌/일자 순으로 스트리밍)"""
+    if queryset is None:
+        queryset = TransactionHistory.objects.all()
+    rows = queryset.order_by('account_id', 'transaction_date', 'id').values_list(
+        'account_id', 'transaction_date', 'amount', 'transaction_type', 'balance_after'
+    ).iterator(chunk_size=5000)
+
+    current = None
+    for account_id, occurred_at, amount, transaction_type, balance_after in rows:
+        key = (account_id, local_day(occurred_at))
+        if current is None or (current.account_id, current.date) != key:
+            if current is not None:
+                yield current
+            current = DailyAccountSummary(account_id=account_id, date=key[1], transaction_count=0)
+        if transaction_type == 'deposit':
+            current.deposit_total += amount
+        else:
+            current.withdrawal_total += amount
+        current.transaction_count += 1
+        current.closing_balance = balance_after
+        current.last_transaction_at = occurred_at
+    if current is not None:
+        yield current
+
+
+def rebuild_summaries(account_ids=None, batch_size=1000):
+    """일별 집계를 원본 거래내역으로 재생성"""
+    transactions = TransactionHistory.objects.all()
+    existing = DailyAccountSummary.objects.all()
+    if account_ids:
+        transactions = transactions.filter(account_id__in=account_ids)
+        existing = existing.filter(account_id__in=account_ids)
+
+    created = 0
+    with transaction.atomic():
+        existing.delete()
+        batch = []
+        for summary in compute_summaries(transactions):
+            batch.append(summary)
+            if len(batch) >= batch_size:
+                DailyAccountSummary.objects.bulk_create(batch)
+                created += len(batch)
+                batch = []
+        if batch:
+            DailyAccountSummary.objects.bulk_create(batch)
+            created += len(batch)
+    return created
+
+
+def verify_summaries(account_ids=None):
+    """저장된 일별 집계와 원본 재계산 결과 비교 - 불일치 (계좌, 일자, 필드) 목록 반환"""
+    transactions = TransactionHistory.objects.all()
+    stored = DailyAccountSummary.objects.all()
+    if account_ids:
+        transactions = transactions.filter(account_id__in=account_ids)
+        stored = stored.filter(account_id__in=account_ids)
+
+    stored = {(summary.account_id, summary.date): summary for summary in stored.iterator()}
+    mismatches = []
+    for expected in compute_summaries(transactions):
+        key = (expected.account_id, expected.date)
+        actual = stored.pop(key, None)
+        if actual is None:
+            mismatches.append((*key, 'missing'))
+            continue
+        for field in ('deposit_total', 'withdrawal_total', 'transaction_count', 'closing_balance'):
+            if getattr(actual, field) != getattr(expected, field):
+                mismatches.append((*key, field))
+    mismatches.extend((*key, 'orphan') for key in stored)
+    return mismatches
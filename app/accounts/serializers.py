@@ -1,5 +1,6 @@
+from decimal import Decimal
 from rest_framework import serializers
-from .models import Account, TransactionHistory
+from .models import Account, Budget, BudgetUsage, TransactionHistory, DailyAccountSummary
 
 
 class AccountSerializer(serializers.ModelSerializer):
@@ -11,12 +12,87 @@ class AccountSerializer(serializers.ModelSerializer):
 
 class TransactionHistorySerializer(serializers.ModelSerializer):
     account_number = serializers.CharField(source='account.account_number', read_only=True)
+    category_name = serializers.CharField(source='category.name', read_only=True, default=None)
     
     class Meta:
         model = TransactionHistory
         fields = [
             'id', 'account', 'account_number', 'amount', 'balance_after',
             'transaction_detail', 'transaction_type', 'detail_type',
-            'transaction_date', 'created_at'
+            'category', 'category_name', 'transaction_date', 'created_at'
         ]
-        read_only_fields = ['id', 'balance_after', 'created_at']
\ No newline at end of file
+        read_only_fields = ['id', 'balance_after', 'category', 'created_at']
+
+
+class DailyAccountSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = DailyAccountSummary
+        fields = ['date', 'deposit_total', 'withdrawal_total', 'transaction_count', 'closing_balance']
+
+
+class BudgetUsageSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BudgetUsage
+        fields = ['period_start', 'spent', 'notified_percent', 'updated_at']
+
+
+class BudgetSerializer(serializers.ModelSerializer):
+    category_name = serializers.CharField(source='category.name', read_only=True, default=None)
+    amount = serializers.DecimalField(max_digits=12, decimal_places=2, min_value=Decimal('0.01'))
+
+    class Meta:
+        model = Budget
+        fields = ['id', 'category', 'category_name', 'period', 'amount', 'is_active', 'created_at']
+        read_only_fields = ['id', 'created_at']
+
+
+class TransactionFilterSerializer(serializers.Serializer):
+    """거래내역 목록/내보내기 필터 (date_from 이상, date_to 미만)"""
+
+    DATE_INPUT_FORMATS = ['iso-8601', '%Y-%m-%d']
+
+    date_from = serializers.DateTimeField(required=False, input_formats=DATE_INPUT_FORMATS)
+    date_to = serializers.DateTimeField(required=False, input_formats=DATE_INPUT_FORMATS)
+    transaction_type = serializers.ChoiceField(choices=TransactionHistory.TRANSACTION_TYPES, required=False)
+    detail_type = serializers.ChoiceField(choices=TransactionHistory.DETAIL_TYPES, required=False)
+    amount_min = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    amount_max = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    account = serializers.IntegerField(required=False)
+    category = serializers.IntegerField(required=False)
+
+
+class DailySummaryFilterSerializer(serializers.Serializer):
+    """일별 집계 조회 기간 (거래내역 필터와 같이 date_from 이상, date_to 미만)"""
+
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+
+
+class BulkTransactionItemSerializer(serializers.Serializer):
+    account = serializers.IntegerField()
+    amount = serializers.DecimalField(max_digits=12, decimal_places=2, min_value=Decimal('0.01'))
+    transaction_type = serializers.ChoiceField(choices=TransactionHistory.TRANSACTION_TYPES)
+    detail_type = serializers.ChoiceField(
+        choices=TransactionHistory.DETAIL_TYPES, required=False, allow_null=True
+    )
+    transaction_detail = serializers.CharField(
+        max_length=500, required=False, allow_null=True, allow_blank=True
+    )
+    transaction_date = serializers.DateTimeField()
+
+
+class BulkTransactionIngestSerializer(serializers.Serializer):
+    """거래내역 일괄 등록 시리얼라이저"""
+
+    transactions = BulkTransactionItemSerializer(many=True, allow_empty=False)
+
+    def validate_transactions(self, value):
+        # 행마다 계좌를 조회하지 않도록 계좌 소유 여부는 한 번의 쿼리로 확인
+        account_ids = {row['account'] for row in value}
+        owned = set(
+            Account.objects.filter(user=self.context['request'].user, pk__in=account_ids)
+            .values_list('pk', flat=True)
+        )
+        if account_ids - owned:
+            raise serializers.ValidationError("본인 계좌의 거래내역만 등록할 수 있습니다.")
+        return value
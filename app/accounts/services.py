@@ -0,0 +1,95 @@
+import time
+from decimal import Decimal
+
+from django.db import transaction
+from django.utils import timezone
+
+from .budgets import evaluate_budgets
+from .categorization import get_categorizer
+from .models import Account, TransactionHistory
+from .rollups import record_transactions
+from .signals import transactions_bulk_created
+
+BULK_BATCH_SIZE = 1000
+
+
+def _account_id(posting):
+    return getattr(posting['account'], 'pk', posting['account'])
+
+
+def post_transactions(postings, order_by_date=False, batch_size=BULK_BATCH_SIZE):
+    """거래 전기 엔진
+
+    postings 의 각 항목은 account(인스턴스 또는 id), amount, transaction_type 과
+    선택적으로 transaction_date, transaction_detail, detail_type 을 가진다.
+    카테고리는 거래내역상세로 분류해 함께 저장한다.
+    대상 계좌 행을 pk 순서로 한 번에 잠근 뒤(교착 방지) 계좌별로 잔액을 이어서 계산하고,
+    거래내역 INSERT · 일별 집계 · 예산 사용량 · 계좌 잔액 UPDATE 를 각각 일괄로 처리한다.
+    같은 계좌에 대한 여러 거래가 하나의 잠금 구간에서 처리되므로 핫 계좌에서도 경합이 짧다.
+    order_by_date 가 참이면 계좌별로 거래일시 순서대로 적용한다. (과거 내역 적재용)
+    """
+    postings = list(postings)
+    if not postings:
+        return []
+
+    account_ids = {_account_id(posting) for posting in postings}
+    if order_by_date:
+        postings.sort(key=lambda posting: (_account_id(posting), posting['transaction_date']))
+
+    with transaction.atomic():
+        accounts = Account.objects.select_for_update().filter(pk__in=account_ids).order_by('pk').in_bulk()
+        missing = account_ids - accounts.keys()
+        if missing:
+            raise Account.DoesNotExist(f"존재하지 않는 계좌입니다: {sorted(missing)}")
+
+        now = timezone.now()
+        categorizer = get_categorizer()
+        objs = []
+        for posting in postings:
+            account = accounts[_account_id(posting)]
+            obj = TransactionHistory(
+                account=account,
+                amount=Decimal(posting['amount']),
+                transaction_detail=posting.get('transaction_detail'),
+                transaction_type=posting['transaction_type'],
+                detail_type=posting.get('detail_type'),
+                transaction_date=posting.get('transaction_date') or now,
+                category_id=categorizer.categorize(posting.get('transaction_detail'), posting['transaction_type']),
+            )
+            account.balance += obj.balance_delta
+            obj.balance_after = account.balance
+            objs.append(obj)
+
+        TransactionHistory.objects.bulk_create(objs, batch_size=batch_size)
+        record_transactions(objs)
+        evaluate_budgets(objs)
+
+        for account in accounts.values():
+            account.updated_at = now
+        Account.objects.bulk_update(accounts.values(), ['balance', 'updated_at'])
+
+        transactions_bulk_created.send(sender=TransactionHistory, transactions=objs)
+
+    return objs
+
+
+def post_transaction(account, amount, transaction_type, **fields):
+    """단건 거래 전기"""
+    return post_transactions([dict(fields, account=account, amount=amount, transaction_type=transaction_type)])[0]
+
+
+def bulk_ingest_transactions(rows, batch_size=BULK_BATCH_SIZE):
+    """거래내역 일괄 등록
+
+    TransactionHistory.save()/post_save 를 거치지 않고 post_transactions() 로 한 번에 저장한다.
+    거래는 계좌별로 거래일시 순서대로 현재 잔액 위에 적용된다.
+    """
+    started = time.perf_counter()
+    objs = post_transactions(rows, order_by_date=True, batch_size=batch_size)
+    elapsed = time.perf_counter() - started
+    return {
+        'created': len(objs),
+        'accounts': len({obj.account_id for obj in objs}),
+        'elapsed': round(elapsed, 4),
+        'rows_per_second': round(len(objs) / elapsed, 1) if elapsed else 0.0,
+    }
@@ -0,0 +1,9 @@
+from django.dispatch import Signal
+
+# 일괄 등록(bulk_create)은 post_save 를 발생시키지 않으므로 별도 시그널로 알린다.
+# kwargs: transactions (생성된 TransactionHistory 리스트)
+transactions_bulk_created = Signal()
+
+# 예산 사용률이 임계치(80%, 100% ...)를 새로 넘었을 때
+# kwargs: crossings (BudgetUsage, 넘은 임계치(%)) 리스트
+budget_thresholds_crossed = Signal()
@@ -0,0 +1,147 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from accounts.budgets import budget_spent, first_period
+from accounts.categorization import reset_categorizer
+from accounts.models import Account, Budget, BudgetUsage, CategoryRule, TransactionCategory
+from accounts.services import post_transaction, post_transactions
+from notification.models import Notification
+from notification.outbox import process_outbox
+
+User = get_user_model()
+
+
+class BudgetEvaluationTest(TestCase):
+    def setUp(self):
+        reset_categorizer()
+        self.addCleanup(reset_categorizer)
+        self.user = User.objects.create_user(
+            username="budget", email="budget@example.com", password="1234", nickname="budget", name="예산"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="910-100", bank_code="004", account_type="checking"
+        )
+        self.food = TransactionCategory.objects.create(name='예산식비', transaction_type='withdrawal')
+        CategoryRule.objects.create(category=self.food, keyword='예산식당', priority=1)
+
+    def _notifications(self):
+        process_outbox()
+        return list(Notification.objects.filter(user=self.user, notification_type='budget')
+                    .order_by('id').values_list('message', flat=True))
+
+    def test_thresholds_notify_once(self):
+        Budget.objects.create(user=self.user, period='daily', amount=Decimal('10000.00'))
+        post_transaction(self.account, Decimal('7000.00'), 'withdrawal')
+        self.assertEqual(self._notifications(), [])
+        post_transaction(self.account, Decimal('1000.00'), 'withdrawal')
+        post_transaction(self.account, Decimal('500.00'), 'withdrawal')
+        post_transaction(self.account, Decimal('5000.00'), 'deposit')
+        post_transaction(self.account, Decimal('2000.00'), 'withdrawal')
+        self.assertEqual(self._notifications(), [
+            "일 예산의 80%를 사용했습니다. (8,000.00원 / 10,000.00원)",
+            "일 예산을 모두 사용했습니다. (10,500.00원 / 10,000.00원)",
+        ])
+
+    def test_query_count_does_not_grow_with_history(self):
+        Budget.objects.create(user=self.user, period='monthly', amount=Decimal('1000000.00'))
+        post_transactions([
+            {'account': self.account, 'amount': Decimal('10.00'), 'transaction_type': 'withdrawal'}
+            for _ in range(200)
+        ])
+        with CaptureQueriesContext(connection) as queries:
+            post_transaction(self.account, Decimal('10.00'), 'withdrawal')
+        self.assertFalse([query for query in queries if 'SUM(' in query['sql'].upper()])
+
+    def test_counters_match_brute_force(self):
+        rng = random.Random(7)
+        budgets = [
+            Budget.objects.create(user=self.user, period='daily', amount=Decimal('3000.00')),
+            Budget.objects.create(user=self.user, period='weekly', amount=Decimal('20000.00')),
+            Budget.objects.create(user=self.user, period='monthly', amount=Decimal('50000.00'), category=self.food),
+        ]
+        now = timezone.now()
+        for _ in range(40):
+            post_transactions([
+                {'account': self.account, 'amount': Decimal(rng.randint(100, 900)),
+                 'transaction_type': rng.choice(['withdrawal', 'withdrawal', 'deposit']),
+                 'transaction_detail': rng.choice(['예산식당 점심', '편의점', None]),
+                 'transaction_date': now - timedelta(hours=rng.randint(0, 24 * 40))}
+                for _ in range(rng.randint(1, 5))
+            ])
+
+        expected_notifications = 0
+        for budget in budgets:
+            usages = list(BudgetUsage.objects.filter(budget=budget))
+            self.assertTrue(usages)
+            for usage in usages:
+                self.assertGreaterEqual(usage.period_start, first_period(budget))
+                self.assertEqual(usage.spent, budget_spent(budget, usage.period_start))
+                percent = usage.spent * 100 / budget.amount
+                expected_notifications += (percent >= 80) + (percent >= 100)
+            # 예산 생성 전 기간의 거래는 반영하지 않으므로 카운터 합 = 생성 기간부터의 재합산
+            self.assertEqual(sum(usage.spent for usage in usages), budget_spent(budget, first_period(budget)))
+        self.assertEqual(len(self._notifications()), expected_notifications)
+
+
+class BudgetViewTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="budgetapi", email="budgetapi@example.com", password="1234", nickname="budgetapi", name="예산"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="910-200", bank_code="004", account_type="checking"
+        )
+        self.client.force_authenticate(self.user)
+
+    def test_create_seeds_current_period(self):
+        post_transaction(self.account, Decimal('9000.00'), 'withdrawal')
+        response = self.client.post('/api/budgets/', {'period': 'monthly', 'amount': '10000.00'}, format='json')
+        self.assertEqual(response.status_code, 201)
+
+        usages = self.client.get(f"/api/budgets/{response.data['id']}/usages/").data
+        self.assertEqual(usages[0]['spent'], '9000.00')
+        self.assertEqual(usages[0]['notified_percent'], 80)
+
+        post_transaction(self.account, Decimal('1000.00'), 'withdrawal')
+        process_outbox()
+        self.assertEqual(Notification.objects.filter(user=self.user, notification_type='budget').count(), 1)
+
+    def test_update_recounts_current_period(self):
+        response = self.client.post('/api/budgets/', {'period': 'monthly', 'amount': '10000.00'}, format='json')
+        url = f"/api/budgets/{response.data['id']}/"
+
+        # 비활성 동안의 출금은 증분으로 들어오지 않으므로 다시 켤 때 합산한다
+        self.client.patch(url, {'is_active': False}, format='json')
+        post_transaction(self.account, Decimal('3000.00'), 'withdrawal')
+        self.client.patch(url, {'is_active': True}, format='json')
+        self.assertEqual(self.client.get(f'{url}usages/').data[0]['spent'], '3000.00')
+
+        food = TransactionCategory.objects.create(name='수정식비', transaction_type='withdrawal')
+        CategoryRule.objects.create(category=food, keyword='수정식당', priority=1)
+        post_transaction(self.account, Decimal('500.00'), 'withdrawal', transaction_detail='수정식당')
+        self.client.patch(url, {'category': food.pk}, format='json')
+        self.assertEqual(self.client.get(f'{url}usages/').data[0]['spent'], '500.00')
+
+    def test_amount_and_period_changes_reset_usage(self):
+        response = self.client.post('/api/budgets/', {'period': 'monthly', 'amount': '1000.00'}, format='json')
+        url = f"/api/budgets/{response.data['id']}/"
+        post_transaction(self.account, Decimal('1000.00'), 'withdrawal')
+        self.assertEqual(self.client.get(f'{url}usages/').data[0]['notified_percent'], 100)
+
+        # 금액을 올리면 알린 임계치도 새 금액 기준으로 돌아가 다시 알릴 수 있다
+        self.client.patch(url, {'amount': '5000.00'}, format='json')
+        self.assertEqual(self.client.get(f'{url}usages/').data[0]['notified_percent'], 0)
+
+        BudgetUsage.objects.create(budget_id=response.data['id'], period_start=date(2000, 1, 1))
+        self.client.patch(url, {'period': 'daily'}, format='json')
+        usages = self.client.get(f'{url}usages/').data
+        self.assertEqual(len(usages), 1)
+        self.assertEqual((usages[0]['period_start'], usages[0]['spent']), (str(timezone.localdate()), '1000.00'))
@@ -0,0 +1,113 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from accounts.budgets import start_budget
+from accounts.categorization import KeywordMatcher, categorize_transactions, reset_categorizer
+from accounts.models import Account, Budget, CategoryRule, TransactionCategory, TransactionHistory
+from accounts.services import bulk_ingest_transactions, post_transaction
+from analysis.aggregation import aggregate_categories
+from analysis.cache import get_data_version
+
+User = get_user_model()
+
+
+class KeywordMatcherTest(SimpleTestCase):
+    def setUp(self):
+        self.matcher = KeywordMatcher([
+            ('쿠팡', (100, -2), 'shopping'),
+            ('쿠팡이츠', (100, -4), 'food'),
+            ('송금', (200, -2), 'transfer'),
+            ('he', (5, -2), 'he'),
+            ('hers', (1, -4), 'hers'),
+        ])
+
+    def test_single_pass_prefers_rank(self):
+        self.assertEqual(self.matcher.match('쿠팡이츠 강남점'), 'food')
+        self.assertEqual(self.matcher.match('쿠팡 송금'), 'shopping')
+        self.assertEqual(self.matcher.match('토스 송금'), 'transfer')
+        # 실패 링크로 겹친 키워드(ushers → he, hers)도 찾는다
+        self.assertEqual(self.matcher.match('USHERS'), 'hers')
+        self.assertIsNone(self.matcher.match('편의점'))
+
+
+class CategorizationTest(TestCase):
+    def setUp(self):
+        reset_categorizer()
+        self.addCleanup(reset_categorizer)
+        self.food = TransactionCategory.objects.create(name='테스트식비', transaction_type='withdrawal')
+        self.salary = TransactionCategory.objects.create(name='테스트급여', transaction_type='deposit')
+        CategoryRule.objects.bulk_create([
+            CategoryRule(category=self.food, keyword='테스트식당', priority=1),
+            CategoryRule(category=self.salary, keyword='테스트월급', priority=1),
+        ])
+        reset_categorizer()  # bulk_create 는 post_save 를 보내지 않는다
+        self.user = User.objects.create_user(
+            username="cat", email="cat@example.com", password="1234", nickname="cat", name="분류"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="900-100", bank_code="004", account_type="checking"
+        )
+        self.day = date(2025, 9, 3)
+        self.when = timezone.make_aware(datetime.combine(self.day, time(12)))
+
+    def test_categorized_at_write_time(self):
+        single = post_transaction(self.account, Decimal("9000.00"), 'withdrawal',
+                                  transaction_detail='테스트식당 점심', transaction_date=self.when)
+        saved = TransactionHistory.objects.create(
+            account=self.account, amount=Decimal("100.00"), balance_after=Decimal("0"),
+            transaction_type='deposit', transaction_detail='9월 테스트월급', transaction_date=self.when,
+        )
+        self.assertEqual(single.category, self.food)
+        self.assertEqual(saved.category, self.salary)
+
+        # 카테고리의 거래유형과 다르면 분류하지 않는다
+        refund = post_transaction(self.account, Decimal("10.00"), 'deposit',
+                                  transaction_detail='테스트식당 환불', transaction_date=self.when)
+        self.assertIsNone(refund.category_id)
+
+    def test_backfill_and_breakdown(self):
+        bulk_ingest_transactions([
+            {'account': self.account, 'amount': Decimal(100 + i), 'transaction_type': 'withdrawal',
+             'transaction_detail': '테스트식당' if i % 2 else '기타', 'transaction_date': self.when}
+            for i in range(10)
+        ])
+        TransactionHistory.objects.update(category=None)
+
+        call_command('categorize_transactions', '--batch-size', '3', stdout=StringIO())
+        self.assertEqual(TransactionHistory.objects.filter(category=self.food).count(), 5)
+
+        breakdown = aggregate_categories(self.user, self.day, self.day, 'withdrawal')
+        self.assertEqual(breakdown, [
+            {'category': '테스트식비', 'total': Decimal('525.00'), 'count': 5},
+            {'category': '미분류', 'total': Decimal('520.00'), 'count': 5},
+        ])
+
+    def test_backfill_refreshes_analysis_version_and_category_budgets(self):
+        budget = Budget.objects.create(user=self.user, category=self.food, period='monthly', amount=Decimal('10000'))
+        start_budget(budget)
+        post_transaction(self.account, Decimal("3000.00"), 'withdrawal', transaction_detail='새분식')
+        today = timezone.localdate()
+        before = get_data_version(self.user, today, today)
+
+        CategoryRule.objects.create(category=self.food, keyword='새분식')
+        self.assertEqual(categorize_transactions()['updated'], 1)
+        self.assertNotEqual(get_data_version(self.user, today, today), before)
+        self.assertEqual(budget.usages.get().spent, Decimal('3000.00'))
+
+        # 관리자 화면처럼 한 건의 카테고리를 고쳐도 같다
+        recorded = TransactionHistory.objects.get(transaction_detail='새분식')
+        recorded.category = None
+        recorded.save()
+        self.assertEqual(budget.usages.get().spent, Decimal('0.00'))
+
+    def test_rule_change_reloads_categorizer(self):
+        post_transaction(self.account, Decimal("1.00"), 'withdrawal', transaction_detail='새가게')
+        CategoryRule.objects.create(category=self.food, keyword='새가게')
+        later = post_transaction(self.account, Decimal("1.00"), 'withdrawal', transaction_detail='새가게')
+        self.assertEqual(later.category, self.food)
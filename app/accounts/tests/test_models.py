@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import Account, DailyAccountSummary, TransactionHistory
+from accounts.rollups import verify_summaries
+from accounts.services import bulk_ingest_transactions
+
+User = get_user_model()
+
+
+class DailyAccountSummaryTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="rollup", email="rollup@example.com", password="1234",
+            nickname="rollup", name="집계"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="900-100", bank_code="004",
+            account_type="checking", balance=Decimal("1000.00")
+        )
+
+    def _create(self, amount, transaction_type, balance_after, occurred_at):
+        return TransactionHistory.objects.create(
+            account=self.account, amount=Decimal(amount), balance_after=Decimal(balance_after),
+            transaction_type=transaction_type, transaction_date=occurred_at,
+        )
+
+    def test_save_updates_rollup_by_local_day(self):
+        # 2025-09-01 23:30 KST 와 2025-09-02 00:30 KST 는 서로 다른 일자로 집계된다
+        first = timezone.make_aware(datetime(2025, 9, 1, 23, 30))
+        self._create("500.00", "deposit", "1500.00", first)
+        self._create("200.00", "withdrawal", "1300.00", first + timedelta(minutes=10))
+        self._create("100.00", "withdrawal", "1200.00", first + timedelta(hours=1))
+
+        day1 = DailyAccountSummary.objects.get(account=self.account, date=first.date())
+        self.assertEqual(day1.deposit_total, Decimal("500.00"))
+        self.assertEqual(day1.withdrawal_total, Decimal("200.00"))
+        self.assertEqual(day1.transaction_count, 2)
+        self.assertEqual(day1.closing_balance, Decimal("1300.00"))
+
+        day2 = DailyAccountSummary.objects.get(account=self.account, date=first.date() + timedelta(days=1))
+        self.assertEqual(day2.transaction_count, 1)
+        self.assertEqual(day2.closing_balance, Decimal("1200.00"))
+
+    def test_out_of_order_insert_keeps_latest_closing_balance(self):
+        late = timezone.make_aware(datetime(2025, 9, 3, 18, 0))
+        self._create("100.00", "deposit", "1100.00", late)
+        self._create("50.00", "withdrawal", "1050.00", late - timedelta(hours=5))
+
+        summary = DailyAccountSummary.objects.get(account=self.account)
+        self.assertEqual(summary.closing_balance, Decimal("1100.00"))
+        self.assertEqual(summary.transaction_count, 2)
+
+    def test_bulk_ingest_and_verify(self):
+        base = timezone.make_aware(datetime(2025, 8, 1, 12, 0))
+        bulk_ingest_transactions([
+            {'account': self.account, 'amount': Decimal("10.00"),
+             'transaction_type': 'deposit' if i % 2 else 'withdrawal',
+             'transaction_date': base + timedelta(hours=7 * i)}
+            for i in range(40)
+        ])
+        self.assertEqual(verify_summaries(), [])
+        self.assertEqual(
+            sum(DailyAccountSummary.objects.values_list('transaction_count', flat=True)), 40
+        )
+
+    def test_rebuild_command_repairs_drift(self):
+        self._create("500.00", "deposit", "1500.00", timezone.now())
+        DailyAccountSummary.objects.update(deposit_total=Decimal("1.00"))
+        self.assertTrue(verify_summaries())
+
+        call_command('rebuild_daily_summaries', stdout=StringIO())
+        self.assertEqual(verify_summaries(), [])
+
+    def test_recorded_transaction_is_immutable(self):
+        created = self._create("500.00", "deposit", "1500.00", timezone.now())
+        recorded = TransactionHistory.objects.get(pk=created.pk)
+        recorded.transaction_detail = "메모 수정"
+        recorded.save()
+
+        recorded.amount = Decimal("900.00")
+        with self.assertRaises(ValidationError):
+            recorded.save()
+        with self.assertRaises(ValidationError):
+            created.delete()
+        self.assertEqual(TransactionHistory.objects.get(pk=created.pk).amount, Decimal("500.00"))
+        self.assertEqual(verify_summaries(), [])
@@ -0,0 +1,180 @@
+import threading
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.categorization import get_categorizer, reset_categorizer
+from accounts.models import Account, TransactionHistory
+from accounts.services import bulk_ingest_transactions, post_transaction, post_transactions
+from notification.models import Notification
+from notification.outbox import process_outbox
+
+User = get_user_model()
+
+
+class BulkIngestTest(TestCase):
+    def setUp(self):
+        # 분류 규칙 적재 쿼리가 어느 호출에 잡히는지 실행 순서에 따라 달라지지 않도록 미리 적재
+        reset_categorizer()
+        self.addCleanup(reset_categorizer)
+        get_categorizer()
+        self.user = User.objects.create_user(
+            username="bulkuser", email="bulk@example.com", password="1234",
+            nickname="bulk", name="일괄"
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="111-222",
+            bank_code="004",
+            account_type="checking",
+            balance=Decimal("1000.00"),
+        )
+        self.other = Account.objects.create(
+            user=self.user,
+            account_number="333-444",
+            bank_code="088",
+            account_type="savings",
+        )
+
+    def _rows(self, count):
+        now = timezone.now()
+        rows = []
+        for i in range(count):
+            rows.append({
+                'account': self.account if i % 2 == 0 else self.other.pk,
+                'amount': Decimal("10.00"),
+                'transaction_type': 'deposit' if i % 3 else 'withdrawal',
+                'transaction_date': now - timedelta(minutes=count - i),
+                'transaction_detail': f"거래 {i}",
+            })
+        return rows
+
+    def test_balances_and_balance_after(self):
+        rows = self._rows(60)
+        result = bulk_ingest_transactions(rows)
+
+        self.assertEqual(result['created'], 60)
+        self.assertEqual(result['accounts'], 2)
+        for account in (self.account, self.other):
+            account.refresh_from_db()
+            last = TransactionHistory.objects.filter(account=account).order_by('-transaction_date').first()
+            self.assertEqual(account.balance, last.balance_after)
+
+        self.account.refresh_from_db()
+        expected = Decimal("1000.00") + sum(
+            (r['amount'] if r['transaction_type'] == 'deposit' else -r['amount'])
+            for r in rows if r['account'] == self.account
+        )
+        self.assertEqual(self.account.balance, expected)
+
+    def test_query_count_is_independent_of_row_count(self):
+        with CaptureQueriesContext(connection) as small:
+            bulk_ingest_transactions(self._rows(10))
+        with CaptureQueriesContext(connection) as large:
+            bulk_ingest_transactions(self._rows(100))
+        self.assertEqual(len(small), len(large))
+
+    def test_notifications_are_coalesced_per_user(self):
+        bulk_ingest_transactions(self._rows(30))
+        process_outbox()
+        notifications = Notification.objects.filter(user=self.user)
+        self.assertEqual(notifications.count(), 1)
+        self.assertIn("30건", notifications.get().message)
+
+
+class PostingEngineTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="poster", email="poster@example.com", password="1234",
+            nickname="poster", name="전기"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="200-300", bank_code="004",
+            account_type="checking", balance=Decimal("100.00")
+        )
+
+    def test_save_computes_balance_after_in_database(self):
+        # 메모리상의 계좌 인스턴스가 오래된 값이어도 DB 잔액 기준으로 계산된다
+        stale = Account.objects.get(pk=self.account.pk)
+        Account.objects.filter(pk=self.account.pk).update(balance=Decimal("500.00"))
+
+        item = TransactionHistory.objects.create(
+            account=stale, amount=Decimal("50.00"), balance_after=Decimal("0"),
+            transaction_type="withdrawal", transaction_date=timezone.now(),
+        )
+        self.assertEqual(item.balance_after, Decimal("450.00"))
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("450.00"))
+
+    def test_post_transactions_chains_balances(self):
+        objs = post_transactions([
+            {'account': self.account, 'amount': Decimal("30.00"), 'transaction_type': 'deposit'},
+            {'account': self.account.pk, 'amount': Decimal("10.00"), 'transaction_type': 'withdrawal'},
+        ])
+        self.assertEqual([obj.balance_after for obj in objs], [Decimal("130.00"), Decimal("120.00")])
+
+        single = post_transaction(self.account, Decimal("5.00"), 'deposit')
+        self.assertEqual(single.balance_after, Decimal("125.00"))
+        process_outbox()
+        self.assertEqual(Notification.objects.filter(user=self.user).latest("id").message, "입금 5.00원이 처리되었습니다.")
+
+
+@skipUnlessDBFeature('has_select_for_update')
+class PostingConcurrencyTest(TransactionTestCase):
+    """핫 계좌에 여러 스레드가 동시에 전기해도 잔액이 유실되지 않는지 검증"""
+
+    threads = 8
+    postings_per_thread = 40
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="hot", email="hot@example.com", password="1234", nickname="hot", name="핫"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="999-999", bank_code="004", account_type="checking"
+        )
+
+    def _worker(self, index, errors):
+        try:
+            for i in range(self.postings_per_thread):
+                if (index + i) % 2:
+                    TransactionHistory.objects.create(
+                        account=Account.objects.get(pk=self.account.pk), amount=Decimal("1.00"),
+                        balance_after=Decimal("0"), transaction_type="deposit",
+                        transaction_date=timezone.now(),
+                    )
+                else:
+                    post_transactions([
+                        {'account': self.account.pk, 'amount': Decimal("2.00"), 'transaction_type': 'deposit'},
+                        {'account': self.account.pk, 'amount': Decimal("1.00"), 'transaction_type': 'withdrawal'},
+                    ])
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    def test_concurrent_postings_keep_exact_balance(self):
+        errors = []
+        workers = [
+            threading.Thread(target=self._worker, args=(index, errors)) for index in range(self.threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(errors, [])
+
+        transactions = list(TransactionHistory.objects.filter(account=self.account).order_by('id'))
+        balance = Decimal("0.00")
+        for item in transactions:
+            balance += item.balance_delta
+            self.assertEqual(item.balance_after, balance)
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, balance)
+        self.assertEqual(balance, Decimal(self.threads * self.postings_per_thread))
@@ -0,0 +1,178 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from accounts.exports import aiterate, stream_csv
+from accounts.models import Account, TransactionHistory
+from accounts.services import bulk_ingest_transactions
+
+User = get_user_model()
+
+
+class BulkIngestViewTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="viewuser", email="view@example.com", password="1234",
+            nickname="view", name="뷰"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="555-666", bank_code="090", account_type="checking"
+        )
+        self.client.force_authenticate(self.user)
+
+    def test_bulk_ingest(self):
+        payload = {'transactions': [
+            {'account': self.account.pk, 'amount': '100.00', 'transaction_type': 'deposit',
+             'transaction_date': '2025-09-01T09:00:00+09:00'},
+            {'account': self.account.pk, 'amount': '30.00', 'transaction_type': 'withdrawal',
+             'transaction_date': '2025-09-01T10:00:00+09:00', 'detail_type': 'card_payment'},
+        ]}
+        response = self.client.post('/api/accounts/bulk-ingest/', payload, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 2)
+        self.assertIn('rows_per_second', response.data)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('70.00'))
+        self.assertEqual(TransactionHistory.objects.filter(account=self.account).count(), 2)
+
+    def test_daily_summary_range(self):
+        bulk_ingest_transactions([
+            {'account': self.account, 'amount': Decimal('10.00'), 'transaction_type': 'deposit',
+             'transaction_date': timezone.make_aware(datetime(2025, 9, day, 12, 0))}
+            for day in (1, 2, 3)
+        ])
+        url = f'/api/accounts/{self.account.pk}/daily-summary/'
+        response = self.client.get(url, {'date_from': '2025-09-02', 'date_to': '2025-09-03'})
+        self.assertEqual([row['date'] for row in response.data], ['2025-09-02'])
+        self.assertEqual(self.client.get(url, {'date_from': 'abc'}).status_code, 400)
+
+    def test_bulk_ingest_rejects_foreign_account(self):
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="1234", nickname="other", name="남"
+        )
+        foreign = Account.objects.create(
+            user=other, account_number="777-888", bank_code="090", account_type="checking"
+        )
+        payload = {'transactions': [
+            {'account': foreign.pk, 'amount': '100.00', 'transaction_type': 'deposit',
+             'transaction_date': '2025-09-01T09:00:00+09:00'},
+        ]}
+        response = self.client.post('/api/accounts/bulk-ingest/', payload, format='json')
+        self.assertEqual(response.status_code, 400)
+
+
+class TransactionListViewTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="listuser", email="list@example.com", password="1234",
+            nickname="list", name="목록"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="100-200", bank_code="090", account_type="checking"
+        )
+        base = timezone.make_aware(datetime(2025, 9, 1, 9, 0))
+        rows = []
+        for i in range(25):
+            rows.append({
+                'account': self.account,
+                # 같은 거래일시가 여러 건 있어도 id 로 순서가 결정되어야 한다
+                'transaction_date': base + timedelta(hours=i // 2),
+                'amount': Decimal(10 + i),
+                'transaction_type': 'deposit' if i % 2 else 'withdrawal',
+                'detail_type': 'card_payment' if i % 2 == 0 else 'transfer',
+            })
+        bulk_ingest_transactions(rows)
+        self.client.force_authenticate(self.user)
+
+    def test_cursor_pages_cover_all_rows_once(self):
+        seen = []
+        url = '/api/transactions/?page_size=10'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            seen.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+
+        expected = list(
+            TransactionHistory.objects.filter(account=self.account)
+            .order_by('-transaction_date', '-id').values_list('id', flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_filters(self):
+        response = self.client.get('/api/transactions/', {
+            'transaction_type': 'deposit',
+            'amount_min': '20',
+            'date_from': '2025-09-01',
+        })
+        results = response.data['results']
+        self.assertTrue(results)
+        for item in results:
+            self.assertEqual(item['transaction_type'], 'deposit')
+            self.assertGreaterEqual(Decimal(item['amount']), Decimal('20'))
+
+    def test_invalid_filter(self):
+        response = self.client.get('/api/transactions/', {'transaction_type': 'unknown'})
+        self.assertEqual(response.status_code, 400)
+
+
+class TransactionExportViewTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="export", email="export@example.com", password="1234",
+            nickname="export", name="내보내기"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="300-400", bank_code="090", account_type="checking"
+        )
+        base = timezone.make_aware(datetime(2025, 9, 1, 9, 0))
+        bulk_ingest_transactions([
+            {'account': self.account, 'transaction_date': base + timedelta(hours=i),
+             'amount': Decimal(100 + i), 'transaction_type': 'deposit' if i % 2 else 'withdrawal',
+             'transaction_detail': '식비, 점심'}
+            for i in range(7)
+        ])
+        self.client.force_authenticate(self.user)
+
+    def _content(self, response):
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_csv_export(self):
+        response = self.client.get('/api/transactions/export/', {'output': 'csv'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        rows = list(csv.reader(io.StringIO(self._content(response).lstrip('\ufeff'))))
+        self.assertEqual(rows[0][:2], ['id', 'account_number'])
+        self.assertEqual(len(rows), 8)
+        self.assertEqual(rows[1][7], '식비, 점심')
+
+    def test_ndjson_export_uses_list_filters(self):
+        response = self.client.get('/api/transactions/export/', {
+            'output': 'ndjson', 'transaction_type': 'deposit'
+        })
+        lines = [json.loads(line) for line in self._content(response).splitlines()]
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(all(line['transaction_type'] == 'deposit' for line in lines))
+        self.assertEqual(lines[0]['account_number'], '300-400')
+
+    def test_unknown_output(self):
+        response = self.client.get('/api/transactions/export/', {'output': 'xml'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_async_export_streams_same_rows(self):
+        queryset = TransactionHistory.objects.filter(account=self.account)
+
+        async def collect():
+            return [chunk async for chunk in aiterate(stream_csv(queryset), batch_size=3)]
+
+        chunks = async_to_sync(collect)()
+        self.assertEqual(len(chunks), 3)  # 헤더 포함 8줄을 3줄씩
+        self.assertEqual(''.join(chunks), ''.join(stream_csv(queryset)))
@@ -1,9 +1,20 @@
-from rest_framework import viewsets, permissions
+from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from django.db.models import Q
-from .models import Account, TransactionHistory
-from .serializers import AccountSerializer, TransactionHistorySerializer
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from .exports import EXPORT_FORMATS, aiterate
+from .filters import filter_transactions
+from .budgets import start_budget
+from .models import Account, Budget, TransactionHistory
+from .serializers import (
+    AccountSerializer, TransactionHistorySerializer, BulkTransactionIngestSerializer,
+    DailyAccountSummarySerializer, DailySummaryFilterSerializer, BudgetSerializer, BudgetUsageSerializer
+)
+from .pagination import TransactionCursorPagination
+from .services import bulk_ingest_transactions
 
 
 class AccountViewSet(viewsets.ModelViewSet):
@@ -16,18 +27,95 @@ class AccountViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @action(detail=False, methods=['post'], url_path='bulk-ingest')
+    def bulk_ingest(self, request):
+        """거래내역 일괄 등록"""
+        serializer = BulkTransactionIngestSerializer(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        result = bulk_ingest_transactions(serializer.validated_data['transactions'])
+        return Response(result, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['get'], url_path='daily-summary')
+    def daily_summary(self, request, pk=None):
+        """계좌 일별 입출금 집계 조회 (date_from 이상, date_to 미만 - 거래내역 필터와 같은 규칙)"""
+        params = DailySummaryFilterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        summaries = self.get_object().daily_summaries.all()
+        if 'date_from' in params.validated_data:
+            summaries = summaries.filter(date__gte=params.validated_data['date_from'])
+        if 'date_to' in params.validated_data:
+            summaries = summaries.filter(date__lt=params.validated_data['date_to'])
+        serializer = DailyAccountSummarySerializer(summaries, many=True)
+        return Response(serializer.data)
+
 
 class TransactionHistoryViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = TransactionHistorySerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = TransactionCursorPagination
 
     def get_queryset(self):
-        user_accounts = Account.objects.filter(user=self.request.user)
-        return TransactionHistory.objects.filter(account__in=user_accounts)
+        return TransactionHistory.objects.filter(account__user=self.request.user).select_related('account', 'category')
+
+    def filter_queryset(self, queryset):
+        if self.action in ('list', 'export'):
+            queryset = filter_transactions(queryset, self.request.query_params)
+        return queryset
 
     @action(detail=False, methods=['get'])
     def recent(self, request):
         """최근 거래내역 조회"""
         queryset = self.get_queryset()[:10]
         serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
\ No newline at end of file
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """거래내역 내보내기 (output=csv|ndjson, 목록과 같은 필터 사용)
+
+        전체를 메모리에 올리지 않고 서버 사이드 커서로 읽으며 바로 스트리밍한다.
+        ASGI 로 실행 중이면 비동기 반복자로 넘겨야 응답 전체가 버퍼링되지 않는다.
+        """
+        output = request.query_params.get('output', 'csv')
+        if output not in EXPORT_FORMATS:
+            raise ValidationError({'output': f"지원하지 않는 형식입니다: {output}"})
+        stream, content_type = EXPORT_FORMATS[output]
+
+        queryset = self.filter_queryset(self.get_queryset())
+        lines = stream(queryset)
+        if isinstance(request._request, ASGIRequest):
+            lines = aiterate(lines)
+        response = StreamingHttpResponse(lines, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="transactions.{output}"'
+        return response
+
+
+class BudgetViewSet(viewsets.ModelViewSet):
+    serializer_class = BudgetSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return Budget.objects.filter(user=self.request.user).select_related('category')
+
+    def perform_create(self, serializer):
+        start_budget(serializer.save(user=self.request.user))
+
+    def perform_update(self, serializer):
+        # 사용량 카운터는 출금 증분만 더하므로, 집계 대상(카테고리·기간)·금액이 바뀌거나 비활성 동안의
+        # 출금을 놓친 채 다시 켜지면 현재 기간을 새로 합산한다 (금액이 바뀌면 알린 임계치도 다시 정한다)
+        fields = ('category_id', 'period', 'amount', 'is_active')
+        before = {field: getattr(serializer.instance, field) for field in fields}
+        with transaction.atomic():
+            budget = serializer.save()
+            changed = {field for field in fields if getattr(budget, field) != before[field]}
+            if changed & {'category_id', 'period'}:
+                # 이전 대상으로 집계한 기간별 사용량은 새 대상과 섞이지 않게 지운다
+                budget.usages.all().delete()
+            if budget.is_active and changed:
+                start_budget(budget)
+
+    @action(detail=True, methods=['get'])
+    def usages(self, request, pk=None):
+        """예산 기간별 누적 지출 (최근 기간부터)"""
+        serializer = BudgetUsageSerializer(self.get_object().usages.all()[:24], many=True)
+        return Response(serializer.data)
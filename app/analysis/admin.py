@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Analysis
+from .models import Analysis, AnalysisBatchChunk, AnalysisRequest
 
 
 @admin.register(Analysis)
@@ -8,4 +8,19 @@ class AnalysisAdmin(admin.ModelAdmin):
     list_filter = ['analysis_period', 'period_start', 'period_end']
     search_fields = ['user__nickname', 'user__email', 'description']
     readonly_fields = ['created_at', 'updated_at']
-    date_hierarchy = 'period_start'
\ No newline at end of file
+    date_hierarchy = 'period_start'
+
+
+@admin.register(AnalysisRequest)
+class AnalysisRequestAdmin(admin.ModelAdmin):
+    list_display = ['user', 'about', 'analysis_period', 'period_start', 'period_end', 'status', 'attempts', 'created_at']
+    list_filter = ['status', 'analysis_period', 'created_at']
+    search_fields = ['user__nickname', 'user__email', 'error']
+    readonly_fields = ['created_at', 'started_at', 'finished_at']
+
+
+@admin.register(AnalysisBatchChunk)
+class AnalysisBatchChunkAdmin(admin.ModelAdmin):
+    list_display = ['target_date', 'first_user_id', 'last_user_id', 'user_count', 'analysis_count', 'finished_at']
+    list_filter = ['target_date']
+    readonly_fields = ['finished_at']
@@ -0,0 +1,204 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db.models import Count, DateField, Q, Sum
+from django.db.models.functions import Trunc
+
+from accounts.models import DailyAccountSummary, TransactionHistory
+from accounts.rollups import local_day
+
+ZERO = Decimal('0.00')
+STREAM_CHUNK_SIZE = 5000
+UNCATEGORIZED = '미분류'
+
+# 분석기간 → 버킷 단위
+BUCKET_KINDS = {
+    'daily': 'day',
+    'weekly': 'week',
+    'monthly': 'month',
+    'yearly': 'year',
+    'custom': 'day',
+}
+
+
+def _kind(bucket):
+    try:
+        return BUCKET_KINDS[bucket]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 분석기간입니다: {bucket}")
+
+
+def aggregate_summaries(user, period_start, period_end, bucket='daily'):
+    """일별 집계 테이블을 버킷 단위로 묶어 수입/지출 시계열 반환 (쿼리 1회)
+
+    일별 집계의 date 는 이미 Asia/Seoul 기준 일자이므로 주/월/연 단위 절삭만 하면 된다.
+    """
+    rows = (
+        DailyAccountSummary.objects.filter(account__user=user, date__range=(period_start, period_end))
+        .annotate(bucket=Trunc('date', _kind(bucket), output_field=DateField()))
+        .values('bucket')
+        .annotate(income=Sum('deposit_total'), expense=Sum('withdrawal_total'))
+        .order_by('bucket')
+    )
+    return list(rows)
+
+
+def aggregate_transactions(user, period_start, period_end, bucket='daily'):
+    """원본 거래내역을 DB 에서 Asia/Seoul 기준으로 절삭·조건부 합산한 수입/지출 시계열 (쿼리 1회)"""
+    tz = ZoneInfo(settings.TIME_ZONE)
+    start = datetime.combine(period_start, time.min, tzinfo=tz)
+    end = datetime.combine(period_end + timedelta(days=1), time.min, tzinfo=tz)
+    rows = (
+        TransactionHistory.objects.filter(
+            account__user=user, transaction_date__gte=start, transaction_date__lt=end
+        )
+        .annotate(bucket=Trunc('transaction_date', _kind(bucket), output_field=DateField(), tzinfo=tz))
+        .values('bucket')
+        .annotate(
+            income=Sum('amount', filter=Q(transaction_type='deposit'), default=ZERO),
+            expense=Sum('amount', filter=Q(transaction_type='withdrawal'), default=ZERO),
+        )
+        .order_by('bucket')
+    )
+    return list(rows)
+
+
+def aggregate_categories(user, period_start, period_end, transaction_type):
+    """기간 내 거래를 카테고리별로 합산 (쿼리 1회, 금액 큰 순) - 카테고리가 없으면 '미분류'"""
+    tz = ZoneInfo(settings.TIME_ZONE)
+    start = datetime.combine(period_start, time.min, tzinfo=tz)
+    end = datetime.combine(period_end + timedelta(days=1), time.min, tzinfo=tz)
+    rows = (
+        TransactionHistory.objects.filter(
+            account__user=user, transaction_type=transaction_type,
+            transaction_date__gte=start, transaction_date__lt=end,
+        )
+        .values('category__name')
+        .annotate(total=Sum('amount'), count=Count('id'))
+        .order_by('-total', 'category__name')
+    )
+    return [
+        {'category': row['category__name'] or UNCATEGORIZED, 'total': row['total'], 'count': row['count']}
+        for row in rows
+    ]
+
+
+def aggregate_category_days(user_ids, period_start, period_end):
+    """여러 사용자의 기간 내 거래를 (일자, 거래유형, 카테고리)별로 합산 (쿼리 1회)
+
+    일괄 분석이 청크 전체를 한 번에 읽고 사용자·기간별 카테고리 내역은 fold_categories 로
+    메모리에서 만든다. 반환값: {사용자 ID: [(일자, 거래유형, 카테고리명, 합계, 건수)]}
+    """
+    tz = ZoneInfo(settings.TIME_ZONE)
+    start = datetime.combine(period_start, time.min, tzinfo=tz)
+    end = datetime.combine(period_end + timedelta(days=1), time.min, tzinfo=tz)
+    rows = (
+        TransactionHistory.objects.filter(
+            account__user_id__in=user_ids, transaction_date__gte=start, transaction_date__lt=end
+        )
+        .annotate(day=Trunc('transaction_date', 'day', output_field=DateField(), tzinfo=tz))
+        .values('account__user_id', 'day', 'transaction_type', 'category__name')
+        .annotate(total=Sum('amount'), count=Count('id'))
+        .order_by()
+    )
+    by_user = {}
+    for row in rows:
+        by_user.setdefault(row['account__user_id'], []).append(
+            (row['day'], row['transaction_type'], row['category__name'], row['total'], row['count'])
+        )
+    return by_user
+
+
+def fold_categories(rows, period_start, period_end, transaction_type):
+    """aggregate_category_days 의 한 사용자 행을 aggregate_categories 와 같은 형태로 합산"""
+    totals = {}
+    for day, type_, name, total, count in rows:
+        if type_ != transaction_type or not period_start <= day <= period_end:
+            continue
+        entry = totals.setdefault(name or UNCATEGORIZED, [ZERO, 0])
+        entry[0] += total
+        entry[1] += count
+    return [
+        {'category': name, 'total': total, 'count': count}
+        for name, (total, count) in sorted(totals.items(), key=lambda item: (-item[1][0], item[0]))
+    ]
+
+
+def stream_transactions(user, period_start, period_end, bucket='daily', chunk_size=STREAM_CHUNK_SIZE):
+    """원본 거래내역을 서버 측 커서로 chunk_size 행씩 읽어 버킷별로 접어 가며 하나씩 반환 (제너레이터)
+
+    거래일시 순으로 읽으므로 버킷이 끝나는 즉시 내보내고 버린다. 메모리는 행 수와 무관하게
+    현재 버킷 하나와 계좌별 마지막 잔액만 든다. 각 버킷은 aggregate_transactions 의 항목에
+    건수(count), 최소/최대 거래금액(min_amount/max_amount), 버킷 종료 시점 잔액(closing_balance,
+    기간 중 거래가 있었던 계좌들의 잔액 합)을 더한 형태다.
+    """
+    tz = ZoneInfo(settings.TIME_ZONE)
+    start = datetime.combine(period_start, time.min, tzinfo=tz)
+    end = datetime.combine(period_end + timedelta(days=1), time.min, tzinfo=tz)
+    rows = (
+        TransactionHistory.objects.filter(
+            account__user=user, transaction_date__gte=start, transaction_date__lt=end
+        )
+        .order_by('transaction_date', 'id')
+        .values_list('account_id', 'transaction_date', 'transaction_type', 'amount', 'balance_after')
+        .iterator(chunk_size=chunk_size)
+    )
+
+    balances = {}
+    current = None
+    for account_id, occurred_at, transaction_type, amount, balance_after in rows:
+        key = truncate_date(local_day(occurred_at), bucket)
+        if current is None or current['bucket'] != key:
+            if current is not None:
+                current['closing_balance'] = sum(balances.values(), ZERO)
+                yield current
+            current = {
+                'bucket': key, 'income': ZERO, 'expense': ZERO, 'count': 0,
+                'min_amount': amount, 'max_amount': amount, 'closing_balance': ZERO,
+            }
+        current['income' if transaction_type == 'deposit' else 'expense'] += amount
+        current['count'] += 1
+        current['min_amount'] = min(current['min_amount'], amount)
+        current['max_amount'] = max(current['max_amount'], amount)
+        balances[account_id] = balance_after
+    if current is not None:
+        current['closing_balance'] = sum(balances.values(), ZERO)
+        yield current
+
+
+def truncate_date(day, bucket='daily'):
+    """일자를 버킷 시작일로 절삭 (DB 의 Trunc 와 같은 규칙 - 주는 월요일 시작)"""
+    kind = _kind(bucket)
+    if kind == 'week':
+        return day - timedelta(days=day.weekday())
+    if kind == 'month':
+        return day.replace(day=1)
+    if kind == 'year':
+        return day.replace(month=1, day=1)
+    return day
+
+
+def bucket_daily_rows(rows, bucket='daily'):
+    """(일자, 수입, 지출) 행을 버킷 단위로 묶어 aggregate_summaries 와 같은 형태의 시계열 반환
+
+    여러 사용자의 일별 집계를 한 번에 읽어 온 뒤 사용자별로 시계열을 만들 때 쓴다.
+    """
+    buckets = {}
+    for day, income, expense in rows:
+        row = buckets.setdefault(truncate_date(day, bucket), {'income': ZERO, 'expense': ZERO})
+        row['income'] += income
+        row['expense'] += expense
+    return [{'bucket': key, **buckets[key]} for key in sorted(buckets)]
+
+
+def summarize(series):
+    """시계열로부터 총수입/총지출/저축금액 계산"""
+    income = sum((row['income'] for row in series), ZERO)
+    expense = sum((row['expense'] for row in series), ZERO)
+    return {
+        'total_income': income,
+        'total_expense': expense,
+        'savings_amount': income - expense,
+    }
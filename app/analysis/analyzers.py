@@ -1,59 +1,67 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import os
-from django.conf import settings
-from accounts.models import TransactionHistory
+from .aggregation import aggregate_categories, aggregate_summaries, fold_categories, summarize
 from .models import Analysis
-from io import BytesIO
+from .rendering import BAR_COLORS, render_bar_chart
+import hashlib
 from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 
 class Analyzer:
-    def __init__(self, user, about, type_, period_start, period_end):
+    def __init__(self, user, about, type_, period_start, period_end, image_format="png"):
         self.user = user
         self.about = about
         self.type = type_
         self.period_start = period_start
         self.period_end = period_end
+        self.image_format = image_format
 
-    def run(self):
-        # 1. 거래내역 가져오기
-        qs = TransactionHistory.objects.filter(
-            account__user=self.user,
-            transaction_date__range=[self.period_start, self.period_end]
-        )
+    def run(self, series=None, category_days=None):
+        # 1. 기간 내 수입/지출을 DB 에서 버킷 단위로 집계 (버킷별 시계열만 가져옴)
+        #    일괄 분석처럼 여러 사용자를 한 번에 집계한 경우 미리 만든 시계열과
+        #    카테고리별 일자 합계(aggregate_category_days)를 넘겨받아 쿼리를 생략한다
+        if series is None:
+            series = aggregate_summaries(self.user, self.period_start, self.period_end, self.type)
 
-        if not qs.exists():
+        if not series:
             raise ValueError("해당 기간에 거래내역이 없습니다.")
 
-        # 2. DataFrame 생성
-        data = list(qs.values("transaction_date", "amount", "transaction_type"))
-        df = pd.DataFrame(data)
-
-        # 3. 시각화
-        plt.figure(figsize=(6, 4))
-        if self.about == "총 지출":
-            df_expense = df[df["transaction_type"] == "withdrawal"]
-            df_expense.groupby(df_expense["transaction_date"].dt.date)["amount"].sum().plot(kind="bar")
-            plt.title("총 지출 분석")
-        elif self.about == "총 수입":
-            df_income = df[df["transaction_type"] == "deposit"]
-            df_income.groupby(df_income["transaction_date"].dt.date)["amount"].sum().plot(kind="bar")
-            plt.title("총 수입 분석")
-
-        # 4. 이미지 저장 (메모리 → FileField)
-        buffer = BytesIO()
-        plt.savefig(buffer, format="png")
-        buffer.seek(0)
+        totals = summarize(series)
+        column = "expense" if self.about == "총 지출" else "income"
+        transaction_type = "withdrawal" if column == "expense" else "deposit"
+        if category_days is None:
+            breakdown = aggregate_categories(self.user, self.period_start, self.period_end, transaction_type)
+        else:
+            breakdown = fold_categories(category_days, self.period_start, self.period_end, transaction_type)
+
+        # 2. 시각화 (pyplot 전역 상태 없이 렌더링)
+        content = render_bar_chart(
+            labels=[row["bucket"].isoformat() for row in series],
+            values=[float(row[column]) for row in series],
+            title=f"{self.about} 분석",
+            image_format=self.image_format,
+            color=BAR_COLORS[column],
+        )
 
+        # 3. 이미지 저장 (내용 해시로 이름을 정해 같은 이미지는 파일 하나를 공유)
         analysis = Analysis.objects.create(
             user=self.user,
             about=self.about,
-            type=self.type,
+            analysis_period=self.type,
             period_start=self.period_start,
             period_end=self.period_end,
             description=f"{self.about} 분석 결과",
+            category_breakdown=breakdown,
+            **totals,
         )
-        analysis.result_image.save(f"analysis_{analysis.id}.png", ContentFile(buffer.read()), save=True)
-        buffer.close()
+        analysis.result_image.name = self._store_image(content, self.image_format)
+        analysis.save(update_fields=["result_image", "updated_at"])
 
         return analysis
+
+    @staticmethod
+    def _store_image(content, extension):
+        """이미지를 내용 주소(sha256) 경로에 저장하고 저장된 이름 반환"""
+        digest = hashlib.sha256(content).hexdigest()
+        name = f"analysis/{digest[:2]}/{digest}.{extension}"
+        if default_storage.exists(name):
+            return name
+        return default_storage.save(name, ContentFile(content))
@@ -0,0 +1,91 @@
+from bisect import bisect_right
+from collections import defaultdict
+
+from django.contrib.auth import get_user_model
+
+from accounts.models import DailyAccountSummary
+from .aggregation import aggregate_category_days, bucket_daily_rows, truncate_date
+from .cache import format_data_version, run_cached_analysis
+from .models import Analysis, AnalysisBatchChunk
+
+# 야간 일괄 분석으로 미리 만들어 두는 분석기간
+NIGHTLY_PERIODS = ['daily', 'weekly', 'monthly']
+
+
+def nightly_periods(target_date):
+    """기준일의 분석기간별 (시작일, 종료일) - 일: 당일, 주/월: 해당 주/월 시작일부터 기준일까지"""
+    return {type_: (truncate_date(target_date, type_), target_date) for type_ in NIGHTLY_PERIODS}
+
+
+def pending_user_ids(target_date):
+    """기준일 일괄 분석에서 아직 처리되지 않은 활성 사용자 ID 목록 (ID 순)"""
+    done = list(
+        AnalysisBatchChunk.objects.filter(target_date=target_date)
+        .order_by('first_user_id').values_list('first_user_id', 'last_user_id')
+    )
+    starts = [first for first, _ in done]
+
+    def is_done(user_id):
+        index = bisect_right(starts, user_id) - 1
+        return index >= 0 and user_id <= done[index][1]
+
+    user_ids = get_user_model().objects.filter(is_active=True).order_by('pk').values_list('pk', flat=True)
+    return [user_id for user_id in user_ids.iterator() if not is_done(user_id)]
+
+
+def split_chunks(user_ids, chunk_size):
+    """사용자 ID 목록을 chunk_size 개씩 나누기"""
+    return [user_ids[index:index + chunk_size] for index in range(0, len(user_ids), chunk_size)]
+
+
+def run_chunk(target_date, user_ids):
+    """사용자 청크의 일/주/월 분석 생성 후 진행 기록 저장
+
+    청크 전체의 일별 집계와 카테고리별 일자 합계를 각각 쿼리 한 번으로 읽어 사용자·기간별
+    시계열, 데이터 버전, 카테고리 내역을 메모리에서 만들므로 사용자마다 집계 쿼리를 보내지 않는다.
+    반환값: {'users', 'created', 'hits'}
+    """
+    periods = nightly_periods(target_date)
+    earliest = min(start for start, _ in periods.values())
+    users = get_user_model().objects.in_bulk(user_ids)
+
+    rows_by_user = defaultdict(list)
+    summaries = DailyAccountSummary.objects.filter(
+        account__user_id__in=user_ids, date__range=(earliest, target_date)
+    ).values_list('account__user_id', 'date', 'deposit_total', 'withdrawal_total', 'transaction_count', 'updated_at')
+    for user_id, *row in summaries:
+        rows_by_user[user_id].append(row)
+    categories = aggregate_category_days(user_ids, earliest, target_date)
+
+    created = hits = 0
+    for user_id in user_ids:
+        rows = rows_by_user.get(user_id)
+        if not rows or user_id not in users:
+            continue
+        for type_, (start, end) in periods.items():
+            in_period = [row for row in rows if start <= row[0] <= end]
+            if not in_period:
+                continue
+            series = bucket_daily_rows(
+                [(day, income, expense) for day, income, expense, _, _ in in_period], type_
+            )
+            version = format_data_version(
+                len(in_period),
+                sum(row[3] for row in in_period),
+                max(row[4] for row in in_period),
+            )
+            for about, _ in Analysis.ABOUT_CHOICES:
+                _, hit = run_cached_analysis(
+                    users[user_id], about, type_, start, end, series=series, data_version=version,
+                    category_days=categories.get(user_id, []),
+                )
+                hits += hit
+                created += not hit
+
+    AnalysisBatchChunk.objects.update_or_create(
+        target_date=target_date,
+        first_user_id=user_ids[0],
+        defaults={'last_user_id': user_ids[-1], 'user_count': len(user_ids), 'analysis_count': created},
+    )
+    return {'users': len(user_ids), 'created': created, 'hits': hits}
+
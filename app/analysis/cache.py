@@ -0,0 +1,63 @@
+import hashlib
+
+from django.db.models import Count, F, Max, Sum
+
+from accounts.models import DailyAccountSummary
+from .analyzers import Analyzer
+from .models import Analysis
+
+
+def make_cache_key(user, about, type_, period_start, period_end):
+    """(사용자, 분석대상, 분석기간, 시작일, 종료일) 캐시 키"""
+    raw = f"{user.pk}|{about}|{type_}|{period_start.isoformat()}|{period_end.isoformat()}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def format_data_version(rows, transactions, updated):
+    """데이터 버전 문자열 - (일별 집계 행 수, 거래 건수, 최종 수정일시)"""
+    return f"{rows}:{transactions or 0}:{updated.isoformat() if updated else '-'}"
+
+
+def get_data_version(user, period_start, period_end):
+    """기간 내 거래 데이터 버전 - 해당 기간의 일별 집계가 바뀌면 함께 바뀐다"""
+    stats = DailyAccountSummary.objects.filter(
+        account__user=user, date__range=(period_start, period_end)
+    ).aggregate(rows=Count('id'), transactions=Sum('transaction_count'), updated=Max('updated_at'))
+    return format_data_version(stats['rows'], stats['transactions'], stats['updated'])
+
+
+def run_cached_analysis(user, about, type_, period_start, period_end, series=None, data_version=None,
+                        category_days=None):
+    """캐시를 거쳐 분석 실행
+
+    같은 조건·같은 데이터 버전의 분석이 있으면 그대로 반환하고,
+    없으면 Analyzer 로 새로 만든다. 반환값: (Analysis, hit)
+    series/data_version/category_days 를 넘기면 집계·버전·카테고리 조회 쿼리를 생략한다.
+    """
+    key = make_cache_key(user, about, type_, period_start, period_end)
+    version = data_version if data_version is not None else get_data_version(user, period_start, period_end)
+
+    cached = Analysis.objects.filter(user=user, cache_key=key, data_version=version).first()
+    if cached is not None:
+        Analysis.objects.filter(pk=cached.pk).update(hit_count=F('hit_count') + 1)
+        return cached, True
+
+    analysis = Analyzer(user, about, type_, period_start, period_end).run(series, category_days)
+    analysis.cache_key = key
+    analysis.data_version = version
+    analysis.save(update_fields=['cache_key', 'data_version', 'updated_at'])
+    return analysis, False
+
+
+def cache_stats(user=None):
+    """캐시 적중/미스 횟수 - 미스는 캐시 키로 새로 만들어진 분석 수"""
+    queryset = Analysis.objects.exclude(cache_key='')
+    if user is not None:
+        queryset = queryset.filter(user=user)
+    stats = queryset.aggregate(misses=Count('id'), hits=Sum('hit_count'))
+    hits, misses = stats['hits'] or 0, stats['misses']
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / (hits + misses), 4) if hits + misses else None,
+    }
@@ -0,0 +1,112 @@
+import statistics
+from datetime import timedelta
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from .cache import run_cached_analysis
+from .models import AnalysisRequest
+from .signals import analysis_request_finished
+
+
+def enqueue_analysis(user, about, type_, period_start, period_end):
+    """분석 요청 등록 - 같은 조건의 요청이 대기/처리중이면 그 요청을 반환
+
+    반환값: (AnalysisRequest, created)
+    """
+    lookup = {
+        'user': user,
+        'about': about,
+        'analysis_period': type_,
+        'period_start': period_start,
+        'period_end': period_end,
+    }
+    try:
+        with transaction.atomic():
+            return AnalysisRequest.objects.create(**lookup), True
+    except IntegrityError:
+        existing = AnalysisRequest.objects.filter(status__in=AnalysisRequest.ACTIVE_STATUSES, **lookup).first()
+        if existing is None:  # 그 사이 처리가 끝난 경우
+            return enqueue_analysis(user, about, type_, period_start, period_end)
+        return existing, False
+
+
+def claim_next():
+    """대기 중인 요청 하나를 처리중으로 가져오기 (없으면 None)
+
+    SKIP LOCKED 로 다른 워커가 잡은 행은 건너뛰므로 워커끼리 기다리지 않는다.
+    """
+    skip_locked = connection.features.has_select_for_update_skip_locked
+    with transaction.atomic():
+        queryset = AnalysisRequest.objects.filter(status='pending').order_by('created_at', 'id')
+        if skip_locked:
+            queryset = queryset.select_for_update(skip_locked=True)
+        job = queryset.first()
+        if job is None:
+            return None
+        job.status = 'running'
+        job.started_at = timezone.now()
+        job.attempts += 1
+        job.save(update_fields=['status', 'started_at', 'attempts'])
+    return job
+
+
+def run_request(job):
+    """분석 요청 처리 후 완료/실패 알림 시그널 발송"""
+    try:
+        job.analysis, _ = run_cached_analysis(
+            user=job.user,
+            about=job.about,
+            type_=job.analysis_period,
+            period_start=job.period_start,
+            period_end=job.period_end,
+        )
+        job.status = 'done'
+        job.error = ''
+    except Exception as exc:
+        job.status = 'failed'
+        job.error = str(exc)
+    job.finished_at = timezone.now()
+    job.save(update_fields=['analysis', 'status', 'error', 'finished_at'])
+    analysis_request_finished.send(sender=AnalysisRequest, analysis_request=job)
+    return job
+
+
+def requeue_stale(timeout_seconds):
+    """처리중 상태로 오래 남은 요청(워커 비정상 종료)을 다시 대기 상태로"""
+    cutoff = timezone.now() - timedelta(seconds=timeout_seconds)
+    return AnalysisRequest.objects.filter(status='running', started_at__lt=cutoff).update(
+        status='pending', started_at=None
+    )
+
+
+def queue_stats(window_minutes=60):
+    """큐 상태 및 최근 처리량/대기시간 지표"""
+    counts = dict(AnalysisRequest.objects.values_list('status').annotate(count=Count('id')))
+    since = timezone.now() - timedelta(minutes=window_minutes)
+    finished = list(
+        AnalysisRequest.objects.filter(finished_at__gte=since, started_at__isnull=False)
+        .values_list('created_at', 'started_at', 'finished_at')
+    )
+    latencies = sorted((started - created).total_seconds() for created, started, _ in finished)
+    durations = sorted((done - started).total_seconds() for _, started, done in finished)
+    oldest = (
+        AnalysisRequest.objects.filter(status='pending').order_by('created_at')
+        .values_list('created_at', flat=True).first()
+    )
+
+    def percentile(values, ratio):
+        return values[min(len(values) - 1, int(len(values) * ratio))] if values else None
+
+    return {
+        'counts': {status: counts.get(status, 0) for status, _ in AnalysisRequest.STATUS_CHOICES},
+        'oldest_pending_seconds': (timezone.now() - oldest).total_seconds() if oldest else None,
+        'window_minutes': window_minutes,
+        'finished': len(finished),
+        'throughput_per_minute': round(len(finished) / window_minutes, 2),
+        'queue_latency_p50': statistics.median(latencies) if latencies else None,
+        'queue_latency_p95': percentile(latencies, 0.95),
+        'run_time_p50': statistics.median(durations) if durations else None,
+        'run_time_p95': percentile(durations, 0.95),
+    }
@@ -0,0 +1,15 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from analysis.jobs import queue_stats
+
+
+class Command(BaseCommand):
+    help = '분석 요청 큐의 상태별 건수, 처리량, 대기시간 지표를 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--window', type=int, default=60, help='처리량/대기시간 집계 구간(분)')
+
+    def handle(self, *args, **options):
+        self.stdout.write(json.dumps(queue_stats(options['window']), ensure_ascii=False, indent=2))
@@ -0,0 +1,86 @@
+import time
+import tracemalloc
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from accounts.models import Account, TransactionHistory
+from accounts.rollups import local_day
+from accounts.services import bulk_ingest_transactions
+from analysis.aggregation import (
+    aggregate_summaries, aggregate_transactions, bucket_daily_rows, stream_transactions,
+)
+
+
+def materialize(user, period_start, period_end, bucket):
+    """비교용 - 기간 내 모든 거래를 리스트로 읽은 뒤 묶는 기존 방식"""
+    rows = list(
+        TransactionHistory.objects.filter(
+            account__user=user, transaction_date__date__range=(period_start, period_end)
+        ).values_list('transaction_date', 'transaction_type', 'amount')
+    )
+    return bucket_daily_rows(
+        [(local_day(occurred_at), amount if type_ == 'deposit' else Decimal('0'),
+          amount if type_ == 'withdrawal' else Decimal('0')) for occurred_at, type_, amount in rows],
+        bucket,
+    )
+
+
+class Command(BaseCommand):
+    help = '긴 사용자정의 기간 분석에서 집계 방식별 소요 시간과 최대 메모리를 비교합니다. (임시 데이터 생성 후 삭제)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000)
+        parser.add_argument('--bucket', choices=['daily', 'weekly', 'monthly'], default='daily')
+        parser.add_argument('--chunk-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.create_user(
+            username=f'bench-{uuid.uuid4().hex[:8]}', email=f'{uuid.uuid4().hex}@bench.local',
+            nickname=f'bench-{uuid.uuid4().hex[:8]}', name='벤치마크'
+        )
+        try:
+            account = Account.objects.create(
+                user=user, account_number='BENCH-AGG', bank_code='000', account_type='checking'
+            )
+            start, end = self._seed(account, options['rows'])
+            self.stdout.write(f"{options['rows']:,}행, {start} ~ {end} ({options['bucket']} 버킷)")
+            methods = [
+                ('전체 적재 후 집계', lambda: materialize(user, start, end, options['bucket'])),
+                ('스트리밍 집계', lambda: list(stream_transactions(
+                    user, start, end, options['bucket'], chunk_size=options['chunk_size']
+                ))),
+                ('DB 집계(원본)', lambda: aggregate_transactions(user, start, end, options['bucket'])),
+                ('DB 집계(일별 집계)', lambda: aggregate_summaries(user, start, end, options['bucket'])),
+            ]
+            for name, method in methods:
+                self._measure(name, method)
+        finally:
+            user.delete()
+
+    def _seed(self, account, rows):
+        # 2분 간격 → 100만 건이면 약 3.8년치 거래
+        base = timezone.now() - timedelta(minutes=2 * rows)
+        for start in range(0, rows, 10000):
+            bulk_ingest_transactions([
+                {'account': account, 'amount': Decimal(1 + i % 97),
+                 'transaction_type': 'deposit' if i % 3 == 0 else 'withdrawal',
+                 'transaction_date': base + timedelta(minutes=2 * i)}
+                for i in range(start, min(start + 10000, rows))
+            ])
+        return local_day(base), local_day(base + timedelta(minutes=2 * rows))
+
+    def _measure(self, name, method):
+        tracemalloc.start()
+        started = time.perf_counter()
+        series = method()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.stdout.write(
+            f'  {name:<16} {elapsed:>7.2f}초  Python 최대 할당 {peak / 1024 / 1024:>8.1f}MB  버킷 {len(series):,}개'
+        )
@@ -0,0 +1,52 @@
+import os
+import resource
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from analysis.rendering import render_bar_chart
+
+
+def current_rss_mb():
+    """현재 RSS(MB) - /proc 가 없으면 최대 RSS 로 대체"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Command(BaseCommand):
+    help = '분석 차트 렌더링 처리량(렌더/초)과 반복 렌더링 중 RSS 변화를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=10000)
+        parser.add_argument('--threads', type=int, default=4)
+        parser.add_argument('--format', dest='image_format', choices=['png', 'svg'], default='png')
+        parser.add_argument('--bars', type=int, default=31, help='차트당 막대 수')
+
+    def handle(self, *args, **options):
+        labels = [f'2025-08-{day:02d}' for day in range(1, options['bars'] + 1)]
+        count = options['count']
+        checkpoints = max(1, count // 10)
+
+        def render(index):
+            values = [float((index * 7 + day * 13) % 500) for day in range(len(labels))]
+            return len(render_bar_chart(labels, values, '총 지출 분석', image_format=options['image_format']))
+
+        render(0)  # 글꼴 탐색 등 첫 호출 비용 제외
+        self.stdout.write(f'시작 RSS {current_rss_mb():.1f}MB')
+        total_bytes = 0
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['threads']) as pool:
+            for done, size in enumerate(pool.map(render, range(count)), start=1):
+                total_bytes += size
+                if done % checkpoints == 0:
+                    self.stdout.write(f'  {done:>7,}회  RSS {current_rss_mb():.1f}MB')
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{count:,}회 {options['image_format']} 렌더링 (스레드 {options['threads']}): "
+            f"{elapsed:.2f}초, {count / elapsed:,.1f}렌더/초, 평균 {total_bytes / count / 1024:.1f}KB"
+        ))
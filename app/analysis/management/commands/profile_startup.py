@@ -0,0 +1,49 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from config.startup import profile_startup
+
+
+class Command(BaseCommand):
+    help = '새 프로세스에서 Django 기동 시간·RSS 와 앱/모듈별 import 시간을 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--settings-module', default=None, help='측정할 설정 모듈 (기본: 현재 설정)')
+        parser.add_argument('--top', type=int, default=15, help='출력할 느린 모듈 수')
+        parser.add_argument('--json', action='store_true', help='결과를 JSON 으로 출력')
+        parser.add_argument('--check', action='store_true', help='기동 예산(STARTUP_BUDGET)을 넘으면 실패')
+
+    def handle(self, *args, **options):
+        result = profile_startup(options['settings_module'] or settings.SETTINGS_MODULE, options['top'])
+        budget = settings.STARTUP_BUDGET
+
+        if options['json']:
+            self.stdout.write(json.dumps(result, ensure_ascii=False, indent=2))
+        else:
+            self.stdout.write(
+                f"기동 {result['seconds']:.3f}초 (예산 {budget['seconds']}초), "
+                f"RSS {result['rss_mb']:.1f}MB (예산 {budget['rss_mb']}MB)"
+            )
+            self.stdout.write('그룹별 import 시간:')
+            for group, seconds in result['groups'].items():
+                self.stdout.write(f'  {group:<16}{seconds * 1000:>9.1f}ms')
+            self.stdout.write('누적 import 시간이 긴 모듈:')
+            for module in result['slowest_modules']:
+                self.stdout.write(
+                    f"  {module['module']:<48}{module['cumulative'] * 1000:>9.1f}ms (자체 {module['self'] * 1000:.1f}ms)"
+                )
+            if result['heavy_modules']:
+                self.stdout.write(self.style.WARNING(f"기동 중 불러온 무거운 모듈: {', '.join(result['heavy_modules'])}"))
+
+        if options['check']:
+            over = []
+            if result['seconds'] > budget['seconds']:
+                over.append(f"기동 {result['seconds']:.3f}초 > {budget['seconds']}초")
+            if result['rss_mb'] > budget['rss_mb']:
+                over.append(f"RSS {result['rss_mb']:.1f}MB > {budget['rss_mb']}MB")
+            if result['heavy_modules']:
+                over.append(f"무거운 모듈 import: {', '.join(result['heavy_modules'])}")
+            if over:
+                raise CommandError('기동 예산 초과 - ' + ', '.join(over))
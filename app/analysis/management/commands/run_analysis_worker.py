@@ -0,0 +1,81 @@
+import logging
+import multiprocessing
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+logger = logging.getLogger(__name__)
+
+
+def _work(poll_interval, once, max_jobs, verbosity, own_connections=False):
+    """워커 본체 - 요청을 하나씩 가져와 처리
+
+    own_connections 가 참이면 별도 프로세스로 보고 DB 연결을 스스로 관리한다.
+    """
+    import django
+    django.setup()
+    from analysis.jobs import claim_next, run_request
+
+    if verbosity > 1 and not logger.handlers:
+        # 자식 프로세스에도 처리 로그가 보이도록 프로세스 이름을 붙여 표준 오류로 내보낸다
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('[%(processName)s] %(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+
+    processed = 0
+    try:
+        while max_jobs is None or processed < max_jobs:
+            if own_connections:
+                close_old_connections()
+            job = claim_next()
+            if job is None:
+                if once:
+                    break
+                time.sleep(poll_interval)
+                continue
+            started = time.perf_counter()
+            run_request(job)
+            processed += 1
+            logger.info(
+                '요청 %s %s (대기 %.2f초, 처리 %.2f초)',
+                job.pk, job.status, job.queue_latency, time.perf_counter() - started,
+            )
+    finally:
+        if own_connections:
+            connections.close_all()
+    return processed
+
+
+class Command(BaseCommand):
+    help = '대기 중인 분석 요청(AnalysisRequest)을 처리하는 워커를 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=1, help='워커 프로세스 수')
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='대기열이 비었을 때 재조회 간격(초)')
+        parser.add_argument('--once', action='store_true', help='대기열을 비우면 종료')
+        parser.add_argument('--max-jobs', type=int, default=None, help='워커당 최대 처리 건수')
+        parser.add_argument('--stale-after', type=int, default=600,
+                            help='이 시간(초) 이상 처리중인 요청은 다시 대기열로 되돌림')
+
+    def handle(self, *args, **options):
+        from analysis.jobs import requeue_stale
+
+        requeued = requeue_stale(options['stale_after'])
+        if requeued:
+            self.stdout.write(f'멈춘 요청 {requeued}건을 다시 대기열에 넣었습니다.')
+
+        args = (options['poll_interval'], options['once'], options['max_jobs'], options['verbosity'])
+        started = time.perf_counter()
+        if options['workers'] <= 1:
+            processed = _work(*args)
+        else:
+            # 자식 프로세스가 부모의 DB 연결을 공유하지 않도록 먼저 닫는다
+            connections.close_all()
+            with multiprocessing.Pool(options['workers']) as pool:
+                processed = sum(pool.starmap(_work, [args + (True,)] * options['workers']))
+        elapsed = time.perf_counter() - started
+
+        rate = processed / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(f'분석 요청 {processed}건 처리 ({elapsed:.2f}초, {rate:.1f}건/초)'))
@@ -0,0 +1,70 @@
+import multiprocessing
+import os
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.utils import timezone
+
+
+def _init_worker():
+    """워커 프로세스 초기화 - 부모에게서 물려받은 연결을 버리고 워커 전용 연결 하나를 계속 쓴다"""
+    import django
+    django.setup()
+    connections.close_all()
+
+
+def _run_chunk(task):
+    from analysis.batch import run_chunk
+    return run_chunk(*task)
+
+
+class Command(BaseCommand):
+    help = '활성 사용자 전체의 일/주/월 분석을 프로세스 풀로 미리 생성합니다. 중단되면 남은 사용자부터 이어서 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', type=date.fromisoformat, default=None, help='기준일 (YYYY-MM-DD, 기본: 어제)')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='워커 프로세스 수')
+        parser.add_argument('--chunk-size', type=int, default=200, help='청크당 사용자 수')
+        parser.add_argument('--fresh', action='store_true', help='기준일의 진행 기록을 지우고 처음부터 실행')
+
+    def handle(self, *args, **options):
+        from analysis.batch import pending_user_ids, split_chunks
+        from analysis.models import AnalysisBatchChunk
+
+        target_date = options['date'] or timezone.localdate() - timedelta(days=1)
+        if options['fresh']:
+            AnalysisBatchChunk.objects.filter(target_date=target_date).delete()
+
+        chunks = split_chunks(pending_user_ids(target_date), options['chunk_size'])
+        total_users = sum(len(chunk) for chunk in chunks)
+        self.stdout.write(f'{target_date} 기준 일괄 분석: 사용자 {total_users:,}명, 청크 {len(chunks):,}개')
+
+        users = created = hits = 0
+        started = time.perf_counter()
+
+        def report(result):
+            nonlocal users, created, hits
+            users += result['users']
+            created += result['created']
+            hits += result['hits']
+            if options['verbosity'] > 1:
+                elapsed = time.perf_counter() - started
+                self.stdout.write(f'  {users:>9,}/{total_users:,}명  {users / elapsed:,.1f}명/초')
+
+        if options['workers'] <= 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                report(_run_chunk((target_date, chunk)))
+        else:
+            # 자식 프로세스가 부모의 DB 연결을 공유하지 않도록 먼저 닫는다
+            connections.close_all()
+            with multiprocessing.Pool(options['workers'], initializer=_init_worker) as pool:
+                for result in pool.imap_unordered(_run_chunk, [(target_date, chunk) for chunk in chunks]):
+                    report(result)
+        elapsed = time.perf_counter() - started
+
+        rate = users / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'사용자 {users:,}명 처리: 분석 {created:,}건 생성, {hits:,}건 재사용 ({elapsed:.2f}초, {rate:,.1f}명/초)'
+        ))
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-18 20:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analysis", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="analysis",
+            name="about",
+            field=models.CharField(blank=True, max_length=50, verbose_name="분석대상"),
+        ),
+        migrations.AddField(
+            model_name="analysis",
+            name="result_image",
+            field=models.ImageField(
+                blank=True,
+                null=True,
+                upload_to="analysis/",
+                verbose_name="분석결과이미지",
+            ),
+        ),
+    ]
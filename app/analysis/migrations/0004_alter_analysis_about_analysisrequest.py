@@ -0,0 +1,150 @@
+# Generated by Django 5.2.5 on 2026-10-18 20:37
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analysis", "0003_analysis_about_analysis_result_image"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="analysis",
+            name="about",
+            field=models.CharField(
+                blank=True,
+                choices=[("총 지출", "총 지출"), ("총 수입", "총 수입")],
+                max_length=50,
+                verbose_name="분석대상",
+            ),
+        ),
+        migrations.CreateModel(
+            name="AnalysisRequest",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "about",
+                    models.CharField(
+                        choices=[("총 지출", "총 지출"), ("총 수입", "총 수입")],
+                        max_length=50,
+                        verbose_name="분석대상",
+                    ),
+                ),
+                (
+                    "analysis_period",
+                    models.CharField(
+                        choices=[
+                            ("daily", "일"),
+                            ("weekly", "주"),
+                            ("monthly", "월"),
+                            ("yearly", "년"),
+                            ("custom", "사용자정의"),
+                        ],
+                        max_length=20,
+                        verbose_name="분석기간",
+                    ),
+                ),
+                ("period_start", models.DateField(verbose_name="분석시작일")),
+                ("period_end", models.DateField(verbose_name="분석종료일")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기"),
+                            ("running", "처리중"),
+                            ("done", "완료"),
+                            ("failed", "실패"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                        verbose_name="상태",
+                    ),
+                ),
+                ("error", models.TextField(blank=True, verbose_name="오류")),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="시도횟수"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="요청일시"),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="시작일시"
+                    ),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="완료일시"
+                    ),
+                ),
+                (
+                    "analysis",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="requests",
+                        to="analysis.analysis",
+                        verbose_name="분석결과",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="analysis_requests",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "분석 요청",
+                "verbose_name_plural": "분석 요청들",
+                "db_table": "analysis_requests",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "created_at"],
+                        name="analysis_re_status_a92932_idx",
+                    ),
+                    models.Index(
+                        fields=["user", "created_at"],
+                        name="analysis_re_user_id_50c2d9_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("status__in", ["pending", "running"])),
+                        fields=(
+                            "user",
+                            "about",
+                            "analysis_period",
+                            "period_start",
+                            "period_end",
+                        ),
+                        name="unique_active_analysis_request",
+                    )
+                ],
+            },
+        ),
+    ]
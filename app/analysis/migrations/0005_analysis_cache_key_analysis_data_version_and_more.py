@@ -0,0 +1,38 @@
+# Generated by Django 5.2.5 on 2026-10-18 20:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analysis", "0004_alter_analysis_about_analysisrequest"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="analysis",
+            name="cache_key",
+            field=models.CharField(blank=True, max_length=64, verbose_name="캐시키"),
+        ),
+        migrations.AddField(
+            model_name="analysis",
+            name="data_version",
+            field=models.CharField(
+                blank=True, max_length=100, verbose_name="데이터버전"
+            ),
+        ),
+        migrations.AddField(
+            model_name="analysis",
+            name="hit_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="캐시적중횟수"),
+        ),
+        migrations.AddIndex(
+            model_name="analysis",
+            index=models.Index(
+                fields=["user", "cache_key"], name="analysis_user_id_90802e_idx"
+            ),
+        ),
+    ]
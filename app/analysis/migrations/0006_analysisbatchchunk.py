@@ -0,0 +1,54 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analysis", "0005_analysis_cache_key_analysis_data_version_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnalysisBatchChunk",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("target_date", models.DateField(verbose_name="기준일")),
+                ("first_user_id", models.BigIntegerField(verbose_name="시작사용자ID")),
+                ("last_user_id", models.BigIntegerField(verbose_name="끝사용자ID")),
+                (
+                    "user_count",
+                    models.PositiveIntegerField(default=0, verbose_name="사용자수"),
+                ),
+                (
+                    "analysis_count",
+                    models.PositiveIntegerField(default=0, verbose_name="생성분석수"),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="완료일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "일괄 분석 청크",
+                "verbose_name_plural": "일괄 분석 청크들",
+                "db_table": "analysis_batch_chunks",
+                "ordering": ["target_date", "first_user_id"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("target_date", "first_user_id"),
+                        name="unique_analysis_batch_chunk",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:25
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analysis", "0006_analysisbatchchunk"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="analysis",
+            name="category_breakdown",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                verbose_name="카테고리별내역",
+            ),
+        ),
+    ]
@@ -1,4 +1,6 @@
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models import Q
 from django.conf import settings
 from decimal import Decimal
 
@@ -13,6 +15,11 @@ class Analysis(models.Model):
         ('custom', '사용자정의'),
     ]
 
+    ABOUT_CHOICES = [
+        ('총 지출', '총 지출'),
+        ('총 수입', '총 수입'),
+    ]
+
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -42,6 +49,37 @@ class Analysis(models.Model):
         choices=PERIOD_CHOICES,
         verbose_name='분석기간'
     )
+    about = models.CharField(
+        max_length=50,
+        choices=ABOUT_CHOICES,
+        blank=True,
+        verbose_name='분석대상'
+    )
+    result_image = models.ImageField(
+        upload_to='analysis/',
+        null=True, blank=True,
+        verbose_name='분석결과이미지'
+    )
+    category_breakdown = models.JSONField(
+        default=list,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+        verbose_name='카테고리별내역'
+    )
+    cache_key = models.CharField(
+        max_length=64,
+        blank=True,
+        verbose_name='캐시키'
+    )
+    data_version = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name='데이터버전'
+    )
+    hit_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='캐시적중횟수'
+    )
     ai_analysis = models.TextField(
         null=True, blank=True,
         verbose_name='AI분석결과'
@@ -76,6 +114,7 @@ class Analysis(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', 'period_start', 'period_end']),
+            models.Index(fields=['user', 'cache_key']),
             models.Index(fields=['period_start']),
             models.Index(fields=['period_end']),
             models.Index(fields=['created_at']),
@@ -89,4 +128,139 @@ class Analysis(models.Model):
         """저축률 계산"""
         if self.total_income > 0:
             return (self.savings_amount / self.total_income) * 100
-        return 0
\ No newline at end of file
+        return 0
+
+
+class AnalysisRequest(models.Model):
+    """분석 요청 모델 - 워커가 처리하는 DB 기반 작업 큐"""
+    STATUS_CHOICES = [
+        ('pending', '대기'),
+        ('running', '처리중'),
+        ('done', '완료'),
+        ('failed', '실패'),
+    ]
+    ACTIVE_STATUSES = ['pending', 'running']
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='analysis_requests',
+        verbose_name='사용자'
+    )
+    about = models.CharField(
+        max_length=50,
+        choices=Analysis.ABOUT_CHOICES,
+        verbose_name='분석대상'
+    )
+    analysis_period = models.CharField(
+        max_length=20,
+        choices=Analysis.PERIOD_CHOICES,
+        verbose_name='분석기간'
+    )
+    period_start = models.DateField(
+        verbose_name='분석시작일'
+    )
+    period_end = models.DateField(
+        verbose_name='분석종료일'
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='pending',
+        verbose_name='상태'
+    )
+    analysis = models.ForeignKey(
+        Analysis,
+        on_delete=models.SET_NULL,
+        null=True, blank=True,
+        related_name='requests',
+        verbose_name='분석결과'
+    )
+    error = models.TextField(
+        blank=True,
+        verbose_name='오류'
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='시도횟수'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='요청일시'
+    )
+    started_at = models.DateTimeField(
+        null=True, blank=True,
+        verbose_name='시작일시'
+    )
+    finished_at = models.DateTimeField(
+        null=True, blank=True,
+        verbose_name='완료일시'
+    )
+
+    class Meta:
+        db_table = 'analysis_requests'
+        verbose_name = '분석 요청'
+        verbose_name_plural = '분석 요청들'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['user', 'created_at']),
+        ]
+        constraints = [
+            # 같은 조건의 요청이 대기/처리중이면 새로 만들지 않는다
+            models.UniqueConstraint(
+                fields=['user', 'about', 'analysis_period', 'period_start', 'period_end'],
+                condition=Q(status__in=['pending', 'running']),
+                name='unique_active_analysis_request',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user.nickname}의 {self.about} 분석 요청 ({self.get_status_display()})"
+
+    @property
+    def queue_latency(self):
+        """요청부터 처리 시작까지 대기 시간(초)"""
+        if self.started_at:
+            return (self.started_at - self.created_at).total_seconds()
+        return None
+
+
+class AnalysisBatchChunk(models.Model):
+    """야간 일괄 분석 진행 기록 - 처리가 끝난 사용자 구간(청크)을 남겨 중단 후 이어서 실행"""
+    target_date = models.DateField(
+        verbose_name='기준일'
+    )
+    first_user_id = models.BigIntegerField(
+        verbose_name='시작사용자ID'
+    )
+    last_user_id = models.BigIntegerField(
+        verbose_name='끝사용자ID'
+    )
+    user_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='사용자수'
+    )
+    analysis_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='생성분석수'
+    )
+    finished_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='완료일시'
+    )
+
+    class Meta:
+        db_table = 'analysis_batch_chunks'
+        verbose_name = '일괄 분석 청크'
+        verbose_name_plural = '일괄 분석 청크들'
+        ordering = ['target_date', 'first_user_id']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['target_date', 'first_user_id'],
+                name='unique_analysis_batch_chunk',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.target_date} 일괄 분석 (사용자 {self.first_user_id}~{self.last_user_id})"
@@ -0,0 +1,74 @@
+from functools import lru_cache
+from io import BytesIO
+
+# matplotlib 은 import 만으로 수백 ms·수십 MB 가 들기 때문에 실제로 렌더링할 때 불러온다
+# (JSON 만 처리하는 API 워커나 관리 명령은 matplotlib 을 전혀 불러오지 않음)
+
+# 한글 제목/라벨을 위해 우선 사용할 글꼴 (설치된 첫 글꼴 사용)
+KOREAN_FONT_FAMILIES = [
+    'AppleGothic', 'Apple SD Gothic Neo', 'NanumGothic', 'Malgun Gothic',
+    'Noto Sans CJK KR', 'Noto Sans KR',
+]
+IMAGE_FORMATS = {
+    # 실행 시각 등이 들어가지 않게 메타데이터를 고정해 같은 입력이면 같은 바이트가 나오도록 한다
+    'png': {'Software': None},
+    'svg': {'Date': None, 'Creator': None},
+}
+# SVG clip-path 등의 id 를 만들 때 쓰는 고정 salt - 없으면 렌더링마다 id 가 달라진다
+SVG_HASH_SALT = 'analysis.rendering'
+BAR_COLORS = {
+    'income': '#2E7D32',
+    'expense': '#C62828',
+}
+
+
+@lru_cache(maxsize=None)
+def configure_matplotlib():
+    """프로세스당 한 번 전역 설정 고정
+
+    svg.hashsalt 는 Figure 별로 줄 수 없고, rc_context 는 끝날 때 값을 되돌리므로 스레드 풀에서
+    동시에 저장 중인 다른 렌더링이 되돌린 값을 볼 수 있다. 항상 같은 값이므로 전역에 한 번 설정한다.
+    """
+    import matplotlib
+
+    matplotlib.rcParams['svg.hashsalt'] = SVG_HASH_SALT
+
+
+@lru_cache(maxsize=None)
+def get_font_properties(size=None):
+    """한글 글꼴 FontProperties (프로세스당 한 번만 글꼴 목록 탐색)"""
+    from matplotlib import font_manager
+
+    installed = {font.name for font in font_manager.fontManager.ttflist}
+    for family in KOREAN_FONT_FAMILIES:
+        if family in installed:
+            return font_manager.FontProperties(family=family, size=size)
+    return font_manager.FontProperties(size=size)
+
+
+def render_bar_chart(labels, values, title, image_format='png', color=None, figsize=(6, 4), dpi=100):
+    """막대 차트를 그려 이미지 바이트로 반환
+
+    pyplot 의 전역 상태를 쓰지 않고 호출마다 독립된 Figure/캔버스를 만들므로
+    스레드 풀에서 동시에 호출해도 안전하며, 함수가 끝나면 Figure 가 바로 해제된다.
+    """
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"지원하지 않는 이미지 형식입니다: {image_format}")
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    configure_matplotlib()
+    figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+    axes.bar(labels, values, color=color)
+    axes.set_title(title, fontproperties=get_font_properties(13))
+    axes.tick_params(axis='x', labelrotation=90)
+    for label in axes.get_xticklabels() + axes.get_yticklabels():
+        label.set_fontproperties(get_font_properties(8))
+    figure.tight_layout()
+
+    buffer = BytesIO()
+    figure.savefig(buffer, format=image_format, metadata=IMAGE_FORMATS[image_format])
+    return buffer.getvalue()
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Analysis
+from .models import Analysis, AnalysisRequest
 
 
 class AnalysisSerializer(serializers.ModelSerializer):
@@ -9,7 +9,25 @@ class AnalysisSerializer(serializers.ModelSerializer):
         model = Analysis
         fields = [
             'id', 'total_income', 'total_expense', 'savings_amount',
-            'analysis_period', 'ai_analysis', 'description',
+            'analysis_period', 'about', 'result_image', 'category_breakdown', 'ai_analysis', 'description',
             'period_start', 'period_end', 'savings_rate', 'created_at'
         ]
-        read_only_fields = ['id', 'created_at']
\ No newline at end of file
+        read_only_fields = ['id', 'result_image', 'category_breakdown', 'created_at']
+
+
+class AnalysisRequestSerializer(serializers.ModelSerializer):
+    queue_latency = serializers.ReadOnlyField()
+
+    class Meta:
+        model = AnalysisRequest
+        fields = [
+            'id', 'about', 'analysis_period', 'period_start', 'period_end',
+            'status', 'analysis', 'error', 'queue_latency',
+            'created_at', 'started_at', 'finished_at'
+        ]
+        read_only_fields = ['id', 'status', 'analysis', 'error', 'created_at', 'started_at', 'finished_at']
+
+    def validate(self, attrs):
+        if attrs['period_start'] > attrs['period_end']:
+            raise serializers.ValidationError("분석시작일은 분석종료일보다 늦을 수 없습니다.")
+        return attrs
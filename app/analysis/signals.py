@@ -0,0 +1,4 @@
+from django.dispatch import Signal
+
+# 분석 요청 처리가 끝났을 때 (완료/실패) - kwargs: analysis_request
+analysis_request_finished = Signal()
@@ -0,0 +1,68 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import Account
+from accounts.services import bulk_ingest_transactions
+from analysis.aggregation import aggregate_summaries, aggregate_transactions, stream_transactions, summarize
+
+User = get_user_model()
+
+
+class AggregationTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="agg", email="agg@example.com", password="1234", nickname="agg", name="집계"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="800-100", bank_code="004", account_type="checking"
+        )
+        base = timezone.make_aware(datetime(2025, 8, 25, 23, 30))  # KST 기준
+        bulk_ingest_transactions([
+            {'account': self.account, 'amount': Decimal(10 + i),
+             'transaction_type': 'deposit' if i % 3 == 0 else 'withdrawal',
+             'transaction_date': base + timedelta(hours=5 * i)}
+            for i in range(120)
+        ])
+        self.start, self.end = date(2025, 8, 25), date(2025, 9, 30)
+
+    def test_rollup_and_raw_sources_agree(self):
+        for bucket in ('daily', 'weekly', 'monthly', 'yearly'):
+            with self.subTest(bucket=bucket):
+                self.assertEqual(
+                    aggregate_summaries(self.user, self.start, self.end, bucket),
+                    aggregate_transactions(self.user, self.start, self.end, bucket),
+                )
+
+    def test_days_are_cut_in_seoul_time(self):
+        series = aggregate_transactions(self.user, self.start, self.start, 'daily')
+        # 23:30 KST 거래 한 건만 8/25 에 속한다 (UTC 로 절삭하면 다음 거래도 섞인다)
+        self.assertEqual(series, [{'bucket': self.start, 'income': Decimal('10'), 'expense': Decimal('0')}])
+
+    def test_single_query_and_totals(self):
+        with self.assertNumQueries(1):
+            series = aggregate_summaries(self.user, self.start, self.end, 'monthly')
+        self.assertEqual([row['bucket'] for row in series], [date(2025, 8, 1), date(2025, 9, 1)])
+        totals = summarize(series)
+        self.assertEqual(totals['savings_amount'], totals['total_income'] - totals['total_expense'])
+        self.assertEqual(totals['total_income'] + totals['total_expense'], sum(Decimal(10 + i) for i in range(120)))
+
+    def test_streaming_matches_database_aggregation(self):
+        for bucket in ('daily', 'weekly', 'monthly', 'custom'):
+            with self.subTest(bucket=bucket):
+                streamed = list(stream_transactions(self.user, self.start, self.end, bucket, chunk_size=7))
+                self.assertEqual(
+                    [{key: row[key] for key in ('bucket', 'income', 'expense')} for row in streamed],
+                    aggregate_transactions(self.user, self.start, self.end, bucket),
+                )
+                self.assertEqual(sum(row['count'] for row in streamed), 120)
+
+    def test_streaming_accumulators(self):
+        streamed = list(stream_transactions(self.user, self.start, self.end, 'monthly'))
+        self.assertEqual([(row['min_amount'], row['max_amount']) for row in streamed],
+                         [(Decimal(10), Decimal(10 + 28)), (Decimal(10 + 29), Decimal(10 + 119))])
+        self.account.refresh_from_db()
+        self.assertEqual(streamed[-1]['closing_balance'], self.account.balance)
@@ -1,15 +1,17 @@
-from django.test import TestCase
+import tempfile
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
-from app.accounts.models import Account, TransactionHistory
+from accounts.models import Account, TransactionHistory
 from decimal import Decimal
 from django.utils import timezone
 from datetime import timedelta
-from app.analysis.analyzers import Analyzer
-from app.analysis.models import Analysis
+from analysis.analyzers import Analyzer
+from analysis.models import Analysis
 
 User = get_user_model()
 
 
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
 class AnalyzerTest(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(username="testuser", password="1234")
@@ -57,3 +59,16 @@ class AnalyzerTest(TestCase):
         self.assertEqual(analysis.user, self.user)
         self.assertEqual(analysis.about, "총 지출")
         self.assertTrue(analysis.result_image.name.endswith(".png"))
+
+    def test_analyzer_fills_totals(self):
+        analysis = Analyzer(
+            user=self.user,
+            about="총 수입",
+            type_="daily",
+            period_start=self.period_start,
+            period_end=self.period_end,
+        ).run()
+
+        self.assertEqual(analysis.total_income, Decimal("500.00"))
+        self.assertEqual(analysis.total_expense, Decimal("200.00"))
+        self.assertEqual(analysis.savings_amount, Decimal("300.00"))
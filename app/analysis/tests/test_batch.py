@@ -0,0 +1,87 @@
+import json
+import tempfile
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import Account
+from accounts.services import post_transaction
+from analysis.aggregation import aggregate_categories, aggregate_summaries
+from analysis.batch import nightly_periods, run_chunk
+from analysis.cache import get_data_version
+from analysis.models import Analysis, AnalysisBatchChunk
+
+User = get_user_model()
+
+TARGET = date(2025, 9, 10)  # 수요일
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class NightlyBatchTest(TestCase):
+    def setUp(self):
+        self.users = [self._user(index) for index in range(3)]
+        for index, user in enumerate(self.users[:2]):
+            account = Account.objects.create(
+                user=user, account_number=f"800-{index}", bank_code="004", account_type="checking"
+            )
+            for days_ago, amount, type_ in [(0, "1000.00", 'deposit'), (1, "300.00", 'withdrawal'),
+                                            (5, "70.00", 'withdrawal')]:
+                when = timezone.make_aware(datetime.combine(TARGET - timedelta(days=days_ago), time(12)))
+                post_transaction(account, Decimal(amount) + index, type_, transaction_date=when)
+
+    def _user(self, index):
+        return User.objects.create_user(
+            username=f"batch{index}", email=f"batch{index}@example.com", password="1234",
+            nickname=f"batch{index}", name="일괄"
+        )
+
+    def _run(self, *args):
+        call_command('run_nightly_analysis', '--date', TARGET.isoformat(), '--workers', '1',
+                     '--chunk-size', '2', *args, stdout=StringIO())
+
+    def test_chunk_series_match_per_user_aggregation(self):
+        run_chunk(TARGET, [user.pk for user in self.users])
+        user = self.users[1]
+        for type_, (start, end) in nightly_periods(TARGET).items():
+            analysis = Analysis.objects.get(user=user, about="총 지출", analysis_period=type_)
+            series = aggregate_summaries(user, start, end, type_)
+            self.assertEqual(analysis.total_expense, sum(row['expense'] for row in series))
+            self.assertEqual(analysis.data_version, get_data_version(user, start, end))
+
+    def test_chunk_breakdown_matches_per_user_query(self):
+        run_chunk(TARGET, [user.pk for user in self.users])
+        for user in self.users[:2]:
+            for type_, (start, end) in nightly_periods(TARGET).items():
+                analysis = Analysis.objects.get(user=user, about="총 지출", analysis_period=type_)
+                expected = aggregate_categories(user, start, end, 'withdrawal')
+                self.assertEqual(analysis.category_breakdown, json.loads(json.dumps(expected, cls=DjangoJSONEncoder)))
+
+    def test_batch_creates_analyses_once(self):
+        self._run()
+        # 거래내역이 있는 2명 x (일/주/월) x (총 지출/총 수입)
+        self.assertEqual(Analysis.objects.count(), 12)
+        self.assertFalse(Analysis.objects.filter(user=self.users[2]).exists())
+        self.assertEqual(AnalysisBatchChunk.objects.filter(target_date=TARGET).count(), 2)
+        monthly = Analysis.objects.get(user=self.users[0], about="총 지출", analysis_period='monthly')
+        self.assertEqual((monthly.period_start, monthly.total_expense), (date(2025, 9, 1), Decimal("370.00")))
+
+        self._run()
+        self.assertEqual(Analysis.objects.count(), 12)
+
+    def test_resumes_after_interruption(self):
+        run_chunk(TARGET, [self.users[0].pk])
+        self._run()
+        self.assertEqual(Analysis.objects.filter(user=self.users[1]).count(), 6)
+        self.assertEqual(Analysis.objects.filter(user=self.users[0]).count(), 6)
+        # 첫 사용자는 이미 처리된 청크라 다시 돌지 않는다
+        self.assertEqual(Analysis.objects.filter(hit_count__gt=0).count(), 0)
+
+        self._run('--fresh')
+        self.assertEqual(Analysis.objects.count(), 12)
+        self.assertEqual(Analysis.objects.filter(hit_count__gt=0).count(), 12)
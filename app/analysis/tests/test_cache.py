@@ -0,0 +1,70 @@
+import tempfile
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import Account
+from accounts.services import post_transaction
+from analysis.cache import cache_stats, run_cached_analysis
+from analysis.models import Analysis
+
+User = get_user_model()
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class AnalysisCacheTest(TestCase):
+    def setUp(self):
+        self.today = timezone.localdate()
+        self.start = self.today - timedelta(days=6)
+        self.user, self.account = self._user_with_history('a')
+
+    def _user_with_history(self, suffix):
+        user = User.objects.create_user(
+            username=f"cache{suffix}", email=f"cache{suffix}@example.com", password="1234",
+            nickname=f"cache{suffix}", name="캐시"
+        )
+        account = Account.objects.create(
+            user=user, account_number=f"600-{suffix}", bank_code="004", account_type="checking"
+        )
+        noon = timezone.make_aware(datetime.combine(self.today, time(12)))
+        post_transaction(account, Decimal("1000.00"), 'deposit', transaction_date=noon - timedelta(days=2))
+        post_transaction(account, Decimal("250.00"), 'withdrawal', transaction_date=noon - timedelta(days=1))
+        return user, account
+
+    def _run(self, user=None):
+        return run_cached_analysis(user or self.user, "총 지출", "daily", self.start, self.today)
+
+    def test_repeat_request_hits_cache(self):
+        first, hit = self._run()
+        self.assertFalse(hit)
+        second, hit = self._run()
+        self.assertTrue(hit)
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(Analysis.objects.filter(user=self.user).count(), 1)
+        self.assertEqual(cache_stats(self.user), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+
+    def test_new_transaction_in_range_invalidates(self):
+        first, _ = self._run()
+        post_transaction(self.account, Decimal("10.00"), 'withdrawal', transaction_date=timezone.now())
+        second, hit = self._run()
+        self.assertFalse(hit)
+        self.assertNotEqual(first.pk, second.pk)
+        self.assertEqual(second.total_expense, Decimal("260.00"))
+
+    def test_transaction_outside_range_keeps_cache(self):
+        self._run()
+        post_transaction(
+            self.account, Decimal("10.00"), 'withdrawal', transaction_date=timezone.now() - timedelta(days=30)
+        )
+        _, hit = self._run()
+        self.assertTrue(hit)
+
+    def test_identical_charts_share_one_file(self):
+        other, _ = self._user_with_history('b')
+        mine, _ = self._run()
+        theirs, _ = self._run(other)
+        self.assertNotEqual(mine.pk, theirs.pk)
+        self.assertEqual(mine.result_image.name, theirs.result_image.name)
@@ -0,0 +1,88 @@
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from accounts.models import Account, TransactionHistory
+from analysis.jobs import enqueue_analysis, queue_stats
+from analysis.models import AnalysisRequest
+from notification.models import Notification
+
+User = get_user_model()
+
+
+def create_user_with_transactions(suffix):
+    user = User.objects.create_user(
+        username=f"job{suffix}", email=f"job{suffix}@example.com", password="1234",
+        nickname=f"job{suffix}", name="작업"
+    )
+    account = Account.objects.create(
+        user=user, account_number=f"700-{suffix}", bank_code="004", account_type="checking"
+    )
+    TransactionHistory.objects.create(
+        account=account, amount=Decimal("300.00"), balance_after=Decimal("0"),
+        transaction_type="withdrawal", transaction_date=timezone.now(),
+    )
+    return user
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class AnalysisQueueTest(TestCase):
+    def setUp(self):
+        self.user = create_user_with_transactions(1)
+        self.today = timezone.localdate()
+
+    def test_identical_pending_requests_are_deduplicated(self):
+        first, created = enqueue_analysis(self.user, "총 지출", "weekly", self.today - timedelta(days=7), self.today)
+        second, created_again = enqueue_analysis(self.user, "총 지출", "weekly", self.today - timedelta(days=7), self.today)
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertEqual(first.pk, second.pk)
+
+    def test_worker_drains_queue_and_notifies(self):
+        enqueue_analysis(self.user, "총 지출", "weekly", self.today - timedelta(days=7), self.today)
+        enqueue_analysis(self.user, "총 수입", "monthly", self.today - timedelta(days=60), self.today - timedelta(days=30))
+
+        call_command('run_analysis_worker', '--once', stdout=StringIO())
+
+        done = AnalysisRequest.objects.get(about="총 지출")
+        failed = AnalysisRequest.objects.get(about="총 수입")
+        self.assertEqual(done.status, 'done')
+        self.assertIsNotNone(done.analysis)
+        self.assertEqual(failed.status, 'failed')
+        self.assertEqual(Notification.objects.filter(user=self.user, notification_type='analysis').count(), 2)
+
+        stats = queue_stats()
+        self.assertEqual(stats['counts']['pending'], 0)
+        self.assertEqual(stats['finished'], 2)
+        self.assertIsNotNone(stats['queue_latency_p50'])
+
+        # 완료된 뒤에는 같은 조건으로 다시 요청할 수 있다
+        _, created = enqueue_analysis(self.user, "총 지출", "weekly", self.today - timedelta(days=7), self.today)
+        self.assertTrue(created)
+
+
+class AnalysisRequestViewTest(APITestCase):
+    def setUp(self):
+        self.user = create_user_with_transactions(2)
+        self.client.force_authenticate(self.user)
+
+    def test_request_and_poll(self):
+        payload = {'about': '총 지출', 'analysis_period': 'daily',
+                   'period_start': '2025-09-01', 'period_end': '2025-09-01'}
+        response = self.client.post('/api/analysis/request/', payload, format='json')
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data['status'], 'pending')
+
+        again = self.client.post('/api/analysis/request/', payload, format='json')
+        self.assertEqual(again.status_code, 200)
+        self.assertEqual(again.data['id'], response.data['id'])
+
+        poll = self.client.get(f"/api/analysis-requests/{response.data['id']}/")
+        self.assertEqual(poll.data['status'], 'pending')
@@ -0,0 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import SimpleTestCase
+
+from analysis.rendering import render_bar_chart
+
+
+class RenderingTest(SimpleTestCase):
+    labels = ['2025-09-01', '2025-09-02', '2025-09-03']
+
+    def test_png_and_svg(self):
+        png = render_bar_chart(self.labels, [1.0, 2.0, 3.0], '총 지출 분석')
+        svg = render_bar_chart(self.labels, [1.0, 2.0, 3.0], '총 지출 분석', image_format='svg')
+        self.assertTrue(png.startswith(b'\x89PNG'))
+        self.assertIn(b'<svg', svg)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            render_bar_chart(self.labels, [1.0, 2.0, 3.0], '총 지출 분석', image_format='gif')
+
+    def test_concurrent_renders_are_deterministic(self):
+        def render(index):
+            values = [float(index % 3), 2.0, 3.0]
+            return render_bar_chart(self.labels, values, '총 수입 분석', image_format='svg' if index % 2 else 'png')
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(render, range(48)))
+        for index, content in enumerate(results):
+            self.assertEqual(content, results[index % 6])
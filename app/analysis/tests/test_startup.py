@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from config.startup import HEAVY_MODULES, profile_startup
+
+
+class StartupBudgetTest(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.result = profile_startup(settings.SETTINGS_MODULE)
+
+    def test_heavy_analytics_modules_are_not_imported(self):
+        self.assertEqual(self.result['heavy_modules'], [], f'기동 시 불러오면 안 되는 모듈: {HEAVY_MODULES}')
+
+    def test_cold_start_within_budget(self):
+        self.assertLessEqual(self.result['seconds'], settings.STARTUP_BUDGET['seconds'])
+        self.assertLessEqual(self.result['rss_mb'], settings.STARTUP_BUDGET['rss_mb'])
+
+    def test_reports_app_groups(self):
+        for group in ['settings', 'users', 'accounts', 'analysis', 'notification']:
+            self.assertIn(group, self.result['groups'])
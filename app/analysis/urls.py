@@ -1,9 +1,10 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import AnalysisViewSet
+from .views import AnalysisViewSet, AnalysisRequestViewSet
 
 router = DefaultRouter()
 router.register(r'analysis', AnalysisViewSet, basename='analysis')
+router.register(r'analysis-requests', AnalysisRequestViewSet, basename='analysis-request')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -1,8 +1,10 @@
-from rest_framework import viewsets, permissions
+from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from .models import Analysis
-from .serializers import AnalysisSerializer
+from .cache import cache_stats as analysis_cache_stats
+from .jobs import enqueue_analysis
+from .models import Analysis, AnalysisRequest
+from .serializers import AnalysisSerializer, AnalysisRequestSerializer
 
 
 class AnalysisViewSet(viewsets.ModelViewSet):
@@ -15,6 +17,28 @@ class AnalysisViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @action(detail=False, methods=['post'], url_path='request')
+    def enqueue(self, request):
+        """분석 요청 등록 - 워커가 처리하며 완료되면 분석알림이 생성된다"""
+        serializer = AnalysisRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        job, created = enqueue_analysis(
+            user=request.user,
+            about=serializer.validated_data['about'],
+            type_=serializer.validated_data['analysis_period'],
+            period_start=serializer.validated_data['period_start'],
+            period_end=serializer.validated_data['period_end'],
+        )
+        return Response(
+            AnalysisRequestSerializer(job).data,
+            status=status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK
+        )
+
+    @action(detail=False, methods=['get'], url_path='cache-stats')
+    def cache_stats(self, request):
+        """분석 결과 캐시 적중/미스 횟수"""
+        return Response(analysis_cache_stats(request.user))
+
     @action(detail=False, methods=['get'])
     def latest(self, request):
         """최신 분석 결과 조회"""
@@ -22,4 +46,13 @@ class AnalysisViewSet(viewsets.ModelViewSet):
         if latest_analysis:
             serializer = self.get_serializer(latest_analysis)
             return Response(serializer.data)
-        return Response({'message': '분석 결과가 없습니다.'})
\ No newline at end of file
+        return Response({'message': '분석 결과가 없습니다.'})
+
+
+class AnalysisRequestViewSet(viewsets.ReadOnlyModelViewSet):
+    """분석 요청 상태 조회"""
+    serializer_class = AnalysisRequestSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return AnalysisRequest.objects.filter(user=self.request.user)
@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import Notification
+from django.db import transaction
+from django.db.models import Count
+from .counters import adjust_unread_counts, mark_read
+from .models import Notification, NotificationCounter, NotificationOutbox
 
 
 @admin.register(Notification)
@@ -11,7 +14,30 @@ class NotificationAdmin(admin.ModelAdmin):
     actions = ['mark_as_read']
 
     def mark_as_read(self, request, queryset):
-        for notification in queryset:
-            notification.mark_as_read()
-        self.message_user(request, f'{queryset.count()}개의 알림을 읽음으로 표시했습니다.')
-    mark_as_read.short_description = '선택된 알림을 읽음으로 표시'
\ No newline at end of file
+        updated = mark_read(queryset)
+        self.message_user(request, f'{updated}개의 알림을 읽음으로 표시했습니다.')
+    mark_as_read.short_description = '선택된 알림을 읽음으로 표시'
+
+    def delete_queryset(self, request, queryset):
+        unread = dict(
+            queryset.filter(is_read=False).order_by().values('user_id').annotate(count=Count('id'))
+            .values_list('user_id', 'count')
+        )
+        with transaction.atomic():
+            super().delete_queryset(request, queryset)
+            adjust_unread_counts({user_id: -count for user_id, count in unread.items()})
+
+
+@admin.register(NotificationCounter)
+class NotificationCounterAdmin(admin.ModelAdmin):
+    list_display = ['user', 'unread_count', 'updated_at']
+    search_fields = ['user__nickname', 'user__email']
+    readonly_fields = ['updated_at']
+
+
+@admin.register(NotificationOutbox)
+class NotificationOutboxAdmin(admin.ModelAdmin):
+    list_display = ['id', 'user', 'kind', 'attempts', 'created_at', 'processed_at']
+    list_filter = ['kind', 'processed_at']
+    search_fields = ['user__nickname', 'user__email', 'error']
+    readonly_fields = ['created_at', 'processed_at']
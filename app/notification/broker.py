@@ -0,0 +1,180 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
+from django.db import connections
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# 연결 하나가 쌓아 둘 수 있는 미전송 이벤트 수 - 넘치면 밀린 이벤트를 버리고 재동기화(resync)를 알린다
+SUBSCRIPTION_QUEUE_SIZE = 100
+RESYNC_EVENT = {'event': 'resync'}
+
+
+class Subscription:
+    """연결(스트림) 하나의 구독 - 이벤트 루프 안에서 소비하고, 전달은 어느 스레드에서나 가능"""
+
+    def __init__(self, broker, user_id, loop):
+        self.broker = broker
+        self.user_id = user_id
+        self._loop = loop
+        self._queue = asyncio.Queue(SUBSCRIPTION_QUEUE_SIZE)
+
+    def put(self, event):
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._put(event)
+        else:
+            self._loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event):
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(RESYNC_EVENT)
+
+    async def get(self, timeout=None):
+        """다음 이벤트 - timeout(초) 안에 없으면 None"""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class InProcessBroker:
+    """같은 프로세스의 구독자에게 바로 전달하는 브로커
+
+    알림을 만드는 코드(워커, API)와 스트림이 같은 프로세스에 있을 때만 전달된다.
+    여러 프로세스로 운영할 때는 settings.NOTIFICATION_BROKER 를 PostgresBroker 처럼
+    프로세스 간에 공유되는 브로커로 바꾼다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, user_id):
+        """현재 이벤트 루프에서 user_id 의 이벤트를 받을 구독 생성"""
+        subscription = Subscription(self, user_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.user_id]
+
+    def connection_count(self):
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def publish(self, events):
+        """events: [(사용자 ID, 이벤트)] - 커밋된 데이터만 보내도록 커밋 뒤에 호출한다"""
+        self.deliver(events)
+
+    def deliver(self, events):
+        """이 프로세스의 구독자에게 이벤트 전달"""
+        with self._lock:
+            targets = [(list(self._subscribers.get(user_id, ())), event) for user_id, event in events]
+        for subscribers, event in targets:
+            for subscription in subscribers:
+                try:
+                    subscription.put(event)
+                except RuntimeError:  # 이벤트 루프가 이미 닫힌 연결
+                    self.unsubscribe(subscription)
+
+
+class PostgresBroker(InProcessBroker):
+    """PostgreSQL LISTEN/NOTIFY 로 프로세스 간에 이벤트를 전달하는 브로커
+
+    publish 는 쿼리 한 번으로 NOTIFY 만 보낸다. 구독자가 생긴 프로세스마다 LISTEN 전용 연결을 가진
+    스레드 하나가 이벤트를 받아 그 프로세스의 구독자에게 나눠 준다.
+    """
+    channel = 'notification_events'
+
+    def __init__(self):
+        super().__init__()
+        self._listener = None
+
+    def subscribe(self, user_id):
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(target=self._listen, name='notification-listener', daemon=True)
+                self._listener.start()
+        return super().subscribe(user_id)
+
+    def publish(self, events):
+        if not events:
+            return
+        payloads = [json.dumps({'user_id': user_id, 'event': event}, cls=DjangoJSONEncoder) for user_id, event in events]
+        with connections['default'].cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload', [self.channel, payloads])
+
+    def _listen(self):
+        database = connections['default']
+        while True:
+            raw = None
+            try:
+                raw = database.get_new_connection(database.get_connection_params())
+                raw.autocommit = True
+                with raw.cursor() as cursor:
+                    cursor.execute(f'LISTEN {self.channel}')
+                while True:
+                    if select.select([raw], [], [], 30) == ([], [], []):
+                        continue
+                    raw.poll()
+                    events = []
+                    while raw.notifies:
+                        data = json.loads(raw.notifies.pop(0).payload)
+                        events.append((data['user_id'], data['event']))
+                    self.deliver(events)
+            except Exception:
+                # 연결이 끊긴 동안의 이벤트는 클라이언트가 Last-Event-ID 로 재접속해 다시 받는다
+                logger.exception('알림 브로커 LISTEN 연결 오류 - 1초 뒤 재연결')
+                if raw is not None:
+                    raw.close()
+                time.sleep(1)
+
+
+_lock = threading.Lock()
+_state = {'broker': None}
+
+
+def get_broker():
+    """프로세스 공용 브로커 (settings.NOTIFICATION_BROKER)"""
+    with _lock:
+        if _state['broker'] is None:
+            _state['broker'] = import_string(settings.NOTIFICATION_BROKER)()
+        return _state['broker']
+
+
+def reset_broker():
+    with _lock:
+        _state['broker'] = None
+
+
+@receiver(setting_changed)
+def _broker_setting_changed(setting, **kwargs):
+    if setting == 'NOTIFICATION_BROKER':
+        reset_broker()
@@ -0,0 +1,116 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from .models import Notification, NotificationCounter
+from .streams import publish_read
+
+RECONCILE_BATCH_SIZE = 1000
+
+
+def adjust_unread_counts(deltas):
+    """사용자별 읽지 않은 알림 수 증감 - deltas: {사용자 ID: 증감}
+
+    건수와 관계없이 (빈 행 INSERT, 일괄 UPDATE) 두 번의 쿼리로 처리하며,
+    F() 로 더하므로 동시에 기록되어도 유실되지 않는다.
+    """
+    deltas = {user_id: delta for user_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    now = timezone.now()
+    with transaction.atomic():
+        NotificationCounter.objects.bulk_create(
+            [NotificationCounter(user_id=user_id) for user_id in deltas], ignore_conflicts=True
+        )
+        NotificationCounter.objects.bulk_update(
+            [NotificationCounter(user_id=user_id, unread_count=F('unread_count') + delta, updated_at=now)
+             for user_id, delta in deltas.items()],
+            ['unread_count', 'updated_at'],
+        )
+
+
+def unread_count(user_id):
+    """읽지 않은 알림 수 (카운터 행 한 번 조회)"""
+    count = NotificationCounter.objects.filter(user_id=user_id).values_list('unread_count', flat=True).first()
+    return max(count or 0, 0)
+
+
+def mark_all_read(user_id, until=None):
+    """사용자의 읽지 않은 알림을 UPDATE 한 번으로 읽음 처리 - until: 이 알림 id 까지만. 반환값: 처리 건수"""
+    queryset = Notification.objects.filter(user_id=user_id, is_read=False)
+    if until is not None:
+        queryset = queryset.filter(pk__lte=until)
+    now = timezone.now()
+    with transaction.atomic():
+        updated = queryset.update(is_read=True, read_at=now, updated_at=now)
+        adjust_unread_counts({user_id: -updated})
+        if updated:
+            publish_read([user_id], now, until=until)
+    return updated
+
+
+def mark_read(queryset):
+    """여러 사용자의 알림을 UPDATE 한 번으로 읽음 처리 (관리자 일괄 작업) - 반환값: 처리 건수"""
+    unread = queryset.filter(is_read=False)
+    now = timezone.now()
+    with transaction.atomic():
+        counts = dict(
+            unread.order_by().values('user_id').annotate(count=Count('id')).values_list('user_id', 'count')
+        )
+        updated = unread.update(is_read=True, read_at=now, updated_at=now)
+        if updated == sum(counts.values()):
+            adjust_unread_counts({user_id: -count for user_id, count in counts.items()})
+        else:
+            # 세는 사이에 다른 요청이 읽음 처리한 경우 - 해당 사용자만 다시 센다
+            reconcile_unread_counts(list(counts))
+        if updated:
+            publish_read(counts, now)
+    return updated
+
+
+def reconcile_unread_counts(user_ids=None, batch_size=RECONCILE_BATCH_SIZE, dry_run=False):
+    """카운터를 실제 읽지 않은 알림 수로 바로잡기 - 반환값: 어긋났던 [(사용자 ID, 저장값, 실제값)]
+
+    사용자 id 순으로 batch_size 명씩 카운터 행을 잠근 뒤 세므로, 그 사이에 생긴 알림의 증분은
+    잠금이 풀린 뒤 바로잡은 값 위에 더해진다.
+    """
+    users = get_user_model().objects.order_by('pk')
+    if user_ids is not None:
+        users = users.filter(pk__in=user_ids)
+
+    drift = []
+    last_id = None
+    while True:
+        batch = users.filter(pk__gt=last_id) if last_id is not None else users
+        batch = list(batch.values_list('pk', flat=True)[:batch_size])
+        if not batch:
+            break
+        last_id = batch[-1]
+
+        with transaction.atomic():
+            stored = dict(
+                NotificationCounter.objects.select_for_update().filter(user_id__in=batch)
+                .values_list('user_id', 'unread_count')
+            )
+            actual = dict(
+                Notification.objects.filter(user_id__in=batch, is_read=False).order_by()
+                .values('user_id').annotate(count=Count('id')).values_list('user_id', 'count')
+            )
+            wrong = [
+                (user_id, stored.get(user_id), actual.get(user_id, 0))
+                for user_id in batch if stored.get(user_id, 0) != actual.get(user_id, 0)
+            ]
+            if wrong and not dry_run:
+                now = timezone.now()
+                NotificationCounter.objects.bulk_create(
+                    [NotificationCounter(user_id=user_id) for user_id, current, _ in wrong if current is None],
+                    ignore_conflicts=True,
+                )
+                NotificationCounter.objects.bulk_update(
+                    [NotificationCounter(user_id=user_id, unread_count=count, updated_at=now)
+                     for user_id, _, count in wrong],
+                    ['unread_count', 'updated_at'],
+                )
+        drift.extend(wrong)
+    return drift
@@ -0,0 +1,55 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Notification, NotificationCounter
+
+
+def digest_enabled():
+    return settings.TRANSACTION_NOTIFICATION_MODE == 'digest'
+
+
+def digest_message(notification):
+    """묶음 알림 메시지 (예: '출금 12건 합계 123,000.00원, 입금 1건 합계 5,000.00원')"""
+    parts = []
+    if notification.withdrawal_count:
+        parts.append(f"출금 {notification.withdrawal_count}건 합계 {notification.withdrawal_total:,}원")
+    if notification.deposit_count:
+        parts.append(f"입금 {notification.deposit_count}건 합계 {notification.deposit_total:,}원")
+    return ", ".join(parts)
+
+
+def record_transaction_digests(summaries):
+    """사용자별 거래 요약을 열린 묶음 알림에 합치고, 없으면 새 묶음을 연다
+
+    summaries: {사용자 ID: {'deposit_count', 'deposit_total', 'withdrawal_count', 'withdrawal_total'}}
+    묶음 창(TRANSACTION_DIGEST_WINDOW_SECONDS)이 닫히거나 사용자가 읽은 묶음은 더 갱신하지 않는다.
+    열린 묶음이 없으면 잠글 행도 없으므로, 사용자마다 늘 있는 카운터 행을 id 순으로 먼저 잠가 여러 워커가
+    같은 사용자의 묶음을 동시에 새로 열지 못하게 한다. 카운터 잠금 두 번과 사용자당 (열린 묶음 잠금 조회,
+    INSERT 또는 UPDATE) 두 번의 쿼리로 처리한다.
+    """
+    now = timezone.now()
+    window = timedelta(seconds=settings.TRANSACTION_DIGEST_WINDOW_SECONDS)
+    user_ids = sorted(summaries)
+    with transaction.atomic():
+        NotificationCounter.objects.bulk_create(
+            [NotificationCounter(user_id=user_id) for user_id in user_ids], ignore_conflicts=True
+        )
+        list(NotificationCounter.objects.select_for_update().filter(user_id__in=user_ids)
+             .order_by('user_id').values_list('user_id', flat=True))
+        for user_id in user_ids:
+            summary = summaries[user_id]
+            # 묶음 행도 잠가 동시에 들어온 읽음 처리를 덮어쓰지 않게 한다
+            digest = (
+                Notification.objects.select_for_update()
+                .filter(user_id=user_id, notification_type='transaction', is_read=False, digest_until__gt=now)
+                .order_by('-digest_until').first()
+            )
+            if digest is None:
+                digest = Notification(user_id=user_id, notification_type='transaction', digest_until=now + window)
+            for field in ('deposit_count', 'deposit_total', 'withdrawal_count', 'withdrawal_total'):
+                setattr(digest, field, getattr(digest, field) + summary[field])
+            digest.message = digest_message(digest)
+            digest.save()
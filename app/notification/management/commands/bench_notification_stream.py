@@ -0,0 +1,43 @@
+import asyncio
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from notification.broker import InProcessBroker
+from notification.streams import event_stream
+
+
+class Command(BaseCommand):
+    help = '유휴 알림 스트림 연결 수에 따른 메모리와 전체 전달(fan-out) 시간을 측정합니다. (DB 사용 안 함)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--connections', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        count = options['connections']
+        opened, memory, fan_out = asyncio.run(self._run(count))
+        self.stdout.write(f'연결 {count:,}개 열기 {opened:.2f}초, 연결당 Python 할당 {memory / count / 1024:.1f}KB')
+        self.stdout.write(f'사용자마다 이벤트 1건 전달 완료까지 {fan_out * 1000:.1f}ms ({count / fan_out:,.0f}건/초)')
+
+    async def _run(self, count):
+        broker = InProcessBroker()
+        tracemalloc.start()
+        started = time.perf_counter()
+        streams = [event_stream(user_id, heartbeat=3600, broker=broker) for user_id in range(count)]
+        for stream in streams:
+            await anext(stream)
+        waiting = [asyncio.ensure_future(anext(stream)) for stream in streams]
+        await asyncio.sleep(0)
+        opened = time.perf_counter() - started
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        started = time.perf_counter()
+        broker.publish([(user_id, {'event': 'notification', 'id': 1, 'data': {}}) for user_id in range(count)])
+        await asyncio.gather(*waiting)
+        fan_out = time.perf_counter() - started
+
+        for stream in streams:
+            await stream.aclose()
+        return opened, memory, fan_out
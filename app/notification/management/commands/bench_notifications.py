@@ -0,0 +1,69 @@
+import time
+import uuid
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from accounts.models import Account
+from accounts.services import post_transaction
+from notification.models import Notification
+from notification.outbox import process_outbox
+
+
+def table_bytes():
+    """notifications 테이블(인덱스 포함) 크기 - PostgreSQL 외에는 None"""
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_total_relation_size('notifications')")
+        return cursor.fetchone()[0]
+
+
+class Command(BaseCommand):
+    help = '거래 알림 방식(each/digest)별 notifications 테이블 쓰기량과 증가량을 비교합니다. (임시 사용자 생성 후 삭제)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--transactions', type=int, default=500)
+        parser.add_argument('--window', type=int, default=600, help='digest 묶음 창(초)')
+
+    def handle(self, *args, **options):
+        for mode in ['each', 'digest']:
+            with override_settings(TRANSACTION_NOTIFICATION_MODE=mode,
+                                   TRANSACTION_DIGEST_WINDOW_SECONDS=options['window']):
+                self._measure(mode, options['transactions'])
+
+    def _measure(self, mode, count):
+        user = get_user_model().objects.create_user(
+            username=f'bench-{uuid.uuid4().hex[:8]}', email=f'{uuid.uuid4().hex}@bench.local',
+            nickname=f'bench-{uuid.uuid4().hex[:8]}', name='벤치마크'
+        )
+        try:
+            account = Account.objects.create(
+                user=user, account_number='BENCH-NOTI', bank_code='000', account_type='checking'
+            )
+            size_before = table_bytes()
+            started = time.perf_counter()
+            with CaptureQueriesContext(connection) as queries:
+                for i in range(count):
+                    post_transaction(account, Decimal(1000 + i), 'withdrawal' if i % 4 else 'deposit',
+                                     transaction_detail='벤치마크 카드결제')
+                    if i % 50 == 49:
+                        process_outbox()  # 워커가 주기적으로 아웃박스를 비우는 상황
+                process_outbox()
+            elapsed = time.perf_counter() - started
+            size_after = table_bytes()
+
+            writes = [query['sql'] for query in queries if '"notifications"' in query['sql']]
+            inserts = sum(sql.startswith('INSERT') for sql in writes)
+            updates = sum(sql.startswith('UPDATE') for sql in writes)
+            rows = Notification.objects.filter(user=user, notification_type='transaction').count()
+            growth = f'{(size_after - size_before) / 1024:,.0f}KB' if size_before is not None else '측정 불가'
+            self.stdout.write(
+                f'{mode:<7} 거래 {count:,}건 → 알림 행 {rows:,}개 (행/거래 {rows / count:.3f}), '
+                f'INSERT {inserts:,} / UPDATE {updates:,}, 테이블 증가 {growth}, {count / elapsed:,.0f}건/초'
+            )
+        finally:
+            user.delete()
@@ -0,0 +1,15 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from notification.outbox import outbox_stats
+
+
+class Command(BaseCommand):
+    help = '알림 아웃박스의 대기 건수, 처리량, 처리 지연(lag) 지표를 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--window', type=int, default=60, help='처리량/지연 집계 구간(분)')
+
+    def handle(self, *args, **options):
+        self.stdout.write(json.dumps(outbox_stats(options['window']), ensure_ascii=False, indent=2))
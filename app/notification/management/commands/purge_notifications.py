@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from notification.retention import PURGE_BATCH_SIZE, purge_notifications, purge_outbox, retention_policy
+
+
+class Command(BaseCommand):
+    help = '보관 기간(settings.NOTIFICATION_RETENTION)이 지난 알림과 처리된 아웃박스 항목을 배치로 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=PURGE_BATCH_SIZE, help='배치당 id 범위 크기')
+        parser.add_argument('--sleep', type=float, default=0.05, help='배치 사이 대기(초) - 잠금 경합 완화')
+        parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 대상 건수만 계산')
+
+    def handle(self, *args, **options):
+        for notification_type, (read_days, unread_days) in retention_policy().items():
+            self.stdout.write(
+                f'  {notification_type:<12} 읽음 {read_days if read_days is not None else "무기한"}일 / '
+                f'읽지 않음 {unread_days if unread_days is not None else "무기한"}일'
+            )
+        result = purge_notifications(
+            batch_size=options['batch_size'], sleep=options['sleep'], dry_run=options['dry_run']
+        )
+        outbox = purge_outbox(batch_size=options['batch_size'], dry_run=options['dry_run'])
+
+        verb = '삭제 대상' if options['dry_run'] else '삭제'
+        for notification_type, count in sorted(result['by_type'].items()):
+            self.stdout.write(f'  {notification_type:<12} {count:,}건')
+        self.stdout.write(self.style.SUCCESS(
+            f"알림 {result['deleted']:,}건 {verb} ({result['batches']:,}배치, {result['elapsed']:.2f}초, "
+            f"{result['rows_per_second']:,.0f}건/초), 아웃박스 {outbox:,}건 {verb}"
+        ))
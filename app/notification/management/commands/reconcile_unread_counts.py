@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from notification.counters import RECONCILE_BATCH_SIZE, reconcile_unread_counts
+
+
+class Command(BaseCommand):
+    help = '사용자별 읽지 않은 알림 수 카운터를 실제 알림 수와 비교해 바로잡습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', dest='user_ids', help='대상 사용자 ID (여러 번 지정 가능)')
+        parser.add_argument('--batch-size', type=int, default=RECONCILE_BATCH_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help='고치지 않고 어긋난 카운터만 출력')
+
+    def handle(self, *args, **options):
+        drift = reconcile_unread_counts(options['user_ids'], options['batch_size'], options['dry_run'])
+        for user_id, stored, actual in drift:
+            self.stdout.write(f'사용자 {user_id}: 카운터 {stored if stored is not None else "없음"} → 실제 {actual}')
+        verb = '발견' if options['dry_run'] else '수정'
+        self.stdout.write(self.style.SUCCESS(f'어긋난 카운터 {len(drift)}개 {verb}'))
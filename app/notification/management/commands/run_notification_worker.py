@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from notification.outbox import OUTBOX_BATCH_SIZE, outbox_stats, process_batch
+
+
+class Command(BaseCommand):
+    help = '알림 아웃박스를 배치로 읽어 알림(Notification)을 만드는 워커를 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=OUTBOX_BATCH_SIZE)
+        parser.add_argument('--poll-interval', type=float, default=0.5, help='아웃박스가 비었을 때 재조회 간격(초)')
+        parser.add_argument('--once', action='store_true', help='아웃박스를 비우면 종료')
+        parser.add_argument('--report-every', type=float, default=60.0, help='지연 지표 출력 간격(초)')
+
+    def handle(self, *args, **options):
+        processed = 0
+        started = last_report = time.perf_counter()
+        while True:
+            close_old_connections()
+            count = process_batch(options['batch_size'])
+            processed += count
+            if options['verbosity'] > 1 and count:
+                self.stdout.write(f'아웃박스 {count}건 처리')
+            if time.perf_counter() - last_report >= options['report_every']:
+                self._report(processed, time.perf_counter() - started)
+                last_report = time.perf_counter()
+            if not count:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+
+        self._report(processed, time.perf_counter() - started)
+
+    def _report(self, processed, elapsed):
+        stats = outbox_stats(window_minutes=5)
+        rate = processed / elapsed if elapsed else 0
+        lag = stats['lag_p95']
+        self.stdout.write(self.style.SUCCESS(
+            f"아웃박스 {processed:,}건 처리 ({rate:,.1f}건/초), 대기 {stats['pending']:,}건, "
+            f"최근 5분 지연 p50 {stats['lag_p50'] or 0:.2f}초 / p95 {lag or 0:.2f}초"
+        ))
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:55
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notification", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="digest_until",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="묶음마감일시"),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="deposit_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="입금건수"),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="deposit_total",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=14, verbose_name="입금합계"
+            ),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="withdrawal_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="출금건수"),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="withdrawal_total",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=14, verbose_name="출금합계"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "digest_until"], name="notificatio_user_id_4c1a1c_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notification", "0005_notificationcounter"),
+    ]
+
+    operations = [
+        # is_read 단독 인덱스는 선택도가 낮고, created_at 은 필드 인덱스와 중복
+        migrations.RemoveIndex(
+            model_name="notification",
+            name="notificatio_is_read_3f8c44_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="notification",
+            name="notificatio_created_e4c995_idx",
+        ),
+        migrations.AlterField(
+            model_name="notification",
+            name="is_read",
+            field=models.BooleanField(default=False, verbose_name="읽음여부"),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("is_read", False)),
+                fields=["user", "-created_at"],
+                name="notifications_unread_idx",
+            ),
+        ),
+    ]
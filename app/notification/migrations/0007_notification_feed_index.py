@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-19 01:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notification", "0006_notification_retention_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(fields=["user", "created_at"], name="notificatio_user_id_7336fd_idx"),
+        ),
+    ]
@@ -1,4 +1,8 @@
-from django.db import models
+from decimal import Decimal
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models import Q
 from django.conf import settings
 from django.utils import timezone
 
@@ -30,13 +34,43 @@ class Notification(models.Model):
     )
     is_read = models.BooleanField(
         default=False,
-        db_index=True,
         verbose_name='읽음여부'
     )
     read_at = models.DateTimeField(
         null=True, blank=True,
         verbose_name='읽은시간'
     )
+    dedupe_key = models.CharField(
+        max_length=100,
+        unique=True,
+        null=True, blank=True,
+        verbose_name='중복방지키'
+    )
+    # 거래 알림 묶음(digest) - 창이 닫히기 전까지 같은 행을 갱신한다
+    digest_until = models.DateTimeField(
+        null=True, blank=True,
+        verbose_name='묶음마감일시'
+    )
+    deposit_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='입금건수'
+    )
+    deposit_total = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        verbose_name='입금합계'
+    )
+    withdrawal_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='출금건수'
+    )
+    withdrawal_total = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        verbose_name='출금합계'
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
         db_index=True,
@@ -54,17 +88,157 @@ class Notification(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', 'is_read']),
-            models.Index(fields=['is_read']),
-            models.Index(fields=['created_at']),
+            models.Index(fields=['user', 'created_at']),  # 알림 피드 (created_at, id) 키셋
+            models.Index(fields=['user', 'updated_at']),  # 알림 피드 since 변경분 (updated_at, id)
             models.Index(fields=['notification_type']),
+            models.Index(fields=['user', 'digest_until']),
+            # 읽지 않은 알림만 담아 보관 기간이 지나 쌓이는 읽은 알림과 무관하게 작게 유지
+            models.Index(fields=['user', '-created_at'], condition=Q(is_read=False), name='notifications_unread_idx'),
         ]
 
     def __str__(self):
         return f"{self.user.nickname}에게 {self.get_notification_type_display()}: {self.message[:50]}..."
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 읽지 않은 알림 수 카운터 증감 판단용 - DB 에 저장된 읽음 여부 (지연 로딩이면 None)
+        instance._stored_is_read = instance.__dict__.get('is_read')
+        return instance
+
+    def save(self, *args, **kwargs):
+        """저장과 함께 읽지 않은 알림 수 카운터를 증감 (생성, 읽음 여부 변경)"""
+        from .counters import adjust_unread_counts
+
+        adding = self._state.adding
+        stored = getattr(self, '_stored_is_read', None)
+        update_fields = kwargs.get('update_fields')
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding:
+                delta = 0 if self.is_read else 1
+            elif stored is None or stored == self.is_read or (update_fields is not None and 'is_read' not in update_fields):
+                delta = 0
+            else:
+                delta = -1 if self.is_read else 1
+            adjust_unread_counts({self.user_id: delta})
+        self._stored_is_read = self.is_read
+
+    def delete(self, *args, **kwargs):
+        from .counters import adjust_unread_counts
+
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            if not self.is_read:
+                adjust_unread_counts({self.user_id: -1})
+        return result
+
     def mark_as_read(self):
-        """알림을 읽음으로 표시"""
-        if not self.is_read:
-            self.is_read = True
-            self.read_at = timezone.now()
-            self.save(update_fields=['is_read', 'read_at', 'updated_at'])
\ No newline at end of file
+        """알림을 읽음으로 표시 - 실제로 바뀌었으면 True
+
+        조건부 UPDATE 로 처리하므로 같은 알림을 동시에 읽어도 카운터는 한 번만 줄어든다.
+        """
+        from .counters import adjust_unread_counts
+        from .streams import publish_read
+
+        if self.is_read:
+            return False
+        now = timezone.now()
+        with transaction.atomic():
+            updated = Notification.objects.filter(pk=self.pk, is_read=False).update(
+                is_read=True, read_at=now, updated_at=now
+            )
+            adjust_unread_counts({self.user_id: -updated})
+            if updated:
+                publish_read([self.user_id], now, ids=[self.pk])
+        self.is_read, self.read_at, self.updated_at = True, now, now
+        self._stored_is_read = True
+        return bool(updated)
+
+
+class NotificationCounter(models.Model):
+    """사용자별 읽지 않은 알림 수 - 알림 생성·읽음 처리 때 증감해 배지 수를 행 하나로 조회한다"""
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='notification_counter',
+        verbose_name='사용자'
+    )
+    unread_count = models.IntegerField(
+        default=0,
+        verbose_name='읽지않은알림수'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일시'
+    )
+
+    class Meta:
+        db_table = 'notification_counters'
+        verbose_name = '알림 카운터'
+        verbose_name_plural = '알림 카운터'
+
+    def __str__(self):
+        return f"{self.user_id}: 읽지 않은 알림 {self.unread_count}개"
+
+
+class NotificationOutbox(models.Model):
+    """알림 아웃박스 - 금융 거래와 같은 트랜잭션에서 기록하고 워커가 알림으로 만든다"""
+    KIND_CHOICES = [
+        ('transaction', '거래'),
+        ('message', '메시지'),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='notification_outbox',
+        verbose_name='사용자'
+    )
+    kind = models.CharField(
+        max_length=20,
+        choices=KIND_CHOICES,
+        verbose_name='종류'
+    )
+    payload = models.JSONField(
+        encoder=DjangoJSONEncoder,
+        verbose_name='내용'
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='시도횟수'
+    )
+    error = models.TextField(
+        blank=True,
+        verbose_name='오류'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='생성일시'
+    )
+    processed_at = models.DateTimeField(
+        null=True, blank=True,
+        verbose_name='처리일시'
+    )
+
+    class Meta:
+        db_table = 'notification_outbox'
+        verbose_name = '알림 아웃박스'
+        verbose_name_plural = '알림 아웃박스'
+        ordering = ['id']
+        indexes = [
+            # 워커는 미처리 항목만 id 순으로 읽는다
+            models.Index(fields=['id'], condition=Q(processed_at__isnull=True), name='notification_outbox_pending'),
+            models.Index(fields=['processed_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} 아웃박스 #{self.pk} ({'처리됨' if self.processed_at else '대기'})"
+
+    @property
+    def lag(self):
+        """기록부터 처리까지 걸린 시간(초)"""
+        if self.processed_at:
+            return (self.processed_at - self.created_at).total_seconds()
+        return None
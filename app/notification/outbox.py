@@ -0,0 +1,167 @@
+import statistics
+from collections import Counter, defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .counters import adjust_unread_counts
+from .digests import digest_enabled, record_transaction_digests
+from .models import Notification, NotificationOutbox
+from .streams import publish_notifications
+
+OUTBOX_BATCH_SIZE = 500
+ZERO = Decimal('0.00')
+
+
+def summarize_transactions(transactions):
+    """거래내역을 사용자별 (입금/출금 건수·합계) 요약으로 묶기"""
+    summaries = defaultdict(lambda: {
+        'deposit_count': 0, 'deposit_total': ZERO, 'withdrawal_count': 0, 'withdrawal_total': ZERO,
+    })
+    for item in transactions:
+        summary = summaries[item.account.user_id]
+        summary[f'{item.transaction_type}_count'] += 1
+        summary[f'{item.transaction_type}_total'] += item.amount
+    return summaries
+
+
+def enqueue_transactions(transactions):
+    """거래 알림을 아웃박스에 기록 (사용자당 한 행, INSERT 1회)
+
+    금융 거래와 같은 트랜잭션에서 호출되며 알림 테이블은 건드리지 않는다.
+    """
+    NotificationOutbox.objects.bulk_create([
+        NotificationOutbox(user_id=user_id, kind='transaction', payload=summary)
+        for user_id, summary in summarize_transactions(transactions).items()
+    ])
+
+
+def enqueue_messages(messages):
+    """완성된 알림 메시지를 아웃박스에 기록 - messages: [(사용자 ID, 알림유형, 메시지)]"""
+    NotificationOutbox.objects.bulk_create([
+        NotificationOutbox(user_id=user_id, kind='message',
+                           payload={'notification_type': notification_type, 'message': message})
+        for user_id, notification_type, message in messages
+    ])
+
+
+def _summary(payload):
+    return {
+        'deposit_count': payload['deposit_count'],
+        'deposit_total': Decimal(payload['deposit_total']),
+        'withdrawal_count': payload['withdrawal_count'],
+        'withdrawal_total': Decimal(payload['withdrawal_total']),
+    }
+
+
+def transaction_message(summary):
+    """거래 요약 알림 메시지 - 한 건이면 '출금 5,000.00원이 처리되었습니다.'"""
+    count = summary['deposit_count'] + summary['withdrawal_count']
+    if count == 1:
+        transaction_type = 'deposit' if summary['deposit_count'] else 'withdrawal'
+        label = '입금' if transaction_type == 'deposit' else '출금'
+        return f"{label} {summary[f'{transaction_type}_total']:,}원이 처리되었습니다."
+    return (
+        f"거래내역 {count}건이 등록되었습니다. "
+        f"(입금 {summary['deposit_total']:,}원, 출금 {summary['withdrawal_total']:,}원)"
+    )
+
+
+def process_batch(batch_size=OUTBOX_BATCH_SIZE):
+    """미처리 아웃박스 항목을 batch_size 개까지 알림으로 만들고 처리 완료로 표시
+
+    알림 생성과 처리 완료 표시가 한 트랜잭션이므로 도중에 실패하면 둘 다 취소되고 다음에 다시
+    처리된다(at-least-once). 알림은 아웃박스 id 로 만든 dedupe_key 로 한 번만 생기고, 새로 만든 알림은
+    커밋 뒤 실시간 스트림으로 보낸다. SKIP LOCKED 로 다른 워커가 잡은 항목은 건너뛴다.
+    반환값: 처리한 항목 수
+    """
+    with transaction.atomic():
+        queryset = NotificationOutbox.objects.filter(processed_at__isnull=True).order_by('id')
+        if connection.features.has_select_for_update_skip_locked:
+            queryset = queryset.select_for_update(skip_locked=True)
+        entries = list(queryset[:batch_size])
+        if not entries:
+            return 0
+
+        notifications = []
+        digests = defaultdict(lambda: dict.fromkeys(
+            ('deposit_count', 'deposit_total', 'withdrawal_count', 'withdrawal_total'), 0
+        ))
+        for entry in entries:
+            entry.attempts += 1
+            try:
+                if entry.kind == 'transaction' and digest_enabled():
+                    for field, value in _summary(entry.payload).items():
+                        digests[entry.user_id][field] += value
+                    continue
+                if entry.kind == 'transaction':
+                    notification_type, message = 'transaction', transaction_message(_summary(entry.payload))
+                else:
+                    notification_type, message = entry.payload['notification_type'], entry.payload['message']
+                notifications.append(Notification(
+                    user_id=entry.user_id, notification_type=notification_type,
+                    message=message[:1000], dedupe_key=f'outbox:{entry.pk}',
+                ))
+            except (KeyError, TypeError, ArithmeticError) as exc:
+                # 형식이 잘못된 항목은 다시 시도해도 실패하므로 오류를 남기고 처리 완료로 넘긴다
+                entry.error = f'{type(exc).__name__}: {exc}'
+
+        # 잠근 항목이므로 동시에 같은 키를 만드는 워커는 없다 - 이전 시도에서 만든 알림만 거른다
+        existing = set(Notification.objects.filter(
+            dedupe_key__in=[notification.dedupe_key for notification in notifications]
+        ).values_list('dedupe_key', flat=True)) if notifications else set()
+        created = Notification.objects.bulk_create(
+            [notification for notification in notifications if notification.dedupe_key not in existing]
+        )
+        adjust_unread_counts(Counter(notification.user_id for notification in created))
+        publish_notifications(created)
+        if digests:
+            record_transaction_digests(digests)
+
+        now = timezone.now()
+        for entry in entries:
+            entry.processed_at = now
+        NotificationOutbox.objects.bulk_update(entries, ['attempts', 'error', 'processed_at'])
+    return len(entries)
+
+
+def process_outbox(batch_size=OUTBOX_BATCH_SIZE, max_batches=None):
+    """아웃박스를 비울 때까지(또는 max_batches 만큼) 배치 처리. 반환값: 처리한 항목 수"""
+    processed = batches = 0
+    while max_batches is None or batches < max_batches:
+        count = process_batch(batch_size)
+        if not count:
+            break
+        processed += count
+        batches += 1
+    return processed
+
+
+def outbox_stats(window_minutes=60):
+    """아웃박스 대기 건수와 처리 지연(lag) 지표"""
+    now = timezone.now()
+    pending = NotificationOutbox.objects.filter(processed_at__isnull=True)
+    oldest = pending.order_by('id').values_list('created_at', flat=True).first()
+    processed = list(
+        NotificationOutbox.objects.filter(processed_at__gte=now - timedelta(minutes=window_minutes))
+        .values_list('created_at', 'processed_at')
+    )
+    lags = sorted((done - created).total_seconds() for created, done in processed)
+
+    def percentile(values, ratio):
+        return values[min(len(values) - 1, int(len(values) * ratio))] if values else None
+
+    return {
+        'pending': pending.count(),
+        'oldest_pending_seconds': (now - oldest).total_seconds() if oldest else None,
+        'window_minutes': window_minutes,
+        'processed': len(processed),
+        'failed': NotificationOutbox.objects.filter(processed_at__gte=now - timedelta(minutes=window_minutes))
+        .exclude(error='').count(),
+        'throughput_per_minute': round(len(processed) / window_minutes, 2),
+        'lag_p50': statistics.median(lags) if lags else None,
+        'lag_p95': percentile(lags, 0.95),
+        'lag_max': lags[-1] if lags else None,
+    }
@@ -0,0 +1,72 @@
+from django.db.models import Q
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from accounts.pagination import KeysetPagination
+
+
+def changed_since(queryset, position, limit):
+    """position (updated_at, id) 이후 생성·갱신된 알림을 오래된 순으로 limit 개"""
+    value, pk = position
+    return list(
+        queryset.filter(Q(updated_at__gt=value) | Q(updated_at=value, id__gt=pk)).order_by('updated_at', 'id')[:limit]
+    )
+
+
+class NotificationCursorPagination(KeysetPagination):
+    """알림 피드 커서 페이지네이션
+
+    cursor 를 주면 (created_at, id) 로 그보다 오래된 페이지를 최신순으로, since 를 주면 (updated_at, id)
+    로 그 이후 생성·갱신된 알림(묶음 알림 갱신, 읽음 처리 포함)을 오래된 순으로 돌려준다(변경분 조회).
+    응답의 latest 는 지금까지 받은 가장 나중 변경의 커서로, 다음 조회의 since 에 그대로 넘긴다.
+    같은 알림이 갱신될 때마다 다시 오므로 클라이언트는 알림 id 로 덮어쓴다.
+
+    수정일시는 커밋 전에 정해지므로, 다른 트랜잭션이 커밋하기 전에 그보다 늦은 알림으로 latest 가
+    넘어가면 그 알림은 since 조회에서 빠질 수 있다 (알림 생성·갱신 트랜잭션이 짧아 드물다).
+    실시간 스트림의 재접속 재전송도 같은 기준이므로, 빠짐없이 맞춰야 하면 since 없이 첫 페이지부터 다시 받는다.
+    """
+    ordering_field = 'created_at'
+    since_field = 'updated_at'
+    since_query_param = 'since'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.since = self.decode_cursor(request, queryset.model, self.since_query_param)
+        if self.since is None:
+            results = super().paginate_queryset(queryset, request, view)
+            first_page = not request.query_params.get(self.cursor_query_param)
+            # 받은 페이지의 현재 상태 이후에 바뀐 것만 since 로 받으면 된다
+            self.latest_position = max(map(self.position, results)) if first_page and results else None
+            return results
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        results = changed_since(queryset, self.since, self.page_size + 1)
+        self.has_next = len(results) > self.page_size
+        results = results[:self.page_size]
+        self.next_position = None
+        self.latest_position = self.position(results[-1]) if results else self.since
+        return results
+
+    def position(self, item):
+        """since 커서 위치 - (updated_at, id)"""
+        return getattr(item, self.since_field), item.pk
+
+    def get_next_link(self):
+        if self.since is None:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.since_query_param, self.encode_cursor(self.latest_position))
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'latest': self.encode_cursor(self.latest_position) if self.latest_position else None,
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['latest'] = {'type': 'string', 'nullable': True}
+        return response_schema
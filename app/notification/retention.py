@@ -0,0 +1,97 @@
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Min, Q
+from django.utils import timezone
+
+from .counters import adjust_unread_counts
+from .models import Notification, NotificationOutbox
+
+PURGE_BATCH_SIZE = 5000
+
+
+def retention_policy():
+    """알림유형 → (읽은 알림 보관일, 읽지 않은 알림 보관일) - settings.NOTIFICATION_RETENTION"""
+    configured = settings.NOTIFICATION_RETENTION
+    default = configured.get('default', {})
+    policy = {}
+    for notification_type, _ in Notification.NOTIFICATION_TYPES:
+        rule = {**default, **configured.get(notification_type, {})}
+        policy[notification_type] = (rule.get('read_days'), rule.get('unread_days'))
+    return policy
+
+
+def expired_condition(now=None):
+    """보관 기간이 지난 알림 조건과 그중 가장 늦은 기준 시각 (삭제 대상이 없으면 (None, None))"""
+    now = now or timezone.now()
+    condition = Q(pk__in=[])
+    latest = None
+    for notification_type, days in retention_policy().items():
+        for is_read, keep_days in zip((True, False), days):
+            if keep_days is None:
+                continue
+            cutoff = now - timedelta(days=keep_days)
+            condition |= Q(notification_type=notification_type, is_read=is_read, created_at__lt=cutoff)
+            latest = cutoff if latest is None else max(latest, cutoff)
+    return (condition, latest) if latest is not None else (None, None)
+
+
+def purge_notifications(now=None, batch_size=PURGE_BATCH_SIZE, sleep=0.0, dry_run=False):
+    """보관 기간이 지난 알림 삭제
+
+    id 범위를 batch_size 씩 나눠 범위마다 (대상 행 잠금 조회, DELETE) 를 짧은 트랜잭션으로 처리하고
+    배치 사이에 sleep 초 쉬어 다른 쓰기가 오래 기다리지 않게 한다. 지운 읽지 않은 알림만큼
+    카운터도 줄인다. 반환값: {'deleted', 'by_type', 'batches', 'elapsed', 'rows_per_second'}
+    """
+    started = time.perf_counter()
+    deleted = batches = 0
+    by_type = Counter()
+    condition, latest = expired_condition(now)
+    if condition is not None:
+        # 가장 늦은 기준 시각보다 뒤에 만든 알림은 어느 유형이든 대상이 아니므로 그 앞 id 까지만 훑는다
+        bounds = Notification.objects.filter(created_at__lt=latest).aggregate(first=Min('pk'), last=Max('pk'))
+        low = bounds['first']
+        while low is not None and low <= bounds['last']:
+            high = low + batch_size
+            with transaction.atomic():
+                rows = list(
+                    Notification.objects.select_for_update()
+                    .filter(condition, pk__gte=low, pk__lt=high)
+                    .values_list('pk', 'user_id', 'is_read', 'notification_type')
+                )
+                if rows and not dry_run:
+                    Notification.objects.filter(pk__in=[row[0] for row in rows]).delete()
+                    unread = Counter(user_id for _, user_id, is_read, _ in rows if not is_read)
+                    adjust_unread_counts({user_id: -count for user_id, count in unread.items()})
+            deleted += len(rows)
+            by_type.update(row[3] for row in rows)
+            batches += 1
+            low = high
+            if sleep and rows and low <= bounds['last']:
+                time.sleep(sleep)
+
+    elapsed = time.perf_counter() - started
+    return {
+        'deleted': deleted,
+        'by_type': dict(by_type),
+        'batches': batches,
+        'elapsed': round(elapsed, 4),
+        'rows_per_second': round(deleted / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def purge_outbox(now=None, batch_size=PURGE_BATCH_SIZE, dry_run=False):
+    """처리 후 보관 기간이 지난 아웃박스 항목 삭제 (id 범위 배치) - 반환값: 삭제 건수"""
+    cutoff = (now or timezone.now()) - timedelta(days=settings.NOTIFICATION_OUTBOX_RETENTION_DAYS)
+    expired = NotificationOutbox.objects.filter(processed_at__lt=cutoff)
+    bounds = expired.aggregate(first=Min('pk'), last=Max('pk'))
+    deleted = 0
+    low = bounds['first']
+    while low is not None and low <= bounds['last']:
+        batch = expired.filter(pk__gte=low, pk__lt=low + batch_size)
+        deleted += batch.count() if dry_run else batch.delete()[0]
+        low += batch_size
+    return deleted
@@ -7,6 +7,6 @@ class NotificationSerializer(serializers.ModelSerializer):
         model = Notification
         fields = [
             'id', 'message', 'notification_type', 'is_read',
-            'read_at', 'created_at'
+            'read_at', 'digest_until', 'created_at'
         ]
-        read_only_fields = ['id', 'read_at', 'created_at']
\ No newline at end of file
+        read_only_fields = ['id', 'read_at', 'digest_until', 'created_at']
\ No newline at end of file
@@ -1,16 +1,56 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from accounts.models import TransactionHistory
+from accounts.signals import budget_thresholds_crossed, transactions_bulk_created
+from analysis.signals import analysis_request_finished
+from .outbox import enqueue_messages, enqueue_transactions
 from .models import Notification
+from .streams import publish_notifications
 
 
 @receiver(post_save, sender=TransactionHistory)
 def create_transaction_notification(sender, instance, created, **kwargs):
-    """거래내역 생성시 알림 생성"""
+    """거래내역 생성시 알림을 아웃박스에 기록 (알림 생성은 워커가 트랜잭션 밖에서 처리)"""
     if created:
-        message = f"{instance.get_transaction_type_display()} {instance.amount:,}원이 처리되었습니다."
-        Notification.objects.create(
-            user=instance.account.user,
-            message=message,
-            notification_type='transaction'
-        )
\ No newline at end of file
+        enqueue_transactions([instance])
+
+
+@receiver(transactions_bulk_created)
+def create_bulk_transaction_notifications(sender, transactions, **kwargs):
+    """일괄 등록된 거래내역은 사용자별 아웃박스 항목 하나로 묶어 기록"""
+    enqueue_transactions(transactions)
+
+
+@receiver(budget_thresholds_crossed)
+def create_budget_notifications(sender, crossings, **kwargs):
+    """예산 사용률 임계치 초과 알림을 아웃박스에 기록"""
+    messages = []
+    for usage, threshold in crossings:
+        budget = usage.budget
+        target = f"{budget.category.name} " if budget.category_id else ""
+        if threshold >= 100:
+            headline = f"{budget.get_period_display()} {target}예산을 모두 사용했습니다."
+        else:
+            headline = f"{budget.get_period_display()} {target}예산의 {threshold}%를 사용했습니다."
+        messages.append((budget.user_id, 'budget', f"{headline} ({usage.spent:,}원 / {budget.amount:,}원)"))
+    enqueue_messages(messages)
+
+
+@receiver(analysis_request_finished)
+def create_analysis_notification(sender, analysis_request, **kwargs):
+    """분석 요청 처리 완료/실패 알림 생성"""
+    if analysis_request.status == 'done':
+        message = f"요청하신 {analysis_request.about} 분석이 완료되었습니다."
+    else:
+        message = f"{analysis_request.about} 분석에 실패했습니다: {analysis_request.error}"
+    Notification.objects.create(
+        user_id=analysis_request.user_id,
+        message=message[:1000],
+        notification_type='analysis'
+    )
+
+
+@receiver(post_save, sender=Notification)
+def push_notification(sender, instance, **kwargs):
+    """생성·갱신된 알림(묶음 알림 갱신, 읽음 처리 포함)을 실시간 스트림으로 전달"""
+    publish_notifications([instance])
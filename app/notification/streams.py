@@ -0,0 +1,109 @@
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+from .broker import get_broker
+from .models import Notification, NotificationCounter
+from .serializers import NotificationSerializer
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+# 재접속(Last-Event-ID) 시 다시 보내 줄 최대 알림 수 - 넘으면 resync 로 전체 재조회를 요청한다
+CATCH_UP_LIMIT = 100
+# 연결이 끊겼을 때 브라우저 EventSource 의 재접속 대기(ms)
+RETRY_MILLISECONDS = 3000
+
+
+def event_id(moment):
+    """알림 수정일시 → 이벤트 ID (에포크 마이크로초) - 새 알림과 묶음 알림 갱신 모두 커서가 된다"""
+    return (moment - EPOCH) // timedelta(microseconds=1)
+
+
+def parse_event_id(value):
+    """Last-Event-ID → 수정일시 (잘못된 값이면 None)"""
+    try:
+        return EPOCH + timedelta(microseconds=int(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def notification_event(notification):
+    return {
+        'event': 'notification',
+        'id': event_id(notification.updated_at),
+        'data': dict(NotificationSerializer(notification).data),
+    }
+
+
+def format_event(event):
+    """이벤트 → text/event-stream 메시지"""
+    lines = [f"event: {event['event']}"]
+    if 'id' in event:
+        lines.append(f"id: {event['id']}")
+    lines.append(f"data: {json.dumps(event.get('data', {}), cls=DjangoJSONEncoder, ensure_ascii=False)}")
+    return '\n'.join(lines) + '\n\n'
+
+
+def publish_notifications(notifications):
+    """알림을 구독 중인 연결로 보낸다 - 트랜잭션 안이면 커밋된 뒤로 미룬다"""
+    events = [(notification.user_id, notification_event(notification)) for notification in notifications]
+    if events:
+        transaction.on_commit(lambda: get_broker().publish(events), robust=True)
+
+
+def publish_read(user_ids, read_at, **data):
+    """읽음 처리(조건부·일괄 UPDATE 라 post_save 가 없다)를 사용자별 read 이벤트로 보낸다
+
+    커밋된 뒤 사용자별 읽지 않은 알림 수를 한 번에 읽어 배지 값으로 함께 보낸다.
+    data 는 어떤 알림을 읽었는지(ids 또는 until) 클라이언트에 알려 주는 값이다.
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+
+    def publish():
+        counts = dict(
+            NotificationCounter.objects.filter(user_id__in=user_ids).values_list('user_id', 'unread_count')
+        )
+        get_broker().publish([
+            (user_id, {'event': 'read', 'data': dict(data, read_at=read_at, unread_count=max(counts.get(user_id, 0), 0))})
+            for user_id in user_ids
+        ])
+
+    transaction.on_commit(publish, robust=True)
+
+
+def missed_events(user_id, since, limit=CATCH_UP_LIMIT):
+    """since 이후 생성·갱신된 알림 이벤트와 빠짐없이 다 담았는지 여부"""
+    notifications = list(
+        Notification.objects.filter(user_id=user_id, updated_at__gt=since).order_by('updated_at', 'id')[:limit + 1]
+    )
+    return [notification_event(notification) for notification in notifications[:limit]], len(notifications) <= limit
+
+
+async def event_stream(user_id, since=None, heartbeat=None, broker=None):
+    """사용자 한 명의 알림 이벤트 스트림
+
+    구독을 먼저 걸고 놓친 알림을 DB 에서 채우므로 그 사이의 알림이 빠지지 않는다(중복은 클라이언트가
+    알림 id 로 거른다). 연결이 유휴 상태인 동안은 큐에서 대기할 뿐 DB 를 조회하지 않는다.
+    """
+    broker = broker or get_broker()
+    heartbeat = heartbeat or settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS
+    subscription = broker.subscribe(user_id)
+    try:
+        yield f'retry: {RETRY_MILLISECONDS}\n\n'
+        if since is not None:
+            events, complete = await sync_to_async(missed_events)(user_id, since)
+            for event in events:
+                yield format_event(event)
+            if not complete:
+                yield format_event({'event': 'resync'})
+        while True:
+            event = await subscription.get(heartbeat)
+            # 프록시가 유휴 연결을 끊지 않도록 주기적으로 주석 한 줄을 보낸다
+            yield format_event(event) if event is not None else ': keepalive\n\n'
+    finally:
+        subscription.close()
@@ -1,3 +1,482 @@
-from django.test import TestCase
+import asyncio
+import threading
+from datetime import timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from accounts.models import Account
+from accounts.services import bulk_ingest_transactions, post_transaction
+from users.activity import login_activity
+from .broker import InProcessBroker, get_broker
+from .counters import mark_all_read, mark_read, reconcile_unread_counts, unread_count
+from .digests import record_transaction_digests
+from .models import Notification, NotificationCounter, NotificationOutbox
+from .outbox import enqueue_messages, outbox_stats, process_outbox
+from .retention import purge_notifications, purge_outbox
+from .streams import event_id, event_stream, missed_events, parse_event_id
+
+User = get_user_model()
+
+
+class RecordingBroker(InProcessBroker):
+    published = []
+
+    def publish(self, events):
+        RecordingBroker.published.extend(events)
+        super().publish(events)
+
+
+@override_settings(TRANSACTION_NOTIFICATION_MODE='digest', TRANSACTION_DIGEST_WINDOW_SECONDS=600)
+class TransactionDigestTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="digest", email="digest@example.com", password="1234", nickname="digest", name="묶음"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="920-100", bank_code="004", account_type="checking"
+        )
+
+    def _digests(self):
+        process_outbox()
+        return Notification.objects.filter(user=self.user, notification_type='transaction').order_by('id')
+
+    def test_transactions_in_window_update_one_row(self):
+        for _ in range(12):
+            post_transaction(self.account, Decimal("10250.00"), 'withdrawal')
+        post_transaction(self.account, Decimal("5000.00"), 'deposit')
+        bulk_ingest_transactions([
+            {'account': self.account, 'amount': Decimal("1000.00"), 'transaction_type': 'withdrawal',
+             'transaction_date': timezone.now()}
+            for _ in range(3)
+        ])
+
+        digest = self._digests().get()
+        self.assertEqual(digest.message, "출금 15건 합계 126,000.00원, 입금 1건 합계 5,000.00원")
+        self.assertGreater(digest.digest_until, timezone.now())
+
+    def test_closed_or_read_digest_starts_new_one(self):
+        post_transaction(self.account, Decimal("100.00"), 'withdrawal')
+        self._digests().update(digest_until=timezone.now() - timedelta(seconds=1))
+        post_transaction(self.account, Decimal("200.00"), 'withdrawal')
+        self._digests().last().mark_as_read()
+        post_transaction(self.account, Decimal("300.00"), 'withdrawal')
+
+        self.assertEqual(list(self._digests().values_list('message', flat=True)), [
+            "출금 1건 합계 100.00원", "출금 1건 합계 200.00원", "출금 1건 합계 300.00원",
+        ])
+
+    @override_settings(TRANSACTION_NOTIFICATION_MODE='each')
+    def test_each_mode_keeps_one_row_per_transaction(self):
+        post_transaction(self.account, Decimal("100.00"), 'withdrawal')
+        post_transaction(self.account, Decimal("200.00"), 'withdrawal')
+        self.assertEqual(self._digests().count(), 2)
+        self.assertIsNone(self._digests().first().digest_until)
+
+
+class DigestConcurrencyTest(TransactionTestCase):
+    """여러 워커가 동시에 같은 사용자의 묶음을 열어도 열린 묶음은 하나"""
+
+    threads = 6
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="digest2", email="digest2@example.com", password="1234", nickname="digest2", name="묶음"
+        )
+
+    def _worker(self, barrier, errors):
+        try:
+            barrier.wait()
+            record_transaction_digests({self.user.pk: {
+                'deposit_count': 0, 'deposit_total': Decimal("0.00"),
+                'withdrawal_count': 1, 'withdrawal_total': Decimal("100.00"),
+            }})
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    @override_settings(TRANSACTION_DIGEST_WINDOW_SECONDS=600)
+    def test_concurrent_workers_share_one_open_digest(self):
+        barrier, errors = threading.Barrier(self.threads), []
+        workers = [threading.Thread(target=self._worker, args=(barrier, errors)) for _ in range(self.threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(errors, [])
+
+        digest = Notification.objects.get(user=self.user, notification_type='transaction')
+        self.assertEqual(digest.withdrawal_count, self.threads)
+        self.assertEqual(unread_count(self.user.pk), 1)
+
+
+class NotificationOutboxTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="outbox", email="outbox@example.com", password="1234", nickname="outbox", name="아웃박스"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="930-100", bank_code="004", account_type="checking"
+        )
+
+    def test_posting_writes_outbox_not_notifications(self):
+        with CaptureQueriesContext(connection) as queries:
+            post_transaction(self.account, Decimal("100.00"), 'withdrawal')
+        self.assertFalse([query for query in queries if '"notifications"' in query['sql']])
+        self.assertEqual(NotificationOutbox.objects.filter(user=self.user, processed_at__isnull=True).count(), 1)
+        self.assertFalse(Notification.objects.filter(user=self.user).exists())
+
+    def test_worker_creates_notifications_once(self):
+        post_transaction(self.account, Decimal("100.00"), 'withdrawal')
+        bulk_ingest_transactions([
+            {'account': self.account, 'amount': Decimal("10.00"), 'transaction_type': 'deposit',
+             'transaction_date': timezone.now()}
+            for _ in range(3)
+        ])
+        self.assertEqual(process_outbox(batch_size=1), 2)
+        self.assertEqual(list(Notification.objects.filter(user=self.user).order_by('id').values_list('message', flat=True)), [
+            "출금 100.00원이 처리되었습니다.",
+            "거래내역 3건이 등록되었습니다. (입금 30.00원, 출금 0.00원)",
+        ])
+
+        # 처리 완료 표시가 유실되어 다시 처리되어도 알림은 중복되지 않는다
+        NotificationOutbox.objects.update(processed_at=None)
+        self.assertEqual(process_outbox(), 2)
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(process_outbox(), 0)
+
+    def test_malformed_entry_is_recorded(self):
+        NotificationOutbox.objects.create(user=self.user, kind='transaction', payload={'deposit_count': 1})
+        enqueue_messages([(self.user.pk, 'budget', "예산 알림")])
+        self.assertEqual(process_outbox(), 2)
+
+        failed = NotificationOutbox.objects.exclude(error='').get()
+        self.assertIn('KeyError', failed.error)
+        self.assertIsNotNone(failed.processed_at)
+        self.assertEqual(Notification.objects.get(user=self.user).message, "예산 알림")
+
+    def test_stats_report_pending_and_lag(self):
+        post_transaction(self.account, Decimal("100.00"), 'withdrawal')
+        post_transaction(self.account, Decimal("200.00"), 'withdrawal')
+        self.assertEqual(outbox_stats()['pending'], 2)
+
+        NotificationOutbox.objects.filter(pk=NotificationOutbox.objects.first().pk).update(
+            created_at=timezone.now() - timedelta(seconds=30)
+        )
+        process_outbox()
+        stats = outbox_stats()
+        self.assertEqual(stats['pending'], 0)
+        self.assertEqual(stats['processed'], 2)
+        self.assertGreaterEqual(stats['lag_max'], 30)
+
+
+class NotificationStreamTest(SimpleTestCase):
+    def test_thousands_of_idle_connections(self):
+        async def scenario():
+            broker = InProcessBroker()
+            streams = [event_stream(user_id, heartbeat=60, broker=broker) for user_id in range(5000)]
+            for stream in streams:
+                self.assertEqual(await anext(stream), 'retry: 3000\n\n')
+            self.assertEqual(broker.connection_count(), 5000)
+
+            waiting = [asyncio.ensure_future(anext(stream)) for stream in streams]
+            await asyncio.sleep(0)
+            broker.publish([(7, {'event': 'notification', 'id': 1, 'data': {'message': '입금'}})])
+            chunk = await asyncio.wait_for(waiting[7], 1)
+            await asyncio.sleep(0)
+            idle = sum(not task.done() for task in waiting)
+
+            for task in waiting:
+                task.cancel()
+            await asyncio.gather(*waiting, return_exceptions=True)
+            for stream in streams:
+                await stream.aclose()
+            return chunk, idle, broker.connection_count()
+
+        chunk, idle, remaining = asyncio.run(scenario())
+        self.assertEqual(chunk, 'event: notification\nid: 1\ndata: {"message": "입금"}\n\n')
+        self.assertEqual(idle, 4999)
+        self.assertEqual(remaining, 0)
+
+    def test_slow_consumer_gets_resync(self):
+        async def scenario():
+            broker = InProcessBroker()
+            stream = event_stream(1, heartbeat=60, broker=broker)
+            await anext(stream)
+            broker.publish([(1, {'event': 'notification', 'id': i, 'data': {}}) for i in range(500)])
+            chunk = await anext(stream)
+            await stream.aclose()
+            return chunk
+
+        self.assertEqual(asyncio.run(scenario()), 'event: resync\ndata: {}\n\n')
+
+
+@override_settings(NOTIFICATION_BROKER='notification.tests.RecordingBroker')
+class NotificationPushTest(TestCase):
+    def setUp(self):
+        RecordingBroker.published.clear()
+        self.user = User.objects.create_user(
+            username="push", email="push@example.com", password="1234", nickname="push", name="푸시"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="940-100", bank_code="004", account_type="checking"
+        )
+
+    def test_worker_publishes_after_commit(self):
+        post_transaction(self.account, Decimal("100.00"), 'withdrawal')
+        with self.captureOnCommitCallbacks(execute=True):
+            process_outbox()
+        notification = Notification.objects.get(user=self.user)
+        [(user_id, event)] = RecordingBroker.published
+        self.assertEqual(user_id, self.user.pk)
+        self.assertEqual(event['id'], event_id(notification.updated_at))
+        self.assertEqual(event['data']['id'], notification.pk)
+        self.assertEqual(event['data']['message'], "출금 100.00원이 처리되었습니다.")
+
+    def test_reconnect_replays_missed_notifications(self):
+        first = Notification.objects.create(user=self.user, message="첫 알림")
+        second = Notification.objects.create(user=self.user, message="둘째 알림")
+        Notification.objects.filter(pk=second.pk).update(updated_at=first.updated_at + timedelta(seconds=1))
+
+        since = parse_event_id(str(event_id(first.updated_at)))
+        events, complete = missed_events(self.user.pk, since)
+        self.assertEqual([event['data']['message'] for event in events], ["둘째 알림"])
+        self.assertTrue(complete)
+        self.assertFalse(missed_events(self.user.pk, since - timedelta(seconds=1), limit=1)[1])
+        self.assertIsNone(parse_event_id('abc'))
+
+    def test_read_updates_publish_read_events(self):
+        notifications = [Notification.objects.create(user=self.user, message=f"알림 {i}") for i in range(3)]
+        with self.captureOnCommitCallbacks(execute=True):
+            notifications[0].mark_as_read()
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_all_read(self.user.pk, until=notifications[1].pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_read(Notification.objects.all())
+            mark_all_read(self.user.pk)  # 더 읽을 알림이 없으면 보내지 않는다
+
+        events = [event for user_id, event in RecordingBroker.published if user_id == self.user.pk]
+        self.assertEqual([event['event'] for event in events], ['read'] * 3)
+        self.assertEqual(events[0]['data']['ids'], [notifications[0].pk])
+        self.assertEqual(events[1]['data']['until'], notifications[1].pk)
+        self.assertEqual([event['data']['unread_count'] for event in events], [2, 1, 0])
+
+    def test_stream_requires_login(self):
+        self.assertEqual(self.client.get('/api/notifications/stream/').status_code, 403)
+
+
+class UnreadCounterTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="badge", email="badge@example.com", password="1234", nickname="badge", name="배지"
+        )
+        self.other = User.objects.create_user(
+            username="badge2", email="badge2@example.com", password="1234", nickname="badge2", name="배지"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="950-100", bank_code="004", account_type="checking"
+        )
+        self.client.force_authenticate(self.user)
+
+    def _notify(self, user, count):
+        return [Notification.objects.create(user=user, message=f"알림 {i}") for i in range(count)]
+
+    def test_counter_follows_create_read_and_delete(self):
+        notifications = self._notify(self.user, 3)
+        post_transaction(self.account, Decimal("100.00"), 'withdrawal')
+        process_outbox()
+        self.assertEqual(unread_count(self.user.pk), 4)
+
+        self.assertTrue(notifications[0].mark_as_read())
+        self.assertFalse(Notification.objects.get(pk=notifications[0].pk).mark_as_read())
+        self.client.patch(f'/api/notifications/{notifications[1].pk}/', {'is_read': True}, format='json')
+        notifications[2].delete()
+        self.assertEqual(unread_count(self.user.pk), 1)
+
+        self.client.patch(f'/api/notifications/{notifications[1].pk}/', {'is_read': False}, format='json')
+        self.assertEqual(self.client.get('/api/notifications/unread_count/').data, {'unread_count': 2})
+        self.assertEqual(reconcile_unread_counts(), [])
+
+    def test_unread_count_does_not_scale_with_rows(self):
+        self._notify(self.user, 2)
+        with CaptureQueriesContext(connection) as small:
+            self.client.get('/api/notifications/unread_count/')
+        self._notify(self.user, 50)
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get('/api/notifications/unread_count/')
+        self.assertEqual(response.data['unread_count'], 52)
+        self.assertEqual(len(small), len(large))
+        self.assertFalse([query for query in large if '"notifications"' in query['sql']])
+
+    def test_mark_all_read_up_to_cursor(self):
+        notifications = self._notify(self.user, 5)
+        self._notify(self.other, 2)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/api/notifications/mark_all_read/', {'until': notifications[2].pk}, format='json')
+        self.assertEqual(response.data, {'updated': 3, 'unread_count': 2})
+        self.assertEqual(sum(query['sql'].startswith('UPDATE "notifications"') for query in queries), 1)
+
+        response = self.client.post('/api/notifications/mark_all_read/', {}, format='json')
+        self.assertEqual(response.data, {'updated': 2, 'unread_count': 0})
+        self.assertEqual(unread_count(self.other.pk), 2)
+        self.assertEqual(self.client.post('/api/notifications/mark_all_read/', {'until': 'x'}, format='json').status_code, 400)
+
+    def test_bulk_mark_read_across_users(self):
+        self._notify(self.user, 3)
+        self._notify(self.other, 2)[0].mark_as_read()
+        self.assertEqual(mark_read(Notification.objects.all()), 4)
+        self.assertEqual((unread_count(self.user.pk), unread_count(self.other.pk)), (0, 0))
+
+    def test_reconcile_repairs_drift(self):
+        self._notify(self.user, 3)
+        self._notify(self.other, 1)
+        NotificationCounter.objects.filter(user=self.user).update(unread_count=10)
+        NotificationCounter.objects.filter(user=self.other).delete()
+
+        self.assertEqual(reconcile_unread_counts(dry_run=True), [(self.user.pk, 10, 3), (self.other.pk, None, 1)])
+        self.assertEqual(unread_count(self.user.pk), 10)
+        reconcile_unread_counts()
+        self.assertEqual((unread_count(self.user.pk), unread_count(self.other.pk)), (3, 1))
+        self.assertEqual(reconcile_unread_counts(), [])
+
+
+@override_settings(
+    NOTIFICATION_RETENTION={
+        'default': {'read_days': 30, 'unread_days': 90},
+        'transaction': {'read_days': 14, 'unread_days': 60},
+        'system': {'read_days': 90, 'unread_days': None},
+    },
+    NOTIFICATION_OUTBOX_RETENTION_DAYS=7,
+)
+class NotificationRetentionTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="retention", email="retention@example.com", password="1234", nickname="retention", name="보관"
+        )
+
+    def _notify(self, notification_type, days_old, is_read=False):
+        notification = Notification.objects.create(
+            user=self.user, notification_type=notification_type, message=f"{notification_type} {days_old}일 전"
+        )
+        if is_read:
+            notification.mark_as_read()
+        Notification.objects.filter(pk=notification.pk).update(created_at=timezone.now() - timedelta(days=days_old))
+        return notification
+
+    def test_purges_by_type_and_read_state(self):
+        self._notify('transaction', 20, is_read=True)
+        self._notify('transaction', 20)
+        self._notify('analysis', 40, is_read=True)
+        self._notify('system', 400)
+        self._notify('budget', 100)
+        self._notify('budget', 1)
+
+        self.assertEqual(purge_notifications(batch_size=2, dry_run=True)['deleted'], 3)
+        self.assertEqual(Notification.objects.count(), 6)
+
+        result = purge_notifications(batch_size=2)
+        self.assertEqual(result['by_type'], {'transaction': 1, 'analysis': 1, 'budget': 1})
+        self.assertGreater(result['batches'], 1)
+        self.assertEqual(sorted(Notification.objects.values_list('message', flat=True)), [
+            "budget 1일 전", "system 400일 전", "transaction 20일 전",
+        ])
+        self.assertEqual(unread_count(self.user.pk), 3)
+        self.assertEqual(reconcile_unread_counts(), [])
+        self.assertEqual(purge_notifications()['deleted'], 0)
+
+    def test_purges_processed_outbox_entries(self):
+        enqueue_messages([(self.user.pk, 'system', "오래된 항목"), (self.user.pk, 'system', "최근 항목")])
+        process_outbox()
+        enqueue_messages([(self.user.pk, 'system', "대기 항목")])
+        old = NotificationOutbox.objects.order_by('id').first()
+        NotificationOutbox.objects.filter(pk=old.pk).update(processed_at=timezone.now() - timedelta(days=8))
+
+        self.assertEqual(purge_outbox(), 1)
+        self.assertEqual(NotificationOutbox.objects.count(), 2)
+
+
+@override_settings(NOTIFICATION_BROKER='notification.broker.InProcessBroker', NOTIFICATION_LONG_POLL_SECONDS=5)
+class NotificationFeedTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="feed", email="feed@example.com", password="1234", nickname="feed", name="피드"
+        )
+        other = User.objects.create_user(
+            username="feed2", email="feed2@example.com", password="1234", nickname="feed2", name="피드"
+        )
+        self.notifications = [Notification.objects.create(user=self.user, message=f"알림 {i}") for i in range(5)]
+        Notification.objects.create(user=other, message="다른 사용자")
+        self.client.force_authenticate(self.user)
+        self.addCleanup(login_activity.clear)
+
+    def test_cursor_pages_cover_all_rows_once(self):
+        seen = []
+        url = '/api/notifications/?page_size=2'
+        response = self.client.get(url)
+        latest = response.data['latest']
+        while url:
+            response = self.client.get(url)
+            seen.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+        self.assertEqual(seen, [notification.pk for notification in reversed(self.notifications)])
+        self.assertIsNotNone(latest)
+
+    def test_since_returns_only_newer_items_oldest_first(self):
+        latest = self.client.get('/api/notifications/?page_size=1').data['latest']
+        newer = [Notification.objects.create(user=self.user, message=f"새 알림 {i}") for i in range(3)]
+
+        response = self.client.get(f'/api/notifications/?since={latest}&page_size=2')
+        self.assertEqual([item['id'] for item in response.data['results']], [newer[0].pk, newer[1].pk])
+        response = self.client.get(response.data['next'])
+        self.assertEqual([item['id'] for item in response.data['results']], [newer[2].pk])
+        self.assertIsNone(response.data['next'])
+
+        caught_up = self.client.get(f"/api/notifications/?since={response.data['latest']}")
+        self.assertEqual(caught_up.data['results'], [])
+        self.assertEqual(caught_up.data['latest'], response.data['latest'])
+        self.assertEqual(self.client.get('/api/notifications/?since=garbage').status_code, 404)
+
+    def test_since_returns_updated_and_read_items(self):
+        latest = self.client.get('/api/notifications/?page_size=1').data['latest']
+        self.notifications[0].mark_as_read()
+        digest = self.notifications[1]
+        digest.message = "묶음 알림 갱신"
+        digest.save()
+
+        results = self.client.get(f'/api/notifications/?since={latest}').data['results']
+        self.assertEqual([item['id'] for item in results], [self.notifications[0].pk, digest.pk])
+        self.assertTrue(results[0]['is_read'])
+        self.assertEqual(results[1]['message'], "묶음 알림 갱신")
+
+    def test_unread_is_paginated(self):
+        self.notifications[4].mark_as_read()
+        response = self.client.get('/api/notifications/unread/?page_size=3')
+        self.assertEqual([item['id'] for item in response.data['results']],
+                         [self.notifications[3].pk, self.notifications[2].pk, self.notifications[1].pk])
+        self.assertIsNotNone(response.data['next'])
+
+    def test_long_poll_returns_empty_after_wait(self):
+        self.client.force_login(self.user)
+        latest = self.client.get('/api/notifications/poll/?wait=0').json()['latest']
+        response = self.client.get(f'/api/notifications/poll/?since={latest}&wait=0.05')
+        self.assertEqual(response.json()['results'], [])
+        self.assertEqual(response.json()['latest'], latest)
+
+    async def test_long_poll_wakes_on_new_notification(self):
+        await self.async_client.aforce_login(self.user)
+        latest = (await self.async_client.get('/api/notifications/poll/?wait=0')).json()['latest']
+        poll = asyncio.ensure_future(self.async_client.get(f'/api/notifications/poll/?since={latest}&wait=5'))
+        await asyncio.sleep(0.1)
+        self.assertFalse(poll.done())
+
+        notification = await Notification.objects.acreate(user=self.user, message="새 알림")
+        get_broker().publish([(self.user.pk, {'event': 'notification'})])
+        response = await asyncio.wait_for(poll, 2)
+        self.assertEqual([item['id'] for item in response.json()['results']], [notification.pk])
@@ -1,10 +1,12 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import NotificationViewSet
+from .views import NotificationViewSet, notification_poll, notification_stream
 
 router = DefaultRouter()
 router.register(r'notifications', NotificationViewSet, basename='notification')
 
 urlpatterns = [
+    path('notifications/stream/', notification_stream, name='notification-stream'),
+    path('notifications/poll/', notification_poll, name='notification-poll'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -1,13 +1,26 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
 from rest_framework import viewsets, permissions
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.request import Request
 from rest_framework.response import Response
+from users.authentication import aauthenticate
+from .broker import get_broker
+from .counters import mark_all_read, unread_count
 from .models import Notification
+from .pagination import NotificationCursorPagination
 from .serializers import NotificationSerializer
+from .streams import event_stream, parse_event_id
 
 
 class NotificationViewSet(viewsets.ModelViewSet):
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NotificationCursorPagination
 
     def get_queryset(self):
         return Notification.objects.filter(user=self.request.user)
@@ -21,7 +34,79 @@ class NotificationViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def unread(self, request):
-        """읽지 않은 알림 조회"""
-        unread_notifications = self.get_queryset().filter(is_read=False)
-        serializer = self.get_serializer(unread_notifications, many=True)
-        return Response(serializer.data)
\ No newline at end of file
+        """읽지 않은 알림 조회 (목록과 같은 cursor/since 페이지네이션)"""
+        page = self.paginate_queryset(self.get_queryset().filter(is_read=False))
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    def unread_count(self, request):
+        """읽지 않은 알림 수 (배지용, 카운터 한 행 조회)"""
+        return Response({'unread_count': unread_count(request.user.pk)})
+
+    @action(detail=False, methods=['post'])
+    def mark_all_read(self, request):
+        """읽지 않은 알림을 모두 읽음으로 표시 - until(알림 id)을 주면 그 알림까지만"""
+        until = request.data.get('until')
+        if until is not None:
+            try:
+                until = int(until)
+            except (TypeError, ValueError):
+                raise ValidationError({'until': "알림 id 는 정수여야 합니다."})
+        updated = mark_all_read(request.user.pk, until)
+        return Response({'updated': updated, 'unread_count': unread_count(request.user.pk)})
+
+
+async def notification_stream(request):
+    """새 알림을 Server-Sent Events 로 전달 (/unread 폴링 대체, ASGI 서버에서 실행)
+
+    재접속 시 Last-Event-ID 헤더(또는 last_event_id 쿼리) 이후의 알림을 먼저 보낸다.
+    """
+    user = await aauthenticate(request)
+    if not user.is_authenticated:
+        return JsonResponse({'detail': '자격 인증데이터(authentication credentials)가 제공되지 않았습니다.'}, status=403)
+    since = parse_event_id(request.headers.get('Last-Event-ID') or request.GET.get('last_event_id'))
+    response = StreamingHttpResponse(event_stream(user.pk, since), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx 버퍼링 끄기
+    return response
+
+
+def feed_page(request, user_id):
+    """알림 피드 한 페이지 (since 가 있으면 그 이후 변경분)"""
+    request = Request(request)
+    paginator = NotificationCursorPagination()
+    page = paginator.paginate_queryset(Notification.objects.filter(user_id=user_id), request)
+    return paginator.get_paginated_response(NotificationSerializer(page, many=True).data).data
+
+
+async def notification_poll(request):
+    """since 커서 이후 새 알림 롱폴링
+
+    새 알림이 없으면 wait 초(최대 NOTIFICATION_LONG_POLL_SECONDS) 동안 브로커 이벤트를 기다렸다가
+    다시 조회한다. 기다리는 동안은 DB 를 조회하지 않는다.
+    """
+    user = await aauthenticate(request)
+    if not user.is_authenticated:
+        return JsonResponse({'detail': '자격 인증데이터(authentication credentials)가 제공되지 않았습니다.'}, status=403)
+    try:
+        wait = float(request.GET.get('wait', settings.NOTIFICATION_LONG_POLL_SECONDS))
+    except ValueError:
+        return JsonResponse({'wait': ["대기 시간(초)은 숫자여야 합니다."]}, status=400)
+    wait = max(0.0, min(wait, settings.NOTIFICATION_LONG_POLL_SECONDS))
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    # 조회 전에 구독해 두어야 조회와 대기 사이에 생긴 알림도 놓치지 않는다
+    subscription = get_broker().subscribe(user.pk)
+    try:
+        while True:
+            try:
+                data = await sync_to_async(feed_page)(request, user.pk)
+            except NotFound as exc:
+                return JsonResponse({'detail': str(exc.detail)}, status=404)
+            remaining = deadline - loop.time()
+            if data['results'] or remaining <= 0 or await subscription.get(remaining) is None:
+                return JsonResponse(data)
+    finally:
+        subscription.close()
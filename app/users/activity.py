@@ -0,0 +1,123 @@
+import atexit
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.signals import user_logged_in
+from django.core.signals import request_finished
+from django.db import DatabaseError
+from django.db.models import F
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import ACTIVITY_FIELDS
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+class LoginActivityBuffer:
+    """로그인 횟수·최종 로그인 IP·시각을 프로세스 메모리에 모아 두는 쓰기 지연 버퍼
+
+    로그인마다 users 행을 갱신하지 않고, flush() 때 사용자별 (횟수는 F() 로 더하기, IP·시각은 마지막 값)
+    을 UPDATE 한 번으로 기록한다. 기록이 실패하면 모은 값을 버퍼에 되돌려 다음 flush 에서 다시 쓴다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}  # 사용자 ID → [로그인 횟수, 최종 IP, 최종 로그인 시각]
+        self._flushed_at = time.monotonic()
+
+    def record(self, user_id, ip=None, when=None, count=1):
+        when = when or timezone.now()
+        with self._lock:
+            entry = self._pending.setdefault(user_id, [0, None, when])
+            entry[0] += count
+            if ip:
+                entry[1] = ip
+            entry[2] = max(entry[2], when)
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    def due(self):
+        """flush 할 때가 되었는지 - 마지막 flush 뒤 FLUSH_SECONDS 가 지났거나 MAX_PENDING 명 이상 모임"""
+        with self._lock:
+            if not self._pending:
+                return False
+            elapsed = time.monotonic() - self._flushed_at
+            return (elapsed >= settings.LOGIN_ACTIVITY['FLUSH_SECONDS']
+                    or len(self._pending) >= settings.LOGIN_ACTIVITY['MAX_PENDING'])
+
+    def flush(self):
+        """모은 값을 기록 - 반환값: 기록한 사용자 수 (탈퇴로 행이 없는 사용자는 버린다)"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._flushed_at = time.monotonic()
+        if not pending:
+            return 0
+        try:
+            User.objects.bulk_update(
+                [User(pk=user_id, login_count=F('login_count') + count,
+                      last_login_ip=ip if ip else F('last_login_ip'), last_login=when)
+                 for user_id, (count, ip, when) in pending.items()],
+                list(ACTIVITY_FIELDS),
+            )
+        except Exception:
+            with self._lock:
+                for user_id, (count, ip, when) in pending.items():
+                    entry = self._pending.setdefault(user_id, [0, None, when])
+                    entry[0] += count
+                    entry[1] = entry[1] or ip
+                    entry[2] = max(entry[2], when)
+            raise
+        return len(pending)
+
+    def clear(self):
+        with self._lock:
+            self._pending.clear()
+
+
+login_activity = LoginActivityBuffer()
+
+
+def record_login(user, ip=None):
+    """로그인 한 번 기록 (DB 쓰기 없음) - 인스턴스 값도 맞춰 둔다"""
+    now = timezone.now()
+    login_activity.record(user.pk, ip, now)
+    user.login_count += 1
+    user.last_login_ip = ip or user.last_login_ip
+    user.last_login = now
+
+
+@receiver(user_logged_in)
+def _buffer_last_login(sender, request, user, **kwargs):
+    # django.contrib.auth 의 update_last_login 대신 (UsersConfig.ready 에서 연결 해제) 시각만 버퍼에 남긴다
+    now = timezone.now()
+    login_activity.record(user.pk, when=now, count=0)
+    user.last_login = now
+
+
+@receiver(request_finished)
+def _flush_if_due(sender, **kwargs):
+    # 응답을 보낸 뒤에 기록하므로 로그인 응답 시간에는 더해지지 않는다
+    if login_activity.due():
+        try:
+            login_activity.flush()
+        except Exception:
+            logger.exception('로그인 활동 기록 실패 - 다음 요청 뒤에 다시 시도')
+
+
+@atexit.register
+def _flush_at_exit():
+    try:
+        login_activity.flush()
+    except DatabaseError as exc:
+        # 테스트 DB 를 지운 뒤처럼 기록할 곳이 없으면 추적 정보 없이 넘어간다
+        logger.info('종료 시 로그인 활동을 기록하지 못함 (%s) - %d명분 유실', exc, login_activity.pending())
+    except Exception:
+        logger.exception('종료 시 로그인 활동 기록 실패 - %d명분 유실', login_activity.pending())
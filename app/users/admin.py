@@ -17,10 +17,15 @@ class CustomUserAdmin(UserAdmin):
     )
     search_fields = ('email', 'nickname', 'name', 'username')
     ordering = ('-created_at',)
+    # 로그인 활동 필드는 users.activity 가 기록하므로 관리자 화면에서 고치지 않는다
+    readonly_fields = (
+        'profile_image_pending', 'profile_image_variants', 'last_login', 'last_login_ip', 'login_count',
+    )
 
     fieldsets = (
         (None, {'fields': ('email', 'password')}),
         ('개인정보', {'fields': ('username', 'nickname', 'name', 'birth_date', 'phone', 'profile_image')}),
+        ('프로필 이미지 변환', {'fields': ('profile_image_pending', 'profile_image_variants')}),
         ('소셜 로그인', {'fields': ('social_provider', 'social_id')}),
         ('계정 상태', {'fields': ('is_active', 'is_verified', 'verification_token')}),
         ('권한', {'fields': ('is_staff', 'is_superuser', 'groups', 'user_permissions')}),
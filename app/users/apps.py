@@ -3,4 +3,14 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
-    verbose_name = '사용자 관리'
\ No newline at end of file
+    verbose_name = '사용자 관리'
+
+    def ready(self):
+        from django.contrib.auth.signals import user_logged_in
+
+        import users.activity
+        import users.authentication
+        import users.availability
+
+        # 로그인 시각은 users.activity 버퍼가 모아서 기록한다
+        user_logged_in.disconnect(dispatch_uid='update_last_login')
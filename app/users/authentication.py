@@ -0,0 +1,126 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+
+from .tokens import ACCESS, TokenError, auth_version, read_token
+
+User = get_user_model()
+
+
+class UserCache:
+    """최근 인증한 사용자 LRU 캐시 (프로세스 단위)
+
+    사용자가 저장·삭제되면 이 프로세스에서는 바로 지우고, 다른 프로세스의 캐시는
+    ttl 초가 지나면 다시 읽으므로 비밀번호 변경·비활성화가 늦어도 ttl 안에 반영된다.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._users = OrderedDict()
+
+    def get(self, user_id):
+        """→ (사용자, 인증 버전) 또는 None"""
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry is None:
+                return None
+            user, version, loaded_at = entry
+            if time.monotonic() - loaded_at > self.ttl:
+                del self._users[user_id]
+                return None
+            self._users.move_to_end(user_id)
+            return user, version
+
+    def set(self, user):
+        """캐시에 넣고 인증 버전을 돌려준다"""
+        version = auth_version(user)
+        with self._lock:
+            self._users[user.pk] = (user, version, time.monotonic())
+            self._users.move_to_end(user.pk)
+            while len(self._users) > self.maxsize:
+                self._users.popitem(last=False)
+        return version
+
+    def discard(self, user_id):
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._users.clear()
+
+
+user_cache = UserCache(settings.AUTH_TOKEN['USER_CACHE_SIZE'], settings.AUTH_TOKEN['USER_CACHE_SECONDS'])
+
+
+@receiver([post_save, post_delete], sender=User)
+def _user_changed(sender, instance, **kwargs):
+    user_cache.discard(instance.pk)
+
+
+def resolve_token(token):
+    """액세스 토큰 → 사용자 (캐시에 있으면 DB 조회 없음)
+
+    캐시의 인스턴스를 요청끼리 공유하지 않도록 복사본을 돌려준다.
+    """
+    user_id, version = read_token(token, ACCESS)
+    cached = user_cache.get(user_id)
+    if cached is None:
+        user = User.objects.filter(pk=user_id).first()
+        if user is None:
+            raise TokenError('존재하지 않는 사용자입니다.')
+        cached = user, user_cache.set(user)
+    user, current_version = cached
+    if not user.is_active or current_version != version:
+        raise TokenError('더 이상 유효하지 않은 토큰입니다.')
+    return copy.copy(user)
+
+
+def bearer_token(header):
+    parts = header.split()
+    if len(parts) != 2 or parts[0].lower() != b'bearer':
+        return None
+    return parts[1].decode()
+
+
+class AccessTokenAuthentication(BaseAuthentication):
+    """Authorization: Bearer <액세스 토큰> 인증 - 세션 테이블을 읽지 않는다"""
+    keyword = 'Bearer'
+
+    def authenticate(self, request):
+        try:
+            token = bearer_token(get_authorization_header(request))
+        except UnicodeDecodeError:
+            raise exceptions.AuthenticationFailed('유효하지 않은 토큰입니다.')
+        if token is None:
+            return None
+        try:
+            return resolve_token(token), token
+        except TokenError as exc:
+            raise exceptions.AuthenticationFailed(str(exc))
+
+    def authenticate_header(self, request):
+        return self.keyword
+
+
+async def aauthenticate(request):
+    """비동기 뷰용 인증 - Bearer 토큰이 있으면 토큰으로, 없으면 세션으로. 실패하면 익명 사용자"""
+    token = bearer_token(request.headers.get('Authorization', '').encode())
+    if token is None:
+        return await request.auser()
+    try:
+        return await sync_to_async(resolve_token)(token)
+    except TokenError:
+        return AnonymousUser()
@@ -0,0 +1,154 @@
+import hashlib
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+FIELDS = ('email', 'nickname')
+LOAD_CHUNK_SIZE = 5000
+
+
+class BloomFilter:
+    """블룸 필터 - '없음' 은 확실하고 '있음' 은 error_rate 확률로 틀린다"""
+
+    def __init__(self, capacity, error_rate):
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(round(self.size / capacity * math.log(2)), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        # 해시 두 개를 섞어 hash_count 개의 위치를 만든다 (double hashing)
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class AvailabilityIndex:
+    """이메일·닉네임 사용 여부 인덱스 (프로세스 단위)
+
+    필터에 없으면 DB 를 읽지 않고 사용 가능으로 답하고, 있을 수도 있으면 DB 로 확인한다.
+    이 프로세스의 가입·수정은 바로 반영되고 다른 프로세스의 가입은 ttl 초마다 다시 만들 때 반영되므로
+    결과는 입력 중 안내용이며, 실제 중복은 가입 시 유니크 제약이 막는다.
+
+    다시 만들 때가 된 것을 처음 본 요청이 백그라운드 스레드 하나를 띄워 전체를 읽어 새 필터를 만들게 하고,
+    그 요청을 포함한 모든 요청은 그동안 이전 필터(처음 만드는 중이면 DB)로 답하므로 재생성을 기다리지 않는다.
+    background 가 False 면 그 요청이 직접 만든다 (테스트처럼 다른 연결에서 데이터가 보이지 않을 때).
+    """
+
+    def __init__(self, error_rate, ttl, background=True):
+        self.error_rate = error_rate
+        self.ttl = ttl
+        self.background = background
+        self._lock = threading.Lock()
+        self._filters = None
+        self._built_at = 0.0
+        self._added = None  # 재생성 중 이 프로세스에서 저장된 사용자 값 - 새 필터에 옮겨 넣는다
+        self.stats = {'filtered': 0, 'queried': 0, 'false_positives': 0}
+
+    def _rebuild(self):
+        """새 필터를 잠금 밖에서 만들어 바꿔 끼운다 - 반환값: 새 필터"""
+        try:
+            count = User.objects.count()
+            # 다음 재생성 전까지 늘어날 가입을 감안해 여유를 둔다
+            filters = {field: BloomFilter(count * 2 + 1000, self.error_rate) for field in FIELDS}
+            for row in User.objects.values_list(*FIELDS).iterator(chunk_size=LOAD_CHUNK_SIZE):
+                for field, value in zip(FIELDS, row):
+                    filters[field].add(value)
+        except BaseException:
+            with self._lock:
+                self._added = None
+            raise
+        with self._lock:
+            for row in self._added or ():
+                for field, value in zip(FIELDS, row):
+                    if value not in filters[field]:
+                        filters[field].add(value)
+            self._filters, self._built_at, self._added = filters, time.monotonic(), None
+        return filters
+
+    def _rebuild_in_background(self):
+        try:
+            self._rebuild()
+        except Exception:
+            logger.exception('사용 여부 인덱스 재생성 실패 - 다음 요청에서 다시 시도')
+        finally:
+            connection.close()
+
+    def _filter(self, field):
+        """field 의 필터 (처음 만드는 중이라 아직 없으면 None)"""
+        with self._lock:
+            filters = self._filters
+            expired = time.monotonic() - self._built_at > self.ttl
+            full = filters is not None and any(f.count > f.capacity for f in filters.values())
+            rebuild = (filters is None or expired or full) and self._added is None
+            if rebuild:
+                self._added = []
+        if rebuild and self.background:
+            threading.Thread(target=self._rebuild_in_background, name='availability-rebuild', daemon=True).start()
+        elif rebuild:
+            filters = self._rebuild()
+        return filters[field] if filters is not None else None
+
+    def add(self, user):
+        row = tuple(getattr(user, field) for field in FIELDS)
+        with self._lock:
+            if self._added is not None:
+                self._added.append(row)
+            if self._filters is not None:
+                for field, value in zip(FIELDS, row):
+                    if value not in self._filters[field]:
+                        self._filters[field].add(value)
+
+    def is_available(self, field, value):
+        """field 값을 아직 아무도 쓰지 않으면 True"""
+        bloom = self._filter(field)
+        if bloom is not None and value not in bloom:
+            self._count('filtered')
+            return True
+        taken = User.objects.filter(**{field: value}).exists()
+        self._count('queried')
+        if not taken:
+            self._count('false_positives')
+        return not taken
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def clear(self):
+        with self._lock:
+            self._filters, self._added = None, None
+            self.stats = {'filtered': 0, 'queried': 0, 'false_positives': 0}
+
+
+availability_index = AvailabilityIndex(
+    settings.USER_AVAILABILITY_INDEX['ERROR_RATE'], settings.USER_AVAILABILITY_INDEX['REBUILD_SECONDS'],
+    settings.USER_AVAILABILITY_INDEX['BACKGROUND_REBUILD'],
+)
+
+
+@receiver(post_save, sender=User)
+def _user_saved(sender, instance, created, update_fields, **kwargs):
+    if created or update_fields is None or not set(FIELDS).isdisjoint(update_fields):
+        availability_index.add(instance)
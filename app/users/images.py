@@ -0,0 +1,126 @@
+import hashlib
+import io
+import logging
+import posixpath
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, features
+
+from .authentication import user_cache
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+PROCESS_BATCH_SIZE = 20
+EXTENSIONS = {'WEBP': 'webp', 'JPEG': 'jpg'}
+
+
+def output_format():
+    """변환본 저장 형식 - WebP 를 쓸 수 없는 Pillow 빌드면 JPEG"""
+    image_format = settings.PROFILE_IMAGE['FORMAT'].upper()
+    if image_format == 'WEBP' and not features.check('webp'):
+        return 'JPEG'
+    return image_format
+
+
+def render_variants(data):
+    """원본 이미지 바이트 → {변환본 이름: 인코딩된 바이트}
+
+    JPEG 는 가장 큰 변환본보다 작아지지 않는 범위에서 축소 디코딩(draft)해 디코딩 비용을 줄이고,
+    EXIF 방향을 적용한 뒤 크기마다 가운데를 잘라 맞춘다. EXIF·ICC 등 메타데이터는 옮기지 않는다.
+    """
+    variants = settings.PROFILE_IMAGE['VARIANTS']
+    image_format = output_format()
+    largest = max(max(size) for size in variants.values())
+    with Image.open(io.BytesIO(data)) as source:
+        source.draft('RGB', (largest, largest))
+        image = ImageOps.exif_transpose(source)
+        keep_alpha = image_format == 'WEBP' and ('A' in image.getbands() or 'transparency' in image.info)
+        image = image.convert('RGBA' if keep_alpha else 'RGB')
+
+    rendered = {}
+    for name, size in variants.items():
+        output = io.BytesIO()
+        ImageOps.fit(image, tuple(size), Image.Resampling.LANCZOS).save(
+            output, image_format, quality=settings.PROFILE_IMAGE['QUALITY']
+        )
+        rendered[name] = output.getvalue()
+    return rendered
+
+
+def variant_directory(user_id):
+    return f'profiles/variants/{user_id}'
+
+
+def variant_path(user_id, digest, name):
+    """원본 내용과 변환본 이름으로 정해지는 저장 경로 - 같은 원본을 다시 처리해도 같은 파일"""
+    return f'{variant_directory(user_id)}/{digest}-{name}.{EXTENSIONS[output_format()]}'
+
+
+def process_user_image(user_id, name):
+    """사용자 한 명의 프로필 이미지 변환본을 저장 → ({변환본 이름: 경로}, 원본 바이트, 변환본 바이트 합)"""
+    with default_storage.open(name, 'rb') as original:
+        data = original.read()
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    paths = {}
+    written = 0
+    for variant, content in render_variants(data).items():
+        path = variant_path(user_id, digest, variant)
+        if not default_storage.exists(path):
+            default_storage.save(path, ContentFile(content))
+        paths[variant] = path
+        written += len(content)
+    return paths, len(data), written
+
+
+def remove_stale_variants(user_id, paths):
+    """paths 에 없는 이전 원본의 변환본 정리 - 결과를 기록한 워커만 불러야 다른 워커의 파일을 지우지 않는다"""
+    directory = variant_directory(user_id)
+    if default_storage.exists(directory):
+        for filename in default_storage.listdir(directory)[1]:
+            path = posixpath.join(directory, filename)
+            if path not in paths.values():
+                default_storage.delete(path)
+
+
+def process_profile_images(batch_size=PROCESS_BATCH_SIZE):
+    """변환 대기 중인 사용자를 batch_size 명까지 처리
+
+    행을 잠그지 않고 처리한 뒤, 그사이 이미지가 다시 바뀌지 않았을 때만 결과를 기록한다
+    (바뀌었으면 대기 상태로 남아 다음 배치에서 새 이미지로 처리). 변환본 경로가 원본 내용으로
+    정해지므로 여러 워커가 같은 사용자를 처리해도 결과는 같고, 이전 변환본은 결과를 기록한 뒤에만 지운다.
+    변환에 실패한 사용자는 원인과 관계없이 로그를 남기고 대기에서 빼 배치의 나머지를 계속 처리한다. 반환값: {'processed', 'failed', 'bytes_in', 'bytes_out', 'elapsed'}
+    """
+    started = time.perf_counter()
+    stats = {'processed': 0, 'failed': 0, 'bytes_in': 0, 'bytes_out': 0}
+    pending = list(
+        User.objects.filter(profile_image_pending=True).order_by('pk')
+        .values_list('pk', 'profile_image')[:batch_size]
+    )
+    for user_id, name in pending:
+        current = User.objects.filter(pk=user_id, profile_image=name, profile_image_pending=True)
+        try:
+            paths, size_in, size_out = process_user_image(user_id, name)
+        except Exception:
+            logger.exception('프로필 이미지 변환 실패 (사용자 %s, %s)', user_id, name)
+            current.update(profile_image_pending=False)
+            stats['failed'] += 1
+            continue
+        if current.update(profile_image_variants=paths, profile_image_pending=False):
+            user_cache.discard(user_id)
+            remove_stale_variants(user_id, paths)
+            stats['processed'] += 1
+            stats['bytes_in'] += size_in
+            stats['bytes_out'] += size_out
+
+    stats['elapsed'] = round(time.perf_counter() - started, 4)
+    return stats
+
+
+def pending_count():
+    return User.objects.filter(profile_image_pending=True).count()
@@ -0,0 +1,59 @@
+import statistics
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+
+from users.authentication import user_cache
+from users.tokens import issue_token
+
+
+class Command(BaseCommand):
+    help = '세션 인증과 서명 토큰 인증의 요청당 쿼리 수와 지연시간(p50/p99)을 비교합니다. (임시 사용자 생성 후 삭제)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000)
+        parser.add_argument('--path', default='/api/notifications/unread_count/')
+        parser.add_argument('--host', default='localhost', help='ALLOWED_HOSTS 에 있는 호스트')
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.create_user(
+            username=f'bench-{uuid.uuid4().hex[:8]}', email=f'{uuid.uuid4().hex}@bench.local',
+            nickname=f'bench-{uuid.uuid4().hex[:8]}', name='벤치마크', password=uuid.uuid4().hex
+        )
+        try:
+            session = Client(HTTP_HOST=options['host'])
+            session.force_login(user)
+            user_cache.clear()
+            token = Client(HTTP_HOST=options['host'], HTTP_AUTHORIZATION=f'Bearer {issue_token(user)}')
+            for name, client in [('세션', session), ('토큰', token)]:
+                self._measure(name, client, options['path'], options['requests'])
+        finally:
+            user.delete()
+
+    def _measure(self, name, client, path, count):
+        client.get(path)  # 첫 요청(캐시 적재 등)은 제외
+        latencies = []
+        queries = 0
+
+        def count_query(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_query):
+            for _ in range(count):
+                started = time.perf_counter()
+                response = client.get(path)
+                latencies.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            self.stderr.write(f'{name}: 응답 코드 {response.status_code}')
+        latencies.sort()
+        self.stdout.write(
+            f'  {name}: 요청당 쿼리 {queries / count:.2f}개, '
+            f'p50 {statistics.median(latencies) * 1000:.2f}ms, '
+            f'p99 {latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000:.2f}ms'
+        )
@@ -0,0 +1,56 @@
+import time
+import uuid
+from collections import Counter
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+
+from users.throttling import reset_backend
+
+
+class Command(BaseCommand):
+    help = '틀린 비밀번호 로그인 공격을 흉내 내 시도 제한 유무에 따른 CPU 시간을 비교합니다. (임시 사용자 생성 후 삭제)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--attempts', type=int, default=500)
+        parser.add_argument('--ips', type=int, default=5, help='공격에 쓰는 IP 수')
+        parser.add_argument('--host', default='localhost', help='ALLOWED_HOSTS 에 있는 호스트')
+
+    def handle(self, *args, **options):
+        email = f'{uuid.uuid4().hex}@bench.local'
+        user = get_user_model().objects.create_user(
+            username=f'bench-{uuid.uuid4().hex[:8]}', email=email,
+            nickname=f'bench-{uuid.uuid4().hex[:8]}', name='벤치마크', password=uuid.uuid4().hex
+        )
+        try:
+            client = Client(HTTP_HOST=options['host'])
+            results = {}
+            for name, limits in [('제한 없음', {}), ('제한', settings.RATE_LIMITS)]:
+                with override_settings(RATE_LIMITS=limits):
+                    reset_backend()
+                    results[name] = self._attack(client, email, options['attempts'], options['ips'])
+            reset_backend()
+        finally:
+            user.delete()
+
+        for name, (cpu, statuses) in results.items():
+            self.stdout.write(
+                f'  {name}: CPU {cpu:.3f}s (시도당 {cpu / options["attempts"] * 1000:.2f}ms), '
+                f'응답 {dict(sorted(statuses.items()))}'
+            )
+        unlimited, limited = results['제한 없음'][0], results['제한'][0]
+        if limited:
+            self.stdout.write(f'  절감: {1 - limited / unlimited:.1%} ({unlimited / limited:.1f}배)')
+
+    def _attack(self, client, email, attempts, ips):
+        statuses = Counter()
+        started = time.process_time()
+        for index in range(attempts):
+            response = client.post(
+                '/api/users/login/', {'email': email, 'password': uuid.uuid4().hex},
+                content_type='application/json', REMOTE_ADDR=f'203.0.113.{index % ips + 1}',
+            )
+            statuses[response.status_code] += 1
+        return time.process_time() - started, statuses
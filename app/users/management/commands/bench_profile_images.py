@@ -0,0 +1,85 @@
+import io
+import statistics
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from PIL import Image
+
+from users.images import output_format, process_profile_images, render_variants, variant_directory
+
+
+def sample_photo(width, height, seed):
+    """사진처럼 잘 압축되지 않는 시험용 JPEG (노이즈 + 그라데이션, EXIF 포함)"""
+    noise = Image.effect_noise((width, height), 40 + seed % 20)
+    gradient = Image.linear_gradient('L').resize((width, height))
+    image = Image.merge('RGB', [noise, gradient, noise.transpose(Image.Transpose.FLIP_LEFT_RIGHT)])
+    exif = Image.Exif()
+    exif[0x0110] = 'bench camera'  # Model
+    output = io.BytesIO()
+    image.save(output, 'JPEG', quality=92, exif=exif)
+    return output.getvalue()
+
+
+class Command(BaseCommand):
+    help = '프로필 이미지 변환 처리량과 원본 대비 변환본 전송량을 측정합니다. (임시 사용자 생성 후 삭제)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--images', type=int, default=20)
+        parser.add_argument('--width', type=int, default=4000)
+        parser.add_argument('--height', type=int, default=3000)
+        parser.add_argument('--avatars', type=int, default=20, help='목록 한 페이지에 보이는 프로필 이미지 수')
+
+    def handle(self, *args, **options):
+        photos = [sample_photo(options['width'], options['height'], seed) for seed in range(options['images'])]
+        sizes = {name: [] for name in settings.PROFILE_IMAGE['VARIANTS']}
+        durations = []
+        for photo in photos:
+            started = time.perf_counter()
+            rendered = render_variants(photo)
+            durations.append(time.perf_counter() - started)
+            for name, content in rendered.items():
+                sizes[name].append(len(content))
+
+        elapsed = sum(durations)
+        original = statistics.mean(len(photo) for photo in photos)
+        self.stdout.write(
+            f"변환 ({output_format()}, {options['width']}x{options['height']} 원본 {len(photos)}장): "
+            f"{len(photos) / elapsed:.1f}장/초, 원본 {sum(map(len, photos)) / elapsed / 1e6:.1f}MB/초, "
+            f"장당 p50 {statistics.median(durations) * 1000:.1f}ms"
+        )
+        page = options['avatars']
+        self.stdout.write(f'  원본: 평균 {original / 1024:,.1f}KB, 목록 한 페이지 {original * page / 1e6:,.2f}MB')
+        for name, values in sizes.items():
+            average = statistics.mean(values)
+            self.stdout.write(
+                f'  {name}: 평균 {average / 1024:,.1f}KB ({average / original:.2%}), '
+                f'목록 한 페이지 {average * page / 1024:,.1f}KB'
+            )
+        self._pipeline(photos[0])
+
+    def _pipeline(self, photo):
+        """업로드 → 워커 처리 한 번을 임시 사용자로 실행"""
+        user = get_user_model().objects.create_user(
+            username=f'bench-{uuid.uuid4().hex[:8]}', email=f'{uuid.uuid4().hex}@bench.local',
+            nickname=f'bench-{uuid.uuid4().hex[:8]}', name='벤치마크', password=uuid.uuid4().hex
+        )
+        try:
+            user.profile_image.save('bench.jpg', ContentFile(photo))
+            stats = process_profile_images(batch_size=1)
+            user.refresh_from_db()
+            self.stdout.write(
+                f"  워커: {stats['processed']}건 {stats['elapsed'] * 1000:.1f}ms, "
+                f"변환본 {sorted(user.profile_image_variants)}"
+            )
+        finally:
+            directory = variant_directory(user.pk)
+            if default_storage.exists(directory):
+                for filename in default_storage.listdir(directory)[1]:
+                    default_storage.delete(f'{directory}/{filename}')
+            user.profile_image.delete(save=False)
+            user.delete()
@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from users.images import PROCESS_BATCH_SIZE, pending_count, process_profile_images
+
+
+class Command(BaseCommand):
+    help = '변환 대기 중인 프로필 이미지로 크기별 변환본을 만드는 워커를 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=PROCESS_BATCH_SIZE)
+        parser.add_argument('--poll-interval', type=float, default=2.0, help='대기 중인 이미지가 없을 때 재조회 간격(초)')
+        parser.add_argument('--once', action='store_true', help='대기 중인 이미지를 모두 처리하면 종료')
+        parser.add_argument('--report-every', type=float, default=60.0, help='처리 지표 출력 간격(초)')
+
+    def handle(self, *args, **options):
+        totals = {'processed': 0, 'failed': 0, 'bytes_in': 0, 'bytes_out': 0}
+        started = last_report = time.perf_counter()
+        while True:
+            close_old_connections()
+            stats = process_profile_images(options['batch_size'])
+            for key in totals:
+                totals[key] += stats[key]
+            count = stats['processed'] + stats['failed']
+            if options['verbosity'] > 1 and count:
+                self.stdout.write(f"프로필 이미지 {count}건 처리 ({stats['elapsed']:.2f}초)")
+            if time.perf_counter() - last_report >= options['report_every']:
+                self._report(totals, time.perf_counter() - started)
+                last_report = time.perf_counter()
+            if not count:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+
+        self._report(totals, time.perf_counter() - started)
+
+    def _report(self, totals, elapsed):
+        rate = totals['processed'] / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"프로필 이미지 {totals['processed']:,}건 변환 ({rate:,.1f}건/초), 실패 {totals['failed']:,}건, "
+            f"원본 {totals['bytes_in'] / 1e6:,.1f}MB → 변환본 {totals['bytes_out'] / 1e6:,.2f}MB, "
+            f"대기 {pending_count():,}건"
+        ))
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-19 02:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customuser",
+            name="profile_image_variants",
+            field=models.JSONField(blank=True, default=dict, verbose_name="프로필 이미지 변환본"),
+        ),
+        migrations.AddField(
+            model_name="customuser",
+            name="profile_image_pending",
+            field=models.BooleanField(default=False, verbose_name="프로필 이미지 변환 대기"),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                condition=models.Q(("profile_image_pending", True)),
+                fields=["id"],
+                name="users_image_pending_idx",
+            ),
+        ),
+        # 이미 올린 프로필 이미지도 변환 대기로 표시
+        migrations.RunSQL(
+            "UPDATE users SET profile_image_pending = TRUE "
+            "WHERE profile_image IS NOT NULL AND profile_image <> ''",
+            migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_profile_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customuser",
+            name="token_version",
+            field=models.PositiveIntegerField(default=0, verbose_name="토큰 버전"),
+        ),
+    ]
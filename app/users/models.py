@@ -1,5 +1,9 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import DEFERRED, Q
+
+# 로그인할 때 바뀌는 필드 - users.activity 버퍼에 모았다가 한꺼번에 기록한다
+ACTIVITY_FIELDS = ('last_login', 'last_login_ip', 'login_count')
 
 
 class CustomUser(AbstractUser):
@@ -11,6 +15,9 @@ class CustomUser(AbstractUser):
     birth_date = models.DateField('생년월일', null=True, blank=True)
     phone = models.CharField('연락처', max_length=20, blank=True)
     profile_image = models.ImageField('프로필 이미지', upload_to='profiles/', null=True, blank=True)
+    # 원본에서 만든 크기별 이미지 {변환본 이름: 저장 경로} - users.images 워커가 요청 밖에서 채운다
+    profile_image_variants = models.JSONField('프로필 이미지 변환본', default=dict, blank=True)
+    profile_image_pending = models.BooleanField('프로필 이미지 변환 대기', default=False)
 
     # 소셜 로그인 관련 필드
     social_provider = models.CharField('소셜 제공자', max_length=20, blank=True)
@@ -23,6 +30,8 @@ class CustomUser(AbstractUser):
     # 계정 활동 정보
     last_login_ip = models.GenericIPAddressField('최종 로그인 IP', null=True, blank=True)
     login_count = models.PositiveIntegerField('로그인 횟수', default=0)
+    # 로그아웃하면 올려서 이전에 발급한 토큰을 모두 무효화한다 (users.tokens.auth_version)
+    token_version = models.PositiveIntegerField('토큰 버전', default=0)
 
     created_at = models.DateTimeField('생성일시', auto_now_add=True)
     updated_at = models.DateTimeField('수정일시', auto_now=True)
@@ -34,6 +43,48 @@ class CustomUser(AbstractUser):
         db_table = 'users'
         verbose_name = '사용자'
         verbose_name_plural = '사용자들'
+        indexes = [
+            # 변환 워커가 대기 중인 사용자만 훑는다
+            models.Index(fields=['id'], condition=Q(profile_image_pending=True), name='users_image_pending_idx'),
+        ]
 
     def __str__(self):
-        return f"{self.nickname} ({self.email})"
\ No newline at end of file
+        return f"{self.nickname} ({self.email})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 프로필 이미지 변경 판단용 - DB 에 저장된 파일 이름 (지연 로딩이면 DEFERRED)
+        instance._stored_profile_image = instance.__dict__.get('profile_image', DEFERRED)
+        return instance
+
+    def non_activity_fields(self):
+        """로그인 활동 필드와 지연 로딩 필드를 뺀 저장 필드 - update_fields 없이 저장할 때 쓴다
+
+        로그인 활동은 users.activity 버퍼가 따로 더해 기록하므로, 오래된 인스턴스 값으로 덮어쓰지 않게 한다.
+        """
+        skipped = {*ACTIVITY_FIELDS, *self.get_deferred_fields()}
+        return [field.name for field in self._meta.concrete_fields if not field.primary_key and field.name not in skipped]
+
+    def save(self, *args, **kwargs):
+        """프로필 이미지가 바뀌면 변환본을 비우고 변환 대기로 표시
+
+        이미 있는 사용자를 update_fields 없이 저장하면(비밀번호 변경, 관리자 화면 등) 로그인 활동 필드는
+        저장하지 않는다. 활동 필드를 직접 고치려면 update_fields 에 적는다.
+        """
+        name = self.profile_image.name or ''
+        stored = getattr(self, '_stored_profile_image', DEFERRED)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None and not self._state.adding and not kwargs.get('force_insert'):
+            update_fields = kwargs['update_fields'] = self.non_activity_fields()
+        if self._state.adding:
+            changed = bool(name)
+        else:
+            changed = stored is not DEFERRED and (stored or '') != name
+        if changed and (update_fields is None or 'profile_image' in update_fields):
+            self.profile_image_variants = {}
+            self.profile_image_pending = bool(name)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'profile_image_variants', 'profile_image_pending'}
+        super().save(*args, **kwargs)
+        self._stored_profile_image = self.profile_image.name or ''
\ No newline at end of file
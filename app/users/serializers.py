@@ -2,7 +2,11 @@ from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth.tokens import default_token_generator
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, connection, transaction
 from .models import CustomUser
+from .tokens import REFRESH, TokenError, auth_version, read_token
 import re
 
 
@@ -25,15 +29,21 @@ class RegisterSerializer(serializers.ModelSerializer):
             'username', 'email', 'password', 'password_confirm',
             'nickname', 'name', 'birth_date', 'phone'
         )
-
-    def validate_email(self, value):
-        if CustomUser.objects.filter(email=value).exists():
-            raise serializers.ValidationError("이미 사용 중인 이메일입니다.")
-        return value
+        # 중복 확인은 조회 대신 유니크 제약으로 한다 (create 참고)
+        extra_kwargs = {
+            'username': {'validators': [UnicodeUsernameValidator()]},
+            'email': {'validators': []},
+            'nickname': {'validators': []},
+        }
+
+    # 유니크 제약 위반 → 필드 오류 메시지
+    UNIQUE_ERRORS = {
+        'email': "이미 사용 중인 이메일입니다.",
+        'nickname': "이미 사용 중인 닉네임입니다.",
+        'username': CustomUser._meta.get_field('username').error_messages['unique'],
+    }
 
     def validate_nickname(self, value):
-        if CustomUser.objects.filter(nickname=value).exists():
-            raise serializers.ValidationError("이미 사용 중인 닉네임입니다.")
         if len(value) < 2:
             raise serializers.ValidationError("닉네임은 2자 이상이어야 합니다.")
         return value
@@ -49,12 +59,50 @@ class RegisterSerializer(serializers.ModelSerializer):
         return attrs
 
     def create(self, validated_data):
+        """사용자 INSERT 한 번 (PostgreSQL 은 id 를 먼저 받아 인증 토큰까지 한 번에 저장)
+
+        이메일·닉네임·아이디 중복은 INSERT 의 유니크 제약 위반을 같은 검증 오류로 바꿔 알린다.
+        """
         validated_data.pop('password_confirm')
-        user = CustomUser.objects.create_user(**validated_data)
-        user.verification_token = default_token_generator.make_token(user)
-        user.save()
+        password = validated_data.pop('password')
+        user = CustomUser(**validated_data)
+        user.username = CustomUser.normalize_username(user.username)
+        user.email = CustomUser.objects.normalize_email(user.email)
+        user.set_password(password)
+        try:
+            with transaction.atomic():
+                if connection.vendor == 'postgresql':
+                    user.pk = self._next_user_id()
+                    user.verification_token = default_token_generator.make_token(user)
+                    user.save(force_insert=True)
+                else:
+                    user.save(force_insert=True)
+                    user.verification_token = default_token_generator.make_token(user)
+                    user.save(update_fields=['verification_token'])
+        except IntegrityError as exc:
+            field = self._violated_field(exc)
+            if field is None:
+                raise
+            raise serializers.ValidationError({field: [self.UNIQUE_ERRORS[field]]})
         return user
 
+    @staticmethod
+    def _next_user_id():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, 'id'))", [CustomUser._meta.db_table]
+            )
+            return cursor.fetchone()[0]
+
+    def _violated_field(self, exc):
+        """IntegrityError 메시지에서 위반한 유니크 필드 찾기 (PostgreSQL: 'Key (email)=...', SQLite: 'users.email')"""
+        message = str(exc)
+        table = CustomUser._meta.db_table
+        for field in self.UNIQUE_ERRORS:
+            if f'Key ({field})=' in message or f'{table}.{field}' in message or f'{table}_{field}_' in message:
+                return field
+        return None
+
 
 class LoginSerializer(serializers.Serializer):
     """로그인 시리얼라이저"""
@@ -77,6 +125,24 @@ class LoginSerializer(serializers.Serializer):
         raise serializers.ValidationError('이메일과 비밀번호를 모두 입력해주세요.')
 
 
+class TokenRefreshSerializer(serializers.Serializer):
+    """토큰 재발급 시리얼라이저"""
+
+    refresh = serializers.CharField()
+
+    def validate(self, attrs):
+        try:
+            user_id, version = read_token(attrs['refresh'], REFRESH)
+        except TokenError as exc:
+            raise serializers.ValidationError({'refresh': str(exc)})
+        # 재발급은 드물므로 캐시 대신 DB 의 현재 상태로 비밀번호 변경·비활성화를 확인한다
+        user = CustomUser.objects.filter(pk=user_id).first()
+        if user is None or not user.is_active or auth_version(user) != version:
+            raise serializers.ValidationError({'refresh': '더 이상 유효하지 않은 토큰입니다.'})
+        attrs['user'] = user
+        return attrs
+
+
 class LogoutSerializer(serializers.Serializer):
     """로그아웃 시리얼라이저"""
     pass
@@ -86,12 +152,13 @@ class ProfileSerializer(serializers.ModelSerializer):
     """프로필 시리얼라이저"""
 
     profile_image_url = serializers.SerializerMethodField()
+    profile_image_urls = serializers.SerializerMethodField()
 
     class Meta:
         model = CustomUser
         fields = (
             'id', 'username', 'email', 'nickname', 'name',
-            'birth_date', 'phone', 'profile_image', 'profile_image_url',
+            'birth_date', 'phone', 'profile_image', 'profile_image_url', 'profile_image_urls',
             'is_verified', 'last_login', 'login_count',
             'created_at', 'updated_at'
         )
@@ -102,12 +169,30 @@ class ProfileSerializer(serializers.ModelSerializer):
 
     def get_profile_image_url(self, obj):
         if obj.profile_image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.profile_image.url)
-            return obj.profile_image.url
+            return self._absolute_url(obj.profile_image.url)
         return None
 
+    def get_profile_image_urls(self, obj):
+        """크기별 변환본 URL {변환본 이름: URL} - 변환 전이거나 이미지가 없으면 빈 dict"""
+        if not obj.profile_image:
+            return {}
+        return {
+            name: self._absolute_url(default_storage.url(path))
+            for name, path in obj.profile_image_variants.items()
+        }
+
+    def _absolute_url(self, url):
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+    def update(self, instance, validated_data):
+        # 바꾼 필드만 저장한다 - 인증 캐시의 사용자(최대 USER_CACHE_SECONDS 전 값)로 저장해도
+        # 로그인 활동·토큰 버전 등 다른 곳에서 기록한 값을 되돌리지 않는다
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
+
     def validate_nickname(self, value):
         user = self.instance
         if user and CustomUser.objects.filter(nickname=value).exclude(id=user.id).exists():
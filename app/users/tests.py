@@ -2,12 +2,490 @@
 # from django.test import TestCase  # 이 줄 삭제
 
 # 테스트가 필요하면 다음과 같이 작성
-from django.test import TestCase
+import io
+import shutil
+import tempfile
+import threading
+from unittest import mock
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.tokens import default_token_generator
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from PIL import Image
+from rest_framework.test import APITestCase
+
+from users.activity import login_activity
+from users.authentication import user_cache
+from users.availability import BloomFilter, availability_index
+from users.images import process_profile_images, process_user_image
+from users.throttling import InMemoryRateLimitBackend, reset_backend
+from users.tokens import issue_token
 
 User = get_user_model()
 
 class UserModelTest(TestCase):
     def test_create_user(self):
         # 실제 테스트 코드 작성
-        pass
\ No newline at end of file
+        pass
+
+class TokenAuthenticationTest(APITestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.addCleanup(user_cache.clear)
+        self.addCleanup(login_activity.clear)
+        reset_backend()
+        self.user = User.objects.create_user(
+            username="token", email="token@example.com", password="pass-1234", nickname="token", name="토큰"
+        )
+
+    def _login(self, **extra):
+        response = self.client.post('/api/users/login/', {'email': "token@example.com", 'password': "pass-1234", **extra},
+                                    format='json')
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def _get(self, path, token):
+        return self.client.get(path, HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_login_issues_tokens_without_session(self):
+        response = self._login()
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+        self.assertIn('refresh', response.data['data'])
+        self.assertEqual(self._get('/api/users/profile/', response.data['data']['access']).data['data']['email'],
+                         "token@example.com")
+        self.assertIn(settings.SESSION_COOKIE_NAME, self._login(session=True).cookies)
+
+    def test_cached_user_needs_no_auth_queries(self):
+        access = issue_token(self.user)
+        self._get('/api/notifications/unread_count/', access)
+        with CaptureQueriesContext(connection) as queries:
+            response = self._get('/api/notifications/unread_count/', access)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([query for query in queries if '"users"' in query['sql'] or 'django_session' in query['sql']])
+
+    def test_password_change_and_deactivation_revoke_tokens(self):
+        access = issue_token(self.user)
+        self.assertEqual(self._get('/api/users/profile/', access).status_code, 200)
+        self.user.set_password("new-pass-5678")
+        self.user.save()
+        self.assertEqual(self._get('/api/users/profile/', access).status_code, 401)
+
+        access = issue_token(self.user)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        user_cache.clear()
+        self.assertEqual(self._get('/api/users/profile/', access).status_code, 401)
+
+    def test_refresh_flow(self):
+        tokens = self._login().data['data']
+        response = self.client.post('/api/users/token/refresh/', {'refresh': tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._get('/api/users/profile/', response.data['data']['access']).status_code, 200)
+
+        # 액세스 토큰은 재발급에 쓸 수 없다
+        response = self.client.post('/api/users/token/refresh/', {'refresh': tokens['access']}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_logout_revokes_issued_tokens(self):
+        tokens = self._login().data['data']
+        response = self.client.post('/api/users/logout/', HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._get('/api/users/profile/', tokens['access']).status_code, 401)
+        response = self.client.post('/api/users/token/refresh/', {'refresh': tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self._get('/api/users/profile/', self._login().data['data']['access']).status_code, 200)
+
+    def test_expired_or_forged_token_is_rejected(self):
+        access = issue_token(self.user)
+        with override_settings(AUTH_TOKEN={**settings.AUTH_TOKEN, 'ACCESS_SECONDS': -1}):
+            self.assertEqual(self._get('/api/users/profile/', access).status_code, 401)
+        self.assertEqual(self._get('/api/users/profile/', access[:-2] + 'xx').status_code, 401)
+
+
+@override_settings(RATE_LIMITS={'login_ip': '5/m', 'login_email': '3/m', 'signup_ip': '2/h'})
+class LoginThrottleTest(APITestCase):
+    def setUp(self):
+        reset_backend()
+        self.addCleanup(reset_backend)
+        self.addCleanup(login_activity.clear)
+        self.user = User.objects.create_user(
+            username="throttle", email="throttle@example.com", password="pass-1234", nickname="throttle", name="제한"
+        )
+
+    def _login(self, password, ip='10.0.0.1', email="throttle@example.com"):
+        return self.client.post('/api/users/login/', {'email': email, 'password': password}, format='json',
+                                REMOTE_ADDR=ip)
+
+    def test_email_limit_rejects_before_password_check(self):
+        for _ in range(3):
+            self.assertEqual(self._login('wrong').status_code, 400)
+        # 다른 IP 에서도 같은 이메일은 거절되고, 비밀번호 확인(사용자 조회)도 하지 않는다
+        with CaptureQueriesContext(connection) as queries:
+            response = self._login('pass-1234', ip='10.0.0.2')
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(len(queries), 0)
+        self.assertGreater(int(response['Retry-After']), 0)
+
+    def test_ip_limit_covers_many_emails(self):
+        for index in range(5):
+            self.assertEqual(self._login('wrong', email=f'nobody{index}@example.com').status_code, 400)
+        self.assertEqual(self._login('pass-1234').status_code, 429)
+        self.assertEqual(self._login('pass-1234', ip='10.0.0.2').status_code, 200)
+
+    def test_signup_limited_by_ip(self):
+        statuses = [
+            self.client.post('/api/users/signup/', {'email': 'not-an-email'}, format='json',
+                             REMOTE_ADDR='10.0.0.3').status_code
+            for _ in range(3)
+        ]
+        self.assertEqual(statuses, [400, 400, 429])
+
+    @override_settings(TRUSTED_PROXY_COUNT=1)
+    def test_spoofed_forwarded_for_does_not_reset_ip_limit(self):
+        # 프록시 하나 뒤: 클라이언트가 앞에 붙인 주소는 매번 달라도 프록시가 덧붙인 마지막 주소로 센다
+        statuses = [
+            self.client.post('/api/users/login/', {'email': f'nobody{index}@example.com', 'password': 'wrong'},
+                             format='json', REMOTE_ADDR='10.0.0.254',
+                             HTTP_X_FORWARDED_FOR=f'198.51.100.{index}, 203.0.113.7').status_code
+            for index in range(6)
+        ]
+        self.assertEqual(statuses, [400] * 5 + [429])
+
+    def test_forwarded_for_is_ignored_without_trusted_proxy(self):
+        for index in range(5):
+            self.client.post('/api/users/login/', {'email': f'nobody{index}@example.com', 'password': 'wrong'},
+                             format='json', REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR=f'198.51.100.{index}')
+        self.assertEqual(self._login('pass-1234').status_code, 429)
+
+    @override_settings(RATE_LIMITS={})
+    def test_unconfigured_scope_is_not_limited(self):
+        for _ in range(6):
+            self.assertEqual(self._login('wrong').status_code, 400)
+
+
+class SlidingWindowBackendTest(TestCase):
+    def test_previous_window_decays(self):
+        backend = InMemoryRateLimitBackend()
+        self.assertEqual([backend.hit('k', 2, 10, now=100 + i) for i in range(2)], [0, 0])
+        wait = backend.hit('k', 2, 10, now=102)
+        self.assertEqual(wait, 8)
+        # 다음 윈도 중간: 직전 2건 × 0.5 + 0 → 한 건 더 허용, 그다음은 직전 건수가 빠질 때까지 대기
+        self.assertEqual(backend.hit('k', 2, 10, now=115), 0)
+        self.assertAlmostEqual(backend.hit('k', 2, 10, now=115), 5)
+        # 두 윈도가 지나면 초기화
+        self.assertEqual(backend.hit('k', 2, 10, now=140), 0)
+
+    def test_evicts_least_recent_keys(self):
+        backend = InMemoryRateLimitBackend(max_keys=2)
+        for key in ('a', 'b', 'c'):
+            backend.hit(key, 1, 60, now=0)
+        self.assertEqual(backend.hit('a', 1, 60, now=1), 0)
+        self.assertGreater(backend.hit('c', 1, 60, now=1), 0)
+
+
+class RegistrationTest(APITestCase):
+    def setUp(self):
+        reset_backend()
+        availability_index.clear()
+        self.addCleanup(availability_index.clear)
+        # 백그라운드 스레드의 연결에서는 테스트 트랜잭션의 데이터가 보이지 않으므로 요청에서 직접 만든다
+        availability_index.background = False
+        self.addCleanup(setattr, availability_index, 'background', True)
+        User.objects.create_user(
+            username="taken", email="taken@example.com", password="pass-1234", nickname="taken", name="기존"
+        )
+
+    def _signup(self, **overrides):
+        data = {
+            'username': "new", 'email': "new@example.com", 'password': "Strong-pass-1234",
+            'password_confirm': "Strong-pass-1234", 'nickname': "newbie", 'name': "신규", **overrides,
+        }
+        return self.client.post('/api/users/signup/', data, format='json')
+
+    def test_signup_is_one_read_and_one_write(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self._signup()
+        self.assertEqual(response.status_code, 201)
+        statements = [q['sql'] for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']]
+        self.assertLessEqual(len(statements), 2)
+        user = User.objects.get(email="new@example.com")
+        self.assertTrue(user.check_password("Strong-pass-1234"))
+        self.assertTrue(default_token_generator.check_token(user, user.verification_token))
+
+    def test_duplicates_become_field_errors(self):
+        for field, value, message in [
+            ('email', "taken@example.com", "이미 사용 중인 이메일입니다."),
+            ('nickname', "taken", "이미 사용 중인 닉네임입니다."),
+        ]:
+            response = self._signup(**{field: value})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data[field], [message])
+        self.assertEqual(self._signup(username="taken").status_code, 400)
+        self.assertFalse(User.objects.filter(email="new@example.com").exists())
+
+    def test_availability_skips_database_for_unknown_values(self):
+        self.assertEqual(self.client.get('/api/users/availability/', {'nickname': "warmup"}).status_code, 200)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/users/availability/', {'email': "free@example.com", 'nickname': "free"})
+        self.assertEqual(response.data['data'], {'email': True, 'nickname': True})
+        self.assertEqual(len(queries), 0)
+
+        response = self.client.get('/api/users/availability/', {'email': "taken@example.com", 'nickname': "taken"})
+        self.assertEqual(response.data['data'], {'email': False, 'nickname': False})
+        # 이 프로세스에서 가입한 값은 다시 만들지 않아도 바로 반영된다
+        self.assertEqual(self._signup().status_code, 201)
+        response = self.client.get('/api/users/availability/', {'nickname': "newbie"})
+        self.assertEqual(response.data['data'], {'nickname': False})
+
+    def test_rebuild_does_not_block_other_requests(self):
+        availability_index.is_available('nickname', "warmup")
+        # 다른 요청이 다시 만드는 중이면 기다리지 않고 이전 필터로 답한다
+        availability_index._built_at, availability_index._added = 0.0, []
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(availability_index.is_available('email', "free@example.com"))
+        self.assertEqual(len(queries), 0)
+        # 그동안 저장된 사용자는 새 필터에도 들어간다
+        availability_index.add(User(email="during@example.com", nickname="during"))
+        availability_index._rebuild()
+        self.assertIn("during@example.com", availability_index._filter('email'))
+
+        # 처음 만드는 중이면 DB 로 확인한다
+        availability_index.clear()
+        availability_index._added = []
+        with CaptureQueriesContext(connection) as queries:
+            self.assertFalse(availability_index.is_available('email', "taken@example.com"))
+        self.assertEqual(len(queries), 1)
+
+    def test_background_rebuild_runs_off_the_request(self):
+        availability_index.background = True
+        threads = []
+        done = threading.Event()
+
+        def rebuild():
+            threads.append(threading.current_thread().name)
+            done.set()
+
+        availability_index._rebuild = rebuild
+        self.addCleanup(vars(availability_index).pop, '_rebuild')
+        # 필터가 아직 없으면 재생성을 기다리지 않고 DB 로 확인한다
+        self.assertFalse(availability_index.is_available('email', "taken@example.com"))
+        self.assertTrue(done.wait(5))
+        self.assertEqual(threads, ['availability-rebuild'])
+        self.assertEqual(availability_index.stats['queried'], 1)
+
+    def test_availability_requires_a_value(self):
+        self.assertEqual(self.client.get('/api/users/availability/').status_code, 400)
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(1000, 0.01)
+        values = [f'user{i}@example.com' for i in range(1000)]
+        for value in values:
+            bloom.add(value)
+        self.assertTrue(all(value in bloom for value in values))
+        false_positives = sum(f'other{i}@example.com' in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+
+def jpeg_upload(width=300, height=200, orientation=6):
+    """EXIF 방향(6: 90도 회전)과 카메라 정보가 든 시험용 JPEG 업로드 파일"""
+    exif = Image.Exif()
+    exif[0x0112] = orientation
+    exif[0x0110] = 'test camera'
+    output = io.BytesIO()
+    Image.new('RGB', (width, height), (200, 40, 40)).save(output, 'JPEG', exif=exif)
+    return SimpleUploadedFile('photo.jpg', output.getvalue(), content_type='image/jpeg')
+
+
+class ProfileImageTest(APITestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root, PROFILE_IMAGE={
+            'VARIANTS': {'thumb': (32, 32), 'medium': (120, 80)}, 'FORMAT': 'JPEG', 'QUALITY': 80,
+        })
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.user = User.objects.create_user(
+            username="photo", email="photo@example.com", password="pass-1234", nickname="photo", name="사진"
+        )
+        self.client.force_authenticate(self.user)
+
+    def _upload(self, upload):
+        response = self.client.patch('/api/users/profile/', {'profile_image': upload}, format='multipart')
+        self.assertEqual(response.status_code, 200)
+
+    def test_upload_is_processed_off_request_path(self):
+        self._upload(jpeg_upload())
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.profile_image_pending)
+        self.assertEqual(self.user.profile_image_variants, {})
+
+        stats = process_profile_images()
+        self.assertEqual((stats['processed'], stats['failed']), (1, 0))
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.profile_image_pending)
+        self.assertEqual(set(self.user.profile_image_variants), {'thumb', 'medium'})
+        with default_storage.open(self.user.profile_image_variants['medium']) as stored:
+            variant = Image.open(stored)
+            variant.load()
+        self.assertEqual(variant.size, (120, 80))
+        self.assertEqual(dict(variant.getexif()), {})
+
+        urls = self.client.get('/api/users/profile/').data['data']['profile_image_urls']
+        self.assertEqual(set(urls), {'thumb', 'medium'})
+        self.assertTrue(urls['thumb'].endswith('-thumb.jpg'))
+
+    def test_same_content_gets_same_names_and_old_variants_are_removed(self):
+        self._upload(jpeg_upload())
+        process_profile_images()
+        self.user.refresh_from_db()
+        first = self.user.profile_image_variants
+
+        self._upload(jpeg_upload())
+        process_profile_images()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.profile_image_variants, first)
+
+        self._upload(jpeg_upload(orientation=1))
+        process_profile_images()
+        self.user.refresh_from_db()
+        self.assertNotEqual(self.user.profile_image_variants, first)
+        self.assertFalse(any(default_storage.exists(path) for path in first.values()))
+
+    def test_unreadable_image_is_dropped_from_queue(self):
+        self.user.profile_image.save('broken.jpg', SimpleUploadedFile('broken.jpg', b'not an image'))
+        with self.assertLogs('users.images', 'ERROR'):
+            stats = process_profile_images()
+        self.assertEqual(stats['failed'], 1)
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.profile_image_pending)
+
+    def test_unexpected_error_fails_only_that_user(self):
+        self._upload(jpeg_upload())
+        other = User.objects.create_user(
+            username="photo2", email="photo2@example.com", password="pass-1234", nickname="photo2", name="사진2"
+        )
+        other.profile_image.save('other.jpg', jpeg_upload())
+        with mock.patch('users.images.render_variants', side_effect=[RuntimeError('boom'), {'thumb': b'x'}]):
+            with self.assertLogs('users.images', 'ERROR'):
+                stats = process_profile_images()
+        self.assertEqual((stats['processed'], stats['failed']), (1, 1))
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.profile_image_pending)
+        self.assertEqual(self.user.profile_image_variants, {})
+
+    def test_variants_are_kept_when_image_changed_during_processing(self):
+        self._upload(jpeg_upload())
+        process_profile_images()
+        self.user.refresh_from_db()
+        first = self.user.profile_image_variants
+        self._upload(jpeg_upload(orientation=1))
+
+        def replace_image(user_id, name):
+            result = process_user_image(user_id, name)
+            User.objects.filter(pk=user_id).update(profile_image='profiles/newer.jpg')
+            return result
+
+        # 기록하지 못한 워커는 이전 변환본을 지우지 않는다
+        with mock.patch('users.images.process_user_image', side_effect=replace_image):
+            self.assertEqual(process_profile_images()['processed'], 0)
+        self.assertTrue(all(default_storage.exists(path) for path in first.values()))
+
+    def test_other_updates_do_not_requeue(self):
+        self._upload(jpeg_upload())
+        process_profile_images()
+        self.user.refresh_from_db()
+        self.user.name = "이름 변경"
+        self.user.save()
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.profile_image_pending)
+        self.assertNotEqual(self.user.profile_image_variants, {})
+
+
+@override_settings(LOGIN_ACTIVITY={'FLUSH_SECONDS': 3600, 'MAX_PENDING': 1000})
+class LoginActivityTest(APITestCase):
+    def setUp(self):
+        reset_backend()
+        login_activity.clear()
+        self.addCleanup(login_activity.clear)
+        login_activity.flush()
+        self.user = User.objects.create_user(
+            username="active", email="active@example.com", password="pass-1234", nickname="active", name="활동"
+        )
+
+    def _login(self, **extra):
+        response = self.client.post('/api/users/login/', {'email': "active@example.com", 'password': "pass-1234",
+                                                          **extra}, format='json', REMOTE_ADDR='10.1.2.3')
+        self.assertEqual(response.status_code, 200)
+
+    def test_login_is_written_behind(self):
+        with CaptureQueriesContext(connection) as queries:
+            self._login()
+        self.assertFalse([q for q in queries.captured_queries if q['sql'].startswith('UPDATE "users"')])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.login_count, 0)
+
+        self._login(session=True)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(login_activity.flush(), 1)
+        self.assertEqual(len(queries), 1)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.login_count, 2)
+        self.assertEqual(self.user.last_login_ip, '10.1.2.3')
+        self.assertIsNotNone(self.user.last_login)
+
+    def test_concurrent_logins_lose_no_increments(self):
+        threads, per_thread = 8, 500
+
+        def log_in(index):
+            for _ in range(per_thread):
+                login_activity.record(self.user.pk, f'10.0.0.{index}')
+
+        workers = [threading.Thread(target=log_in, args=(index,)) for index in range(threads)]
+        for worker in workers:
+            worker.start()
+        # 기록하는 동안 계속 flush 해도 증가분이 사라지지 않아야 한다
+        while any(worker.is_alive() for worker in workers):
+            login_activity.flush()
+        for worker in workers:
+            worker.join()
+        login_activity.flush()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.login_count, threads * per_thread)
+
+    def test_profile_update_keeps_flushed_activity(self):
+        stale = User.objects.get(pk=self.user.pk)
+        for _ in range(3):
+            self._login()
+        login_activity.flush()
+        # 인증 캐시에 남은 오래된 인스턴스로 프로필을 고쳐도 바꾼 필드만 저장된다
+        self.client.force_authenticate(stale)
+        response = self.client.patch('/api/users/profile/', {'name': "이름 변경"}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual((self.user.name, self.user.login_count), ("이름 변경", 3))
+
+    def test_full_save_keeps_flushed_activity(self):
+        stale = User.objects.get(pk=self.user.pk)
+        for _ in range(2):
+            self._login()
+        login_activity.flush()
+        # update_fields 없이 통째로 저장해도 로그인 활동은 덮어쓰지 않는다
+        stale.set_password("Other-pass-5678")
+        stale.save()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.login_count, 2)
+        self.assertTrue(self.user.check_password("Other-pass-5678"))
+
+    def test_due_after_interval_or_size(self):
+        self.assertFalse(login_activity.due())
+        login_activity.record(self.user.pk)
+        self.assertFalse(login_activity.due())
+        with override_settings(LOGIN_ACTIVITY={'FLUSH_SECONDS': 3600, 'MAX_PENDING': 1}):
+            self.assertTrue(login_activity.due())
+        with override_settings(LOGIN_ACTIVITY={'FLUSH_SECONDS': 0, 'MAX_PENDING': 1000}):
+            self.assertTrue(login_activity.due())
@@ -0,0 +1,181 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+from rest_framework.throttling import SimpleRateThrottle
+
+# 메모리 백엔드가 기억하는 최대 키 수 - 넘치면 가장 오래 쓰이지 않은 키부터 버린다
+MAX_KEYS = 100_000
+
+
+def client_ip(request):
+    """클라이언트 IP 주소
+
+    X-Forwarded-For 의 앞쪽은 클라이언트가 마음대로 채울 수 있으므로, 앞에 둔 프록시 수
+    (TRUSTED_PROXY_COUNT) 만큼 오른쪽에서 센 주소(가장 바깥 프록시가 본 주소)만 믿는다.
+    프록시가 없거나(0) 헤더의 주소가 그보다 적으면 REMOTE_ADDR 을 쓴다.
+    """
+    proxies = settings.TRUSTED_PROXY_COUNT
+    if proxies:
+        hops = [hop.strip() for hop in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if hop.strip()]
+        if len(hops) >= proxies:
+            return hops[-proxies]
+    return request.META.get('REMOTE_ADDR')
+
+
+def sliding_window_wait(previous, current, limit, window, elapsed):
+    """슬라이딩 윈도 카운터 - 한 번 더 허용할 수 있으면 0, 아니면 기다릴 시간(초)
+
+    직전 윈도 건수를 현재 윈도에서 지난 비율만큼 덜어 낸 값 + 현재 윈도 건수로 최근 window 초의
+    건수를 추정한다. 키마다 숫자 두 개만 기억한다.
+    """
+    estimated = previous * (1 - elapsed / window) + current
+    if estimated + 1 <= limit:
+        return 0
+    if current + 1 > limit:
+        return window - elapsed
+    # 직전 윈도 건수가 충분히 빠질 때까지
+    return window * (1 - (limit - 1 - current) / previous) - elapsed
+
+
+class InMemoryRateLimitBackend:
+    """프로세스 메모리의 슬라이딩 윈도 카운터 (프로세스마다 따로 센다)"""
+
+    def __init__(self, max_keys=MAX_KEYS):
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._windows = OrderedDict()  # 키 → (윈도 번호, 현재 윈도 건수, 직전 윈도 건수)
+
+    def hit(self, key, limit, window, now=None):
+        """시도 한 번 기록 - 허용하면 0, 거절하면 기다릴 시간(초). 거절된 시도는 세지 않는다"""
+        now = time.time() if now is None else now
+        number = int(now // window)
+        with self._lock:
+            stored_number, current, previous = self._windows.get(key, (number, 0, 0))
+            if stored_number == number - 1:
+                current, previous = 0, current
+            elif stored_number != number:
+                current, previous = 0, 0
+            wait = sliding_window_wait(previous, current, limit, window, now - number * window)
+            if not wait:
+                current += 1
+            self._windows[key] = (number, current, previous)
+            self._windows.move_to_end(key)
+            while len(self._windows) > self.max_keys:
+                self._windows.popitem(last=False)
+        return wait
+
+    def clear(self):
+        with self._lock:
+            self._windows.clear()
+
+
+class CacheRateLimitBackend:
+    """Django 캐시(Redis, Memcached 등)에 윈도별 건수를 두는 공유 백엔드
+
+    여러 프로세스가 같은 한도를 나눠 쓴다. 조회와 증가 사이의 경합으로 한도를 조금 넘길 수 있다.
+    """
+    cache_alias = 'default'
+
+    def __init__(self):
+        self.cache = caches[self.cache_alias]
+
+    def hit(self, key, limit, window, now=None):
+        now = time.time() if now is None else now
+        number = int(now // window)
+        current_key, previous_key = f'ratelimit:{key}:{number}', f'ratelimit:{key}:{number - 1}'
+        counts = self.cache.get_many([current_key, previous_key])
+        wait = sliding_window_wait(
+            counts.get(previous_key, 0), counts.get(current_key, 0), limit, window, now - number * window
+        )
+        if not wait:
+            self.cache.add(current_key, 0, timeout=window * 2)
+            self.cache.incr(current_key)
+        return wait
+
+    def clear(self):
+        self.cache.clear()
+
+
+_lock = threading.Lock()
+_state = {'backend': None}
+
+
+def get_backend():
+    """프로세스 공용 백엔드 (settings.RATE_LIMIT_BACKEND)"""
+    with _lock:
+        if _state['backend'] is None:
+            _state['backend'] = import_string(settings.RATE_LIMIT_BACKEND)()
+        return _state['backend']
+
+
+def reset_backend():
+    with _lock:
+        _state['backend'] = None
+
+
+@receiver(setting_changed)
+def _backend_setting_changed(setting, **kwargs):
+    if setting == 'RATE_LIMIT_BACKEND':
+        reset_backend()
+
+
+class SlidingWindowThrottle(SimpleRateThrottle):
+    """settings.RATE_LIMITS[scope] ('횟수/기간', 기간은 s·m·h·d) 로 제한하는 DRF 스로틀
+
+    뷰 본문(시리얼라이저 검증, 비밀번호 해시, DB 조회)보다 먼저 실행되므로 거절된 시도는 비용이 거의 없다.
+    """
+
+    def get_rate(self):
+        return settings.RATE_LIMITS.get(self.scope)
+
+    def get_idents(self, request):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        self.retry_after = 0
+        if self.rate is None:
+            return True
+        backend = get_backend()
+        for ident in self.get_idents(request):
+            wait = backend.hit(f'{self.scope}:{ident}', self.num_requests, self.duration)
+            if wait:
+                self.retry_after = wait
+                return False
+        return True
+
+    def wait(self):
+        return self.retry_after
+
+
+class IPThrottle(SlidingWindowThrottle):
+    def get_idents(self, request):
+        ip = client_ip(request)
+        return [ip] if ip else []
+
+
+class EmailThrottle(SlidingWindowThrottle):
+    def get_idents(self, request):
+        email = request.data.get('email') if hasattr(request.data, 'get') else None
+        return [email.strip().lower()] if isinstance(email, str) and email.strip() else []
+
+
+class LoginIPThrottle(IPThrottle):
+    scope = 'login_ip'
+
+
+class LoginEmailThrottle(EmailThrottle):
+    scope = 'login_email'
+
+
+class SignupIPThrottle(IPThrottle):
+    scope = 'signup_ip'
+
+
+class AvailabilityIPThrottle(IPThrottle):
+    scope = 'availability_ip'
@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core import signing
+from django.utils.crypto import salted_hmac
+
+ACCESS = 'access'
+REFRESH = 'refresh'
+
+
+class TokenError(Exception):
+    """서명이 틀렸거나 만료된 토큰"""
+
+
+def auth_version(user):
+    """비밀번호·활성 상태가 바뀌거나 로그아웃하면 달라지는 값 - 토큰에 넣어 두고 검증해 기존 토큰을 무효화한다"""
+    return salted_hmac(
+        'users.tokens.version', f'{user.password}:{user.is_active}:{user.token_version}'
+    ).hexdigest()[:16]
+
+
+def issue_token(user, token_type=ACCESS):
+    """서명된 토큰 발급 (사용자 ID, 인증 버전, 발급시각 포함 - DB 에 저장하지 않음)"""
+    return signing.dumps(
+        {'uid': user.pk, 'ver': auth_version(user)}, salt=f'users.tokens.{token_type}', compress=True
+    )
+
+
+def issue_tokens(user):
+    return {ACCESS: issue_token(user, ACCESS), REFRESH: issue_token(user, REFRESH)}
+
+
+def read_token(token, token_type=ACCESS):
+    """토큰 서명과 만료 확인 (DB 조회 없음) → (사용자 ID, 인증 버전)"""
+    max_age = settings.AUTH_TOKEN[f'{token_type.upper()}_SECONDS']
+    try:
+        payload = signing.loads(token, salt=f'users.tokens.{token_type}', max_age=max_age)
+    except signing.SignatureExpired:
+        raise TokenError('만료된 토큰입니다.')
+    except signing.BadSignature:
+        raise TokenError('유효하지 않은 토큰입니다.')
+    try:
+        return int(payload['uid']), payload['ver']
+    except (KeyError, TypeError, ValueError):
+        raise TokenError('유효하지 않은 토큰입니다.')
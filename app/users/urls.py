@@ -1,11 +1,13 @@
 from django.urls import path
-from .views import RegisterView, LoginView, LogoutView, ProfileView
+from .views import AvailabilityView, RegisterView, LoginView, LogoutView, ProfileView, TokenRefreshView
 
 app_name = 'users'
 
 urlpatterns = [
     path('signup/', RegisterView.as_view(), name='signup'),
+    path('availability/', AvailabilityView.as_view(), name='availability'),
     path('login/', LoginView.as_view(), name='login'),
+    path('token/refresh/', TokenRefreshView.as_view(), name='token-refresh'),
     path('logout/', LogoutView.as_view(), name='logout'),
     path('profile/', ProfileView.as_view(), name='profile'),
 ]
\ No newline at end of file
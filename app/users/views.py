@@ -1,13 +1,23 @@
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.generics import CreateAPIView, RetrieveUpdateDestroyAPIView
+from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.contrib.auth import login, logout
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.db import transaction
+from django.db.models import F
+from .activity import record_login
+from .availability import availability_index
 from .models import CustomUser
-from .serializers import RegisterSerializer, LoginSerializer, LogoutSerializer, ProfileSerializer
+from .serializers import (
+    RegisterSerializer, LoginSerializer, LogoutSerializer, ProfileSerializer, TokenRefreshSerializer,
+)
+from .throttling import (
+    AvailabilityIPThrottle, LoginEmailThrottle, LoginIPThrottle, SignupIPThrottle, client_ip,
+)
+from .tokens import issue_tokens
 
 
 class RegisterView(CreateAPIView):
@@ -16,6 +26,7 @@ class RegisterView(CreateAPIView):
     queryset = CustomUser.objects.all()
     serializer_class = RegisterSerializer
     permission_classes = [AllowAny]
+    throttle_classes = [SignupIPThrottle]
 
     @method_decorator(csrf_exempt)
     def dispatch(self, *args, **kwargs):
@@ -38,11 +49,38 @@ class RegisterView(CreateAPIView):
             }, status=status.HTTP_201_CREATED)
 
 
+class AvailabilityView(APIView):
+    """이메일·닉네임 사용 가능 여부 (?email=...&nickname=...) - 대부분 DB 조회 없이 블룸 필터로 답한다"""
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    throttle_classes = [AvailabilityIPThrottle]
+
+    def get(self, request, *args, **kwargs):
+        values = {
+            'email': CustomUser.objects.normalize_email(request.query_params.get('email', '').strip()),
+            'nickname': request.query_params.get('nickname', '').strip(),
+        }
+        values = {field: value for field, value in values.items() if value}
+        if not values:
+            return Response({
+                'success': False,
+                'message': 'email 또는 nickname 을 입력해주세요.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            'success': True,
+            'message': '사용 가능 여부 조회 성공',
+            'data': {field: availability_index.is_available(field, value) for field, value in values.items()}
+        }, status=status.HTTP_200_OK)
+
+
 class LoginView(CreateAPIView):
     """로그인 뷰"""
 
     serializer_class = LoginSerializer
     permission_classes = [AllowAny]
+    throttle_classes = [LoginIPThrottle, LoginEmailThrottle]
 
     @method_decorator(csrf_exempt)
     def dispatch(self, *args, **kwargs):
@@ -53,12 +91,11 @@ class LoginView(CreateAPIView):
         serializer.is_valid(raise_exception=True)
 
         user = serializer.validated_data['user']
-        login(request, user)
-
-        # 로그인 정보 업데이트
-        user.login_count += 1
-        user.last_login_ip = self._get_client_ip(request)
-        user.save(update_fields=['login_count', 'last_login_ip'])
+        # 로그인 정보는 버퍼에 모았다가 한꺼번에 기록한다 (users.activity)
+        record_login(user, self._get_client_ip(request))
+        # 기본은 토큰만 발급하고, 세션이 필요한 클라이언트(브라우저)만 session=true 로 세션을 만든다
+        if str(request.data.get('session', '')).lower() in ('true', '1'):
+            login(request, user)
 
         return Response({
             'success': True,
@@ -67,19 +104,32 @@ class LoginView(CreateAPIView):
                 'user_id': user.id,
                 'username': user.username,
                 'nickname': user.nickname,
-                'email': user.email
+                'email': user.email,
+                **issue_tokens(user),
             }
         }, status=status.HTTP_200_OK)
 
     @staticmethod
     def _get_client_ip(request):
-        """클라이언트 IP 주소 가져오기 - 정적 메서드로 변경"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
+        """클라이언트 IP 주소 가져오기 - 스로틀과 같은 규칙 (throttling.client_ip)"""
+        return client_ip(request)
+
+
+class TokenRefreshView(CreateAPIView):
+    """리프레시 토큰으로 액세스·리프레시 토큰 재발급"""
+
+    serializer_class = TokenRefreshSerializer
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response({
+            'success': True,
+            'message': '토큰이 재발급되었습니다.',
+            'data': issue_tokens(serializer.validated_data['user'])
+        }, status=status.HTTP_200_OK)
 
 
 class LogoutView(CreateAPIView):
@@ -89,6 +139,11 @@ class LogoutView(CreateAPIView):
     permission_classes = [IsAuthenticated]
 
     def create(self, request, *args, **kwargs):
+        # 토큰은 서버에 저장하지 않으므로 토큰 버전을 올려 이 사용자의 액세스·리프레시 토큰을 모두 무효화한다
+        # (post_save 로 이 프로세스의 사용자 캐시도 비운다)
+        user = request.user
+        user.token_version = F('token_version') + 1
+        user.save(update_fields=['token_version'])
         logout(request)
         return Response({
             'success': True,
@@ -134,7 +189,7 @@ class ProfileView(RetrieveUpdateDestroyAPIView):
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         instance.is_active = False
-        instance.save()
+        instance.save(update_fields=['is_active', 'updated_at'])
         logout(request)
 
         return Response({
@@ -8,9 +8,17 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
 
 import os
+import sys
+from pathlib import Path
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# app 폴더를 Python path에 추가
+BASE_DIR = Path(__file__).resolve().parent.parent
+app_path = BASE_DIR / 'app'
+if str(app_path) not in sys.path:
+    sys.path.insert(0, str(app_path))
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.base')
 
 application = get_asgi_application()
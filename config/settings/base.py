@@ -52,6 +52,8 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'config.wsgi.application'
+# 알림 스트림(/api/notifications/stream/)은 ASGI 서버로 실행한다 (예: uvicorn config.asgi:application)
+ASGI_APPLICATION = 'config.asgi.application'
 
 DATABASES = {
     'default': {
@@ -77,6 +79,7 @@ AUTH_PASSWORD_VALIDATORS = [
 # Django REST Framework 설정
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
+        'users.authentication.AccessTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -94,4 +97,68 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # 미디어 파일 설정 (프로필 이미지용)
 MEDIA_URL = '/media/'
-MEDIA_ROOT = BASE_DIR / 'media'
\ No newline at end of file
+MEDIA_ROOT = BASE_DIR / 'media'
+# 프로세스 기동 예산 (profile_startup 명령과 기동 시간 테스트에서 사용)
+STARTUP_BUDGET = {
+    'seconds': float(os.getenv('STARTUP_BUDGET_SECONDS', '2.0')),
+    'rss_mb': float(os.getenv('STARTUP_BUDGET_RSS_MB', '120')),
+}
+
+# 거래 알림 방식 - 'each': 거래마다 알림, 'digest': 창(초) 안의 거래를 알림 하나로 묶어 갱신
+TRANSACTION_NOTIFICATION_MODE = os.getenv('TRANSACTION_NOTIFICATION_MODE', 'each')
+TRANSACTION_DIGEST_WINDOW_SECONDS = int(os.getenv('TRANSACTION_DIGEST_WINDOW_SECONDS', '600'))
+# 실시간 알림 브로커 - 여러 프로세스로 운영하면 'notification.broker.PostgresBroker'
+NOTIFICATION_BROKER = os.getenv('NOTIFICATION_BROKER', 'notification.broker.InProcessBroker')
+NOTIFICATION_STREAM_HEARTBEAT_SECONDS = int(os.getenv('NOTIFICATION_STREAM_HEARTBEAT_SECONDS', '15'))
+# /api/notifications/poll/ 이 새 알림을 기다리는 최대 시간(초)
+NOTIFICATION_LONG_POLL_SECONDS = float(os.getenv('NOTIFICATION_LONG_POLL_SECONDS', '25'))
+# 알림 보관 기간(일) - 알림유형별로 읽은/읽지 않은 알림을 따로 지정, None 이면 삭제하지 않음
+# ('default' 는 따로 지정하지 않은 유형에 적용, purge_notifications 명령이 적용)
+NOTIFICATION_RETENTION = {
+    'default': {'read_days': 30, 'unread_days': 90},
+    'transaction': {'read_days': 14, 'unread_days': 60},
+    'system': {'read_days': 90, 'unread_days': None},
+}
+# 처리가 끝난 알림 아웃박스 항목 보관 기간(일)
+NOTIFICATION_OUTBOX_RETENTION_DAYS = int(os.getenv('NOTIFICATION_OUTBOX_RETENTION_DAYS', '7'))
+# 서명 토큰 인증 (users.authentication.AccessTokenAuthentication)
+AUTH_TOKEN = {
+    'ACCESS_SECONDS': int(os.getenv('AUTH_ACCESS_TOKEN_SECONDS', '900')),
+    'REFRESH_SECONDS': int(os.getenv('AUTH_REFRESH_TOKEN_SECONDS', str(14 * 24 * 3600))),
+    # 최근 인증한 사용자 캐시 - 다른 프로세스의 비밀번호 변경·비활성화는 이 시간 안에 반영된다
+    'USER_CACHE_SIZE': 1024,
+    'USER_CACHE_SECONDS': 60,
+}
+# 로그인·회원가입·사용 여부 확인 시도 제한 ('횟수/기간', 기간은 s·m·h·d, None 이면 제한 없음) - users.throttling
+# 기본 백엔드는 프로세스마다 따로 세며, 여러 프로세스가 한도를 나눠 쓰려면
+# 'users.throttling.CacheRateLimitBackend' (공유 캐시 필요) 로 바꾼다
+# 앱 앞에 둔 리버스 프록시 수 - X-Forwarded-For 에서 오른쪽부터 이만큼 센 주소를 클라이언트 IP 로 쓴다
+# (0 이면 헤더를 무시하고 REMOTE_ADDR 사용, users.throttling.client_ip)
+TRUSTED_PROXY_COUNT = int(os.getenv('TRUSTED_PROXY_COUNT', '0'))
+RATE_LIMIT_BACKEND = os.getenv('RATE_LIMIT_BACKEND', 'users.throttling.InMemoryRateLimitBackend')
+RATE_LIMITS = {
+    'login_ip': os.getenv('RATE_LIMIT_LOGIN_IP', '30/m'),
+    'login_email': os.getenv('RATE_LIMIT_LOGIN_EMAIL', '10/m'),
+    'signup_ip': os.getenv('RATE_LIMIT_SIGNUP_IP', '10/h'),
+    'availability_ip': os.getenv('RATE_LIMIT_AVAILABILITY_IP', '60/m'),
+}
+# 이메일·닉네임 사용 여부 확인용 블룸 필터 (users.availability) - 오탐률, 다른 프로세스 가입 반영 주기(초),
+# 재생성을 요청 밖의 스레드에서 할지 여부
+USER_AVAILABILITY_INDEX = {
+    'ERROR_RATE': 0.01,
+    'REBUILD_SECONDS': 300,
+    'BACKGROUND_REBUILD': True,
+}
+# 프로필 이미지 변환본 (users.images, process_profile_images 명령) - {이름: (가로, 세로)} 로 가운데를 잘라 맞춘다
+# 형식은 'WEBP' 또는 'JPEG' (Pillow 에 WebP 지원이 없으면 JPEG), 원본 메타데이터(EXIF 등)는 저장하지 않는다
+PROFILE_IMAGE = {
+    'VARIANTS': {'thumb': (64, 64), 'small': (160, 160), 'medium': (480, 480)},
+    'FORMAT': os.getenv('PROFILE_IMAGE_FORMAT', 'WEBP'),
+    'QUALITY': 80,
+}
+# 로그인 활동(횟수·최종 IP·시각) 쓰기 지연 - 요청이 끝난 뒤 FLUSH_SECONDS 가 지났거나 MAX_PENDING 명이 모였으면
+# 한꺼번에 기록하고, 프로세스 종료 때도 기록한다 (users.activity)
+LOGIN_ACTIVITY = {
+    'FLUSH_SECONDS': float(os.getenv('LOGIN_ACTIVITY_FLUSH_SECONDS', '5')),
+    'MAX_PENDING': 1000,
+}
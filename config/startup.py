@@ -0,0 +1,88 @@
+"""Django 프로세스 기동(cold start) 비용 측정
+
+새 파이썬 프로세스에서 `python -X importtime` 으로 설정 로드 → django.setup() → URLconf
+(모든 앱의 views) import 까지 실행하고, 모듈별 import 시간과 기동 직후 RSS 를 수집한다.
+"""
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# 기동 시 import 되면 안 되는 분석용 무거운 의존성
+HEAVY_MODULES = ['matplotlib', 'pandas', 'numpy']
+
+# 시간을 따로 모아 보여줄 그룹 (모듈 이름 접두어)
+GROUPS = {
+    'settings': ['config.settings', 'dotenv'],
+    'users': ['users'],
+    'accounts': ['accounts'],
+    'analysis': ['analysis'],
+    'notification': ['notification'],
+    'django': ['django'],
+    'rest_framework': ['rest_framework'],
+}
+
+_CHILD = """
+import json, os, resource, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {app_path!r})
+import django
+django.setup()
+from django.conf import settings
+__import__(settings.ROOT_URLCONF)
+elapsed = time.perf_counter() - started
+rss = None
+try:
+    with open('/proc/self/status') as status:
+        rss = next(int(line.split()[1]) for line in status if line.startswith('VmRSS:')) / 1024
+except OSError:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+heavy = sorted(name for name in {heavy!r} if name in sys.modules)
+print(json.dumps({{'seconds': elapsed, 'rss_mb': rss, 'heavy_modules': heavy}}))
+"""
+
+
+def _group_of(module):
+    for group, prefixes in GROUPS.items():
+        if any(module == prefix or module.startswith(prefix + '.') for prefix in prefixes):
+            return group
+    return 'other'
+
+
+def parse_importtime(stderr):
+    """`-X importtime` 출력 → [(모듈, 자체시간(초), 누적시간(초))]"""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        modules.append((name.strip(), int(own) / 1e6, int(cumulative) / 1e6))
+    return modules
+
+
+def profile_startup(settings_module=None, top=15):
+    """새 프로세스의 기동 시간/RSS 와 그룹·모듈별 import 시간 측정"""
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module or os.environ.get(
+        'DJANGO_SETTINGS_MODULE', 'config.settings.base'
+    ))
+    code = _CHILD.format(app_path=str(BASE_DIR / 'app'), heavy=HEAVY_MODULES)
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    modules = parse_importtime(completed.stderr)
+    groups = defaultdict(float)
+    for name, own, _ in modules:
+        groups[_group_of(name)] += own
+    result['groups'] = {group: round(seconds, 4) for group, seconds in sorted(groups.items(), key=lambda item: -item[1])}
+    result['slowest_modules'] = [
+        {'module': name, 'self': round(own, 4), 'cumulative': round(cumulative, 4)}
+        for name, own, cumulative in sorted(modules, key=lambda item: -item[2])[:top]
+    ]
+    return result
@@ -34,6 +34,18 @@ export DJANGO_SETTINGS_MODULE=config.settings.dev
 uv run python manage.py makemigrations
 uv run python manage.py migrate
 
+# 백그라운드 워커 - 거래·예산 알림, 분석 요청, 프로필 이미지 변환은 워커가 처리한다
+# (서버와 다른 프로세스이므로 실시간 알림은 PostgreSQL LISTEN/NOTIFY 브로커로 전달)
+export NOTIFICATION_BROKER=${NOTIFICATION_BROKER:-notification.broker.PostgresBroker}
+echo "알림·분석·이미지 워커를 시작합니다"
+uv run python manage.py run_notification_worker &
+WORKER_PIDS=$!
+uv run python manage.py run_analysis_worker &
+WORKER_PIDS="$WORKER_PIDS $!"
+uv run python manage.py run_profile_image_worker &
+WORKER_PIDS="$WORKER_PIDS $!"
+trap 'kill $WORKER_PIDS 2>/dev/null' EXIT
+
 # 서버 실행
 echo "개발 서버를 시작합니다... (http://localhost:8000)"
 uv run python manage.py runserver 0.0.0.0:8000
\ No newline at end of file